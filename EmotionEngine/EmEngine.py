@@ -1,11 +1,15 @@
 import os
+import time
+import struct
 import yaml
+import random
 import pygame
 
 import importlib
 import importlib.util
 
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
 
 from EmotionEngine.entity.EmEntitiesManager import EmEntitiesManager
 from EmotionEngine.entity.EmEntitiesFactory import EmEntityFactory
@@ -13,14 +17,43 @@ from EmotionEngine.entity.EmEntity import EmEntity
 from EmotionEngine.entity.EmEntityHelper import EmEntityHelper
 from EmotionEngine.EmWindowManager import EmWindowManager
 from EmotionEngine.EmKeyboardManager import EmKeyboardManager
+from EmotionEngine.EmInputsManager import EmInputsManager
 from EmotionEngine.sound.EmSoundsManager import EmSoundsManager
 from EmotionEngine.text.EmFontsManager import EmFontsManager
+from EmotionEngine.image.EmImagesManager import EmImagesManager
+from EmotionEngine.tilemap.EmTilemapsManager import EmTilemapsManager
+from EmotionEngine.collisions.EmCollisionsManager import EmCollisionsManager
+from EmotionEngine.components.EmComponentsManager import EmComponentsManager
+from EmotionEngine.particles.EmParticlesManager import EmParticlesManager
+from EmotionEngine.behaviors.EmBehaviorsScheduler import EmBehaviorsScheduler
+from EmotionEngine.camera.EmCamera import EmCamera
+from EmotionEngine.camera.EmSpatialGrid import EmSpatialGrid
+from EmotionEngine.pipeline.EmDrawSnapshot import EmDrawSnapshot
+from EmotionEngine.pipeline.EmSimulationWorker import EmSimulationWorker
+from EmotionEngine.replay.EmReplayRecorder import EmReplayRecorder
+from EmotionEngine.replay.EmReplayPlayer import EmReplayPlayer
+from EmotionEngine.utils.EmGameClock import EmGameClock
+from EmotionEngine.profiling.EmMemoryProfiler import EmMemoryProfiler
+from EmotionEngine.capture.EmFrameCapture import EmFrameCapture
+from EmotionEngine.reload.EmFilesWatcher import EmFilesWatcher
+from EmotionEngine.network.EmNetSession import EmNetSession
+from EmotionEngine.log.EmLogger import EmLogger
+from EmotionEngine.log.EmLogsManager import EmLogsManager
+from EmotionEngine.metrics.EmMetricsRegistry import EmMetricsRegistry
+from EmotionEngine.metrics.EmMetricsExporter import EmMetricsExporter
+from EmotionEngine.hud.EmPerformanceHud import EmPerformanceHud
 
 # Initialize pygame and its subsystems
 pygame.init()
 pygame.mixer.init()
 pygame.font.init()
 
+# Target duration of a frame, in milliseconds (see step)
+FRAME_BUDGET_MS = 1000 / 60
+
+# World snapshot header: game time, pause state and frame number (see take_snapshot)
+ENGINE_SNAPSHOT_HEADER = struct.Struct("<dBI")
+
 
 class EmEngine:
     """
@@ -35,13 +68,37 @@ class EmEngine:
         window_width: int = 600,
         window_height: int = 600,
         game_title: str = "Emotion Engine Application",
+        headless: bool = False,
+        render_width: int = None,
+        render_height: int = None,
+        render_filter: str = "nearest",
+        log_level: str = "info",
     ) -> None:
 
+        # Leveled loggers of the engine subsystems, written by a background thread
+        self.__logs_manager = EmLogsManager(level=log_level)
+        self.__logger = self.__logs_manager.get_logger("engine")
+        self.__levels_logger = self.__logs_manager.get_logger("levels")
+        self.__entities_logger = self.__logs_manager.get_logger("entities")
+        self.__reload_logger = self.__logs_manager.get_logger("reload")
+
+        # Run without a visible window nor audio output (e.g. to replay sessions)
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+            pygame.display.quit()
+            pygame.display.init()
+            pygame.mixer.quit()
+            pygame.mixer.init()
+
         # Set directories for resources
         self.__entities_directory = os.path.join(working_directory, "entities")
         self.__levels_directory = os.path.join(working_directory, "levels")
         self.__sounds_directory = os.path.join(working_directory, "sounds")
         self.__fonts_directory = os.path.join(working_directory, "fonts")
+        self.__images_directory = os.path.join(working_directory, "images")
+        self.__cache_directory = os.path.join(working_directory, ".emcache")
 
         # Initialize pygame clock for managing frame rates
         self.__clock = pygame.time.Clock()
@@ -50,6 +107,53 @@ class EmEngine:
         # Is game paused ?
         self.__paused = False
 
+        # Number of simulated frames since the game started
+        self.__frame_number = 0
+
+        # Networked session (see start_netplay)
+        self.__net_session: EmNetSession = None
+
+        # Input recording / replaying (see start_recording and start_replay)
+        self.__replay_recorder: EmReplayRecorder = None
+        self.__replay_player: EmReplayPlayer = None
+        self.__recording_path: str = None
+
+        # Simulation of the next frame on a worker thread (see enable_pipelining)
+        self.__simulation_worker: EmSimulationWorker = None
+
+        # Frames capture (see start_capture)
+        self.__frame_capture: EmFrameCapture = None
+
+        # Runtime metrics, and their export (see start_metrics_export)
+        self.__metrics = EmMetricsRegistry()
+        self.__metrics_exporter: EmMetricsExporter = None
+        self.__metrics_interval_ms = 0
+        self.__last_metrics_export = 0.0
+        self.__last_frame_started_at: float = None
+        self.__last_tick_ms: float = None
+        self.__metrics_classes_names: Set[str] = set()
+
+        # Performance overlay, toggled with its hotkey (see get_performance_hud)
+        self.__performance_hud = EmPerformanceHud(frame_budget_ms=FRAME_BUDGET_MS)
+
+        # Loaded levels entities data, by level path (see enable_hot_reload)
+        self.__levels_entities_data: Dict[str, Dict[str, dict]] = {}
+        self.__levels_tilemaps_data: Dict[str, Dict[str, dict]] = {}
+        self.__files_watcher: EmFilesWatcher = None
+        self.__hot_reload_interval_ms = 0
+        self.__last_hot_reload_poll = 0.0
+
+        self.__next_entity_id = 0
+
+        # Entities indexed by their positioned bounding box, to cull the draws, the
+        # entities moved since the last cull and those with an empty bounding box
+        self.__spatial_grid = EmSpatialGrid()
+        self.__moved_entities: Dict[int, EmEntity] = {}
+        self.__unbounded_entities: Dict[int, EmEntity] = {}
+
+        # Entities seen in the last drawn frame, and those spawned since
+        self.__visible_entities_ids: Set[int] = set()
+
         # Initialize various managers
         self.__entities_factory = EmEntityFactory()
         self.__entities_manager = EmEntitiesManager()
@@ -58,10 +162,36 @@ class EmEngine:
             height=window_height,
             title="Emotion Engine Application",
             engine_ref=self,
+            render_width=render_width,
+            render_height=render_height,
+            scale_filter=render_filter,
         )
         self.__keyboard_manager = EmKeyboardManager()
+        self.__inputs_manager = EmInputsManager(self.__keyboard_manager)
         self.__sounds_manager = EmSoundsManager(engine_ref=self)
         self.__fonts_manager = EmFontsManager(engine_ref=self)
+        self.__images_manager = EmImagesManager(engine_ref=self)
+        self.__tilemaps_manager = EmTilemapsManager(
+            engine_ref=self, images_manager=self.__images_manager
+        )
+        self.__collisions_manager = EmCollisionsManager()
+        self.__components_manager = EmComponentsManager()
+        self.__particles_manager = EmParticlesManager()
+        self.__behaviors_scheduler = EmBehaviorsScheduler()
+        self.__camera = EmCamera(
+            viewport=pygame.Rect(
+                0,
+                0,
+                self.__window_manager.get_width(),
+                self.__window_manager.get_height(),
+            )
+        )
+        self.__memory_profiler = EmMemoryProfiler(
+            engine_ref=self,
+            entities_manager=self.__entities_manager,
+            sounds_manager=self.__sounds_manager,
+            images_manager=self.__images_manager,
+        )
 
         # Set game title
         self.__window_manager.set_title(game_title)
@@ -82,9 +212,39 @@ class EmEngine:
         """Returns the directory where font files are located."""
         return self.__fonts_directory
 
+    def get_images_directory(self) -> str:
+        """Returns the directory where image files are located."""
+        return self.__images_directory
+
+    def get_cache_directory(self) -> str:
+        """Returns the directory where the engine caches preprocessed assets."""
+        return self.__cache_directory
+
     def log(self, *text: str):
-        """Logs messages to the console prefixed with '[EmotionEngine]'."""
-        print("[EmotionEngine]", *text)
+        """Logs messages at the info level of the "engine" logger."""
+        # The parts are joined by the logger, only if the message is written
+        self.__logger.info(" ".join(("%s",) * len(text)), *text)
+
+    def get_logger(self, name: str) -> EmLogger:
+        """
+        Returns the logger of a subsystem, e.g. "levels" or "network".
+
+        Args:
+            name (str): The name of the subsystem.
+
+        Returns:
+            EmLogger: The logger, created on the first call.
+        """
+        return self.__logs_manager.get_logger(name)
+
+    def get_logs_manager(self) -> EmLogsManager:
+        """
+        Returns the logs manager, to set the loggers levels or read statistics.
+
+        Returns:
+            EmLogsManager: The logs manager.
+        """
+        return self.__logs_manager
 
     def is_game_paused(self) -> bool:
         """
@@ -106,45 +266,842 @@ class EmEngine:
         self.__paused = new_paused
         self.__window_manager.update_title()
 
+    def get_window_manager(self) -> EmWindowManager:
+        """
+        Returns the engine's window manager.
+
+        Returns:
+            EmWindowManager: The window manager, owning the screen surface.
+        """
+        return self.__window_manager
+
+    def get_camera(self) -> EmCamera:
+        """
+        Returns the engine's camera.
+
+        Returns:
+            EmCamera: The camera, covering the whole screen surface by default.
+        """
+        return self.__camera
+
+    def get_memory_profiler(self) -> EmMemoryProfiler:
+        """
+        Returns the engine's memory profiler.
+
+        Returns:
+            EmMemoryProfiler: The memory profiler, disabled by default.
+        """
+        return self.__memory_profiler
+
+    def get_metrics(self) -> EmMetricsRegistry:
+        """
+        Returns the engine's runtime metrics: frame, tick, draw and flip times and
+        counts, dropped frames, entities counts by class and cache hit rates.
+
+        Returns:
+            EmMetricsRegistry: The metrics registry, also open to the game's metrics.
+        """
+        return self.__metrics
+
+    def get_performance_hud(self) -> EmPerformanceHud:
+        """
+        Returns the performance overlay, toggled with F3 by default.
+
+        Returns:
+            EmPerformanceHud: The performance overlay.
+        """
+        return self.__performance_hud
+
+    def get_frame_number(self) -> int:
+        """
+        Returns the number of frames simulated since the game started.
+
+        Returns:
+            int: The number of the next frame to simulate.
+        """
+        return self.__frame_number
+
+    def get_net_session(self) -> EmNetSession:
+        """
+        Returns the networked session started by `start_netplay`.
+
+        Returns:
+            EmNetSession: The session, or None if the game is not networked.
+        """
+        return self.__net_session
+
+    def take_snapshot(self, position_step: float = 0) -> bytes:
+        """
+        Saves the world state: the game time, the pause state, the frame number and
+        the state of every entity (see `EmEntitiesManager.take_snapshot`).
+
+        Args:
+            position_step (float): If not 0, positions are rounded to a multiple of
+                                   this step. Default is 0.
+
+        Returns:
+            bytes: The snapshot, to be passed to `restore_snapshot`.
+        """
+        return ENGINE_SNAPSHOT_HEADER.pack(
+            EmGameClock.get_milli_time(), self.__paused, self.__frame_number
+        ) + self.__entities_manager.take_snapshot(position_step)
+
+    def restore_snapshot(self, snapshot: bytes):
+        """
+        Restores a world state saved by `take_snapshot`, in place, without spawning
+        the entities again or calling their `on_begin_play`. The collision contacts
+        are recomputed from the restored positions, without callbacks.
+
+        Args:
+            snapshot (bytes): The snapshot to restore.
+
+        Raises:
+            ValueError: If an entity of the snapshot no longer exists. Nothing is
+                        restored then.
+        """
+        milli_time, paused, frame_number = ENGINE_SNAPSHOT_HEADER.unpack_from(
+            snapshot, 0
+        )
+
+        self.__entities_manager.restore_snapshot(
+            memoryview(snapshot)[ENGINE_SNAPSHOT_HEADER.size :]
+        )
+        self.__collisions_manager.reset_contacts(
+            self.__entities_manager.get_all_instanciated_entities()
+        )
+
+        EmGameClock.set_milli_time(milli_time)
+        self.__paused = bool(paused)
+        self.__frame_number = frame_number
+
+    def start_netplay(
+        self,
+        local_player: int,
+        local_port: int,
+        remote_address: Tuple[str, int],
+        input_keys: List[int],
+        seed: int = 0,
+        input_delay: int = 2,
+        max_prediction: int = 8,
+    ):
+        """
+        Starts a two-player networked game over UDP. Must be called before the game
+        starts, with the same seed, input keys and level on both peers.
+
+        During a networked game, the players' inputs are read from the inputs manager
+        (see `EmInputsManager.is_player_key_pressed`), frames have a fixed duration
+        and the game cannot be paused.
+
+        Args:
+            local_player (int): The index of the local player, 0 or 1.
+            local_port (int): The UDP port to listen on.
+            remote_address (Tuple[str, int]): The host and UDP port of the remote peer.
+            input_keys (List[int]): The keys making up a player's input.
+            seed (int): The seed of the random generator. Default is 0.
+            input_delay (int): The number of frames local inputs are delayed by.
+                               Default is 2.
+            max_prediction (int): The maximum number of frames simulated ahead of the
+                                  remote peer. Default is 8.
+        """
+        self.__inputs_manager.set_input_keys(input_keys)
+        self.__inputs_manager.set_players_count(2)
+
+        self.__net_session = EmNetSession(
+            engine_ref=self,
+            inputs_manager=self.__inputs_manager,
+            channels_manager=self.__sounds_manager.retrieve_channels_manager(),
+            local_player=local_player,
+            local_port=local_port,
+            remote_address=remote_address,
+            input_delay=input_delay,
+            max_prediction=max_prediction,
+        )
+
+        random.seed(seed)
+        self.get_logger("network").info(
+            "Netplay started as player %d on port %d", local_player, local_port
+        )
+
+    def start_recording(self, replay_path: str):
+        """
+        Records the next main loop session to a replay file.
+
+        The per-frame delta times, input events and the random seed are recorded,
+        so the session can be reproduced exactly with `start_replay`.
+
+        Args:
+            replay_path (str): The path of the replay file to write.
+        """
+        self.__recording_path = replay_path
+
+    def start_replay(self, replay_path: str):
+        """
+        Replays a recorded session in the next main loop instead of live inputs.
+
+        The recorded delta times are used instead of the frame rate limiter, so the
+        session runs as fast as possible, and the loop stops with the last frame.
+
+        Args:
+            replay_path (str): The path of the replay file to play.
+        """
+        self.__replay_player = EmReplayPlayer(replay_path)
+
+    def start_capture(
+        self,
+        output_path: str,
+        capture_format: str = "png",
+        queue_size: int = 8,
+        frame_step: Optional[int] = None,
+    ):
+        """
+        Starts capturing the presented frames to disk, on a background thread.
+
+        Frames are dropped rather than slowing the game down when encoding falls
+        behind. See `EmFrameCapture` for the supported formats.
+
+        Args:
+            output_path (str): The output directory ("png") or file ("gif", "raw").
+            capture_format (str): One of "png", "gif" or "raw". Default is "png".
+            queue_size (int): The number of frames that can wait to be encoded.
+                              Default is 8.
+            frame_step (Optional[int]): Capture one frame every `frame_step` frames.
+                                        Default is None (every frame, or every other
+                                        frame for GIFs at 60 FPS, see `EmFrameCapture`).
+        """
+        self.stop_capture()
+
+        self.__frame_capture = EmFrameCapture(
+            output_path,
+            self.__window_manager.get_display_size(),
+            capture_format=capture_format,
+            queue_size=queue_size,
+            frame_step=frame_step,
+        )
+
+    def stop_capture(self):
+        """
+        Stops the frames capture, if any, once the queued frames are encoded.
+        """
+        if self.__frame_capture is None:
+            return
+
+        self.__frame_capture.close()
+
+        stats = self.__frame_capture.get_stats()
+        self.get_logger("capture").info(
+            "Captured %d frames (%d dropped, %.1f ms average encoding lag)",
+            stats["encoded"],
+            stats["dropped"],
+            stats["average_lag_ms"],
+        )
+
+        self.__frame_capture = None
+
+    def start_metrics_export(
+        self,
+        target: str,
+        interval_ms: float = 1000,
+        prefix: str = "emotion",
+        max_bytes: int = 1024 * 1024,
+        backups_count: int = 3,
+    ):
+        """
+        Starts exporting the runtime metrics every interval, on a background thread.
+        See `EmMetricsExporter` for the supported targets.
+
+        Args:
+            target (str): A file path (rotated JSON lines), or "udp://host:port"
+                          (statsd lines).
+            interval_ms (float): The delay between two exports. Default is 1000.
+            prefix (str): The prefix of the statsd metrics names. Default is "emotion".
+            max_bytes (int): The size a file is rotated at. Default is 1 MiB.
+            backups_count (int): The number of rotated files kept. Default is 3.
+        """
+        self.stop_metrics_export()
+
+        self.__metrics_exporter = EmMetricsExporter(
+            target,
+            prefix=prefix,
+            max_bytes=max_bytes,
+            backups_count=backups_count,
+        )
+        self.__metrics_interval_ms = interval_ms
+        self.__last_metrics_export = time.perf_counter()
+
+    def stop_metrics_export(self):
+        """
+        Exports the metrics a last time and stops their export, if any.
+        """
+        if self.__metrics_exporter is None:
+            return
+
+        self.__metrics_exporter.submit(self.__collect_metrics())
+        self.__metrics_exporter.close()
+
+        stats = self.__metrics_exporter.get_stats()
+        self.get_logger("metrics").info(
+            "Exported metrics %d times (%d dropped, %d errors)",
+            stats["exported"],
+            stats["dropped"],
+            stats["errors"],
+        )
+
+        self.__metrics_exporter = None
+
+    def enable_hot_reload(self, poll_interval_ms: float = 250):
+        """
+        Watches the entities modules and the loaded levels, and applies their changes
+        while the game is running.
+
+        A changed module is executed again and its classes registered again; live
+        entities of the replaced classes are switched to the new classes, keeping
+        their state. A changed level is diffed against its previous version: only
+        the added, removed or modified entities are despawned or spawned.
+
+        Args:
+            poll_interval_ms (float): The delay between two checks of the files
+                                      modification times. Default is 250.
+        """
+        self.__files_watcher = EmFilesWatcher()
+        self.__files_watcher.watch_directory(self.__entities_directory, ".py")
+
+        for level_path in self.__levels_entities_data:
+            self.__files_watcher.watch_file(level_path)
+
+        self.__hot_reload_interval_ms = poll_interval_ms
+
+    def enable_pipelining(self):
+        """
+        Simulates each frame on a worker thread while the main thread draws the
+        previous one, from a snapshot taken at the end of its simulation.
+
+        Frame time becomes the longest of the simulation and drawing times rather
+        than their sum, for one more frame of display latency. The drawn entities
+        are copies (see `EmEntity.create_draw_copy`), so `on_draw` must not change
+        the game state, and `on_tick` must not draw nor call pygame display functions.
+        Events are still processed on the main thread, between two simulations.
+        """
+        if self.__simulation_worker is not None:
+            return
+
+        self.__simulation_worker = EmSimulationWorker()
+
+        self.__logger.info(
+            "Pipelining enabled%s",
+            " (free-threaded)" if EmSimulationWorker.is_free_threaded() else "",
+        )
+
+    def get_simulation_worker(self) -> EmSimulationWorker:
+        """
+        Returns the worker simulating the frames when pipelining is enabled.
+
+        Returns:
+            EmSimulationWorker: The worker, or None if pipelining is not enabled.
+        """
+        return self.__simulation_worker
+
     def initialize(self):
         """Initializes the engine."""
         self.__execute_entities_modules()
 
     def main_loop(self):
         """Starts the main game loop, processing events and updating entities."""
+        self.begin_play()
+
+        # Close the replay, capture and export files even if a frame raises
+        try:
+            while self.step():
+                pass
+
+        finally:
+            self.end_play()
+
+    def begin_play(self):
+        """
+        Starts the game: prepares the session and calls `on_begin_play` on all
+        instantiated entities. Called by `main_loop`, or before driving the game
+        frame by frame with `step`.
+        """
         self.__running = True
+        self.__frame_number = 0
+
+        EmGameClock.reset()
+        self.__start_replay_session()
 
         # Call on_begin_play for all instantiated entities
         for entity in self.__entities_manager.get_all_instanciated_entities():
             entity.on_begin_play()
 
-        while self.__running:
-            dt = self.__clock.tick(60)
+    def step(self, dt: float = None) -> bool:
+        """
+        Runs a single frame of the game: processes events, updates and draws entities.
+
+        Args:
+            dt (float): The time delta of the frame in milliseconds. Default is None
+                        (the frame rate limiter, or the replay, provides it).
+
+        Returns:
+            bool: True if the game keeps running, False once it was quit.
+        """
+        if not self.__running:
+            return False
+
+        frame_started_at = time.perf_counter()
+        frame_ms: float = None
+
+        if self.__last_frame_started_at is not None:
+            frame_ms = (frame_started_at - self.__last_frame_started_at) * 1000
+            self.__metrics.observe("frame_ms", frame_ms)
+
+            # The frame missed at least one display refresh
+            if frame_ms > FRAME_BUDGET_MS * 1.5:
+                self.__metrics.increment("dropped_frames")
+
+        self.__last_frame_started_at = frame_started_at
+
+        # The frame simulated during the previous step, to draw during this one
+        draw_snapshot: EmDrawSnapshot = None
+
+        if self.__simulation_worker is not None:
+            draw_snapshot = self.__simulation_worker.wait()
+
+            if draw_snapshot is not None:
+                self.__record_tick_metrics()
 
-            # Handle window events (pygame events)
-            self.__process_window_events()
+        if self.__files_watcher is not None:
+            self.__poll_hot_reload()
 
-            instanciated_entities: List[EmEntity] = (
-                self.__entities_manager.get_all_instanciated_entities()
+        if self.__replay_player is not None:
+            frame = self.__replay_player.next_frame()
+
+            if frame is None:
+                self.__running = False
+                return False
+
+            dt, events = frame
+            pygame.event.pump()
+
+        else:
+            if dt is None:
+                dt = self.__clock.tick(60)
+
+            events = pygame.event.get()
+
+        if self.__replay_recorder is not None:
+            self.__replay_recorder.record_frame(dt, events)
+
+        # Handle window events (pygame events)
+        self.__process_window_events(events)
+
+        if self.__simulation_worker is not None:
+            # The first frame draws the world as it is before being simulated
+            if draw_snapshot is None:
+                draw_snapshot = self.__capture_draw_snapshot()
+
+            self.__simulation_worker.submit(lambda: self.__simulate_frame(dt))
+
+        else:
+            draw_snapshot = self.__simulate_frame(dt)
+            self.__record_tick_metrics()
+
+        draw_started_at = time.perf_counter()
+        self.__draw_frame(draw_snapshot)
+
+        flip_started_at = time.perf_counter()
+        self.__present()
+
+        flip_ended_at = time.perf_counter()
+        self.__metrics.observe("draw_ms", (flip_started_at - draw_started_at) * 1000)
+        self.__metrics.observe("flip_ms", (flip_ended_at - flip_started_at) * 1000)
+        self.__metrics.increment("draws")
+        self.__metrics.increment("flips")
+
+        if self.__performance_hud.is_visible() and frame_ms is not None:
+            self.__performance_hud.record_frame(
+                frame_ms,
+                self.__last_tick_ms or 0.0,
+                (flip_started_at - draw_started_at) * 1000,
+                (flip_ended_at - flip_started_at) * 1000,
+            )
+
+        if self.__frame_capture is not None:
+            self.__frame_capture.capture_frame(
+                self.__window_manager.get_display_surface()
             )
 
-            # Update all entities that are not frozen (and if the game is not paused)
-            if self.is_game_paused():
-                self.__window_manager.fill_screen((25, 25, 25))
+        self.__memory_profiler.on_frame_end()
 
-            else:
-                self.__window_manager.fill_screen((0, 0, 0))
-                for entity in instanciated_entities:
-                    if not entity.is_frozen():
-                        entity.on_tick(dt)
+        if (
+            self.__metrics_exporter is not None
+            and (flip_ended_at - self.__last_metrics_export) * 1000
+            >= self.__metrics_interval_ms
+        ):
+            self.__last_metrics_export = flip_ended_at
+            self.__metrics_exporter.submit(self.__collect_metrics())
 
-            current_surface = self.__window_manager.get_screen_surface()
+        return self.__running
 
-            # Draw all entities on the current surface
-            for entity in instanciated_entities:
+    def end_play(self):
+        """
+        Ends the game session started by `begin_play`: closes the replay being
+        recorded, the capture and the metrics export. When driving the game with
+        `step`, call it in a `finally` block so the files are complete even if a
+        frame raises.
+        """
+        self.__running = False
+
+        if self.__simulation_worker is not None:
+            self.__simulation_worker.close()
+            self.__simulation_worker = None
+
+        self.__stop_replay_session()
+        self.stop_capture()
+        self.stop_metrics_export()
+
+        if self.__net_session is not None:
+            self.__net_session.close()
+            self.__net_session = None
+
+        self.__logs_manager.flush()
+
+    def __simulate_frame(self, dt: float) -> EmDrawSnapshot:
+        """
+        Updates the game for a frame, unless it is paused, and captures what to draw.
+        Runs on the worker thread when pipelining is enabled.
+
+        Args:
+            dt (float): The time delta of the frame in milliseconds.
+
+        Returns:
+            EmDrawSnapshot: The frame to draw.
+        """
+        started_at = time.perf_counter()
+
+        if self.is_game_paused():
+            EmGameClock.advance(dt)
+
+        elif self.__net_session is not None:
+            # The session simulates the frame, and rolls back first if needed
+            self.__net_session.advance_frame(self.__simulate)
+
+        else:
+            self.__inputs_manager.set_player_input(
+                0, self.__inputs_manager.capture_local_input()
+            )
+            self.__simulate(dt)
+
+        # Particles are visual only, so they are not simulated again on rollbacks
+        if not self.is_game_paused():
+            self.__particles_manager.update(dt)
+
+        draw_snapshot = self.__capture_draw_snapshot()
+
+        # Recorded by the main thread (see __record_tick_metrics)
+        self.__last_tick_ms = (time.perf_counter() - started_at) * 1000
+
+        return draw_snapshot
+
+    def __record_tick_metrics(self):
+        """
+        Records the duration of the last simulated frame in the metrics.
+        """
+        self.__metrics.observe("tick_ms", self.__last_tick_ms)
+        self.__metrics.increment("ticks")
+
+    def __collect_metrics(self) -> Dict[str, object]:
+        """
+        Updates the gauges of the entities counts and of the caches hit rates, then
+        collects the metrics to export them.
+
+        Returns:
+            Dict[str, object]: The collected metrics (see `EmMetricsRegistry.collect`).
+        """
+        entities = self.__entities_manager.get_all_instanciated_entities()
+        classes_counts = Counter(type(entity).__name__ for entity in entities)
+
+        # Classes without entities left are reported at 0
+        for class_name in self.__metrics_classes_names - classes_counts.keys():
+            self.__metrics.set_gauge(f"entities.{class_name}", 0)
+
+        for class_name, count in classes_counts.items():
+            self.__metrics.set_gauge(f"entities.{class_name}", count)
+
+        self.__metrics_classes_names.update(classes_counts)
+
+        self.__metrics.set_gauge("entities.total", len(entities))
+        self.__metrics.set_gauge(
+            "entities.frozen", sum(1 for entity in entities if entity.is_frozen())
+        )
+
+        sound_cache = self.__sounds_manager.retrieve_sound_cache()
+
+        for cache_name, hits, misses in (
+            (
+                "images",
+                self.__images_manager.get_hits(),
+                self.__images_manager.get_misses(),
+            ),
+            ("sounds", sound_cache.get_hits(), sound_cache.get_misses()),
+        ):
+            self.__metrics.set_gauge(f"cache.{cache_name}.hits", hits)
+            self.__metrics.set_gauge(f"cache.{cache_name}.misses", misses)
+            self.__metrics.set_gauge(
+                f"cache.{cache_name}.hit_rate", hits / max(hits + misses, 1)
+            )
+
+        if self.__frame_capture is not None:
+            self.__metrics.set_gauge(
+                "capture.dropped_frames", self.__frame_capture.get_stats()["dropped"]
+            )
+
+        self.__metrics.set_gauge(
+            "logs.dropped", self.__logs_manager.get_stats()["dropped"]
+        )
+
+        return self.__metrics.collect()
+
+    def __capture_draw_snapshot(self) -> EmDrawSnapshot:
+        """
+        Captures the entities seen by the camera and the draw systems' arguments.
+        When pipelining, the entities and the camera are copied, so the frame can be
+        drawn while the next one is simulated.
+
+        Returns:
+            EmDrawSnapshot: The frame to draw.
+        """
+        entities = self.__cull_entities()
+        camera = self.__camera
+        pipelined = self.__simulation_worker is not None
+
+        if pipelined:
+            camera = EmCamera(
+                viewport=camera.get_viewport(),
+                position=camera.get_position(),
+                zoom=camera.get_zoom(),
+            )
+
+            # Helpers hold no entity state: the draw copies share one
+            draw_helper = self.__create_helper(camera)
+            draw_copies = []
+
+            for entity in entities:
+                draw_copy = entity.create_draw_copy()
+                draw_copy.set_helper(draw_helper)
+                draw_copies.append(draw_copy)
+
+            entities = draw_copies
+
+        draw_batches = self.__components_manager.capture_draw_batches(
+            {entity.get_entity_id(): entity for entity in entities}
+        )
+
+        return EmDrawSnapshot(
+            paused=self.is_game_paused(),
+            camera=camera,
+            entities=tuple(entities),
+            draw_batches=draw_batches,
+            tilemaps_batches=self.__tilemaps_manager.capture_draw_batches(),
+            particles_batches=self.__particles_manager.capture_draw_batches(
+                copy=pipelined
+            ),
+        )
+
+    def __draw_frame(self, draw_snapshot: EmDrawSnapshot):
+        """
+        Draws a captured frame on the screen surface: the tilemaps, the entities, the
+        draw systems and the particles, through the frame's camera.
+
+        Args:
+            draw_snapshot (EmDrawSnapshot): The frame to draw.
+        """
+        self.__window_manager.fill_screen(
+            (25, 25, 25) if draw_snapshot.paused else (0, 0, 0)
+        )
+
+        camera = draw_snapshot.camera
+        current_surface = self.__window_manager.get_screen_surface()
+        current_surface.set_clip(camera.get_viewport())
+
+        # Tilemaps are drawn below the entities
+        EmTilemapsManager.run_draw_batches(
+            current_surface,
+            draw_snapshot.tilemaps_batches,
+            camera.get_draw_offset(),
+            camera.get_zoom(),
+        )
+
+        performance_hud = self.__performance_hud
+
+        if performance_hud.is_visible():
+            for entity in draw_snapshot.entities:
+                draw_started_at = time.perf_counter()
                 entity.on_draw(current_surface)
+                performance_hud.add_entity_cost(
+                    entity, (time.perf_counter() - draw_started_at) * 1000
+                )
+
+        else:
+            for entity in draw_snapshot.entities:
+                entity.on_draw(current_surface)
+
+        EmComponentsManager.run_draw_batches(
+            current_surface,
+            draw_snapshot.draw_batches,
+            camera.get_draw_offset(),
+            camera.get_zoom(),
+        )
+        EmParticlesManager.run_draw_batches(
+            current_surface, camera, draw_snapshot.particles_batches
+        )
+
+        current_surface.set_clip(None)
+
+    def __present(self):
+        """
+        Presents the drawn frame. The performance overlay is drawn on the window
+        right before the flip and erased right after, keeping it out of the frames
+        read by the frame capture and observers.
+        """
+        window_manager = self.__window_manager
+        performance_hud = self.__performance_hud
+
+        if not performance_hud.is_visible():
+            window_manager.present()
+            return
+
+        display_surface = window_manager.get_display_surface()
+
+        window_manager.compose()
+        performance_hud.draw(
+            display_surface, self.__entities_manager.get_all_instanciated_entities()
+        )
+        window_manager.flip()
+        performance_hud.erase(display_surface)
+
+    def __simulate(self, dt: float):
+        """
+        Simulates a frame: updates the entities that are not frozen, resumes their
+        behaviors, runs the tick systems and the collision pass, and advances the game
+        time and frame number.
+
+        Args:
+            dt (float): The time delta of the frame in milliseconds.
+        """
+        EmGameClock.advance(dt)
+
+        # Behaviors awaiting the next frame from on_tick are resumed on the next one
+        self.__behaviors_scheduler.begin_frame()
+
+        instanciated_entities: List[EmEntity] = (
+            self.__entities_manager.get_all_instanciated_entities()
+        )
+
+        visible_entities_ids = self.__visible_entities_ids
+
+        # Entities are only timed while the performance overlay shows the costliest
+        performance_hud = (
+            self.__performance_hud if self.__performance_hud.is_visible() else None
+        )
+
+        for entity in instanciated_entities:
+            if entity.is_frozen():
+                continue
+
+            if (
+                not entity.is_ticked_offscreen()
+                and entity.get_entity_id() not in visible_entities_ids
+            ):
+                continue
+
+            if performance_hud is None:
+                entity.on_tick(dt)
+                continue
+
+            tick_started_at = time.perf_counter()
+            entity.on_tick(dt)
+            performance_hud.add_entity_cost(
+                entity, (time.perf_counter() - tick_started_at) * 1000
+            )
+
+        # Behaviors waiting for this frame, or whose sleep is over, go on
+        self.__behaviors_scheduler.run_frame(dt)
+
+        # Batched systems run once for all the entities having their components
+        self.__components_manager.run_systems("tick", dt)
+
+        # Run a single collision pass once every entity has moved
+        self.__collisions_manager.process_collisions(instanciated_entities)
+        self.__behaviors_scheduler.on_collisions_entered(
+            self.__collisions_manager.get_entered_contacts()
+        )
+
+        self.__frame_number += 1
+
+    def __cull_entities(self) -> List[EmEntity]:
+        """
+        Indexes again the entities moved since the last cull, and returns the
+        entities seen by the camera, in drawing order. Entities with an empty
+        bounding box are never culled.
+
+        Returns:
+            List[EmEntity]: The entities to draw.
+        """
+        spatial_grid = self.__spatial_grid
+        unbounded_entities = self.__unbounded_entities
+
+        moved_entities = self.__moved_entities
+        self.__moved_entities = {}
+
+        for entity_id, entity in moved_entities.items():
+            box = entity.get_positioned_bounding_box()
+
+            if box.left == box.right and box.bottom == box.top:
+                spatial_grid.remove(entity)
+                unbounded_entities[entity_id] = entity
+            else:
+                unbounded_entities.pop(entity_id, None)
+                spatial_grid.update(entity)
+
+        view_bounds = self.__camera.get_view_bounds()
+        visible = dict(unbounded_entities)
+
+        for entity_id, entity in spatial_grid.query(view_bounds).items():
+            if view_bounds.intersects(entity.get_positioned_bounding_box()):
+                visible[entity_id] = entity
+
+        self.__visible_entities_ids = set(visible)
 
-            pygame.display.flip()
+        # Entity IDs are given in spawning order, which is the drawing order
+        return [visible[entity_id] for entity_id in sorted(visible)]
+
+    def __start_replay_session(self):
+        """
+        Seeds the random generator before a recorded or replayed session.
+        """
+        if self.__replay_player is not None:
+            seed = self.__replay_player.get_seed()
+
+        elif self.__recording_path is not None:
+            seed = random.SystemRandom().getrandbits(64)
+            self.__replay_recorder = EmReplayRecorder(self.__recording_path, seed)
+
+        else:
+            return
+
+        random.seed(seed)
+
+    def __stop_replay_session(self):
+        """
+        Closes the replay file being recorded, if any.
+        """
+        if self.__replay_recorder is not None:
+            self.__logger.info(
+                "Recorded %d frames to '%s'",
+                self.__replay_recorder.get_frames_count(),
+                self.__recording_path,
+            )
+            self.__replay_recorder.close()
+            self.__replay_recorder = None
 
     def load_level(self, level_name: str):
         """Loads a level by name and spawns its entities based on the level file.
@@ -152,21 +1109,66 @@ class EmEngine:
         Args:
             level_name (str): the level name relative to the game's directory
         """
-        self.log(f"Loading level : {level_name}")
+        self.__levels_logger.info("Loading level : %s", level_name)
+        started_at = time.perf_counter()
 
         full_level_path = os.path.join(self.__levels_directory, level_name)
+        level_entities_data, level_tilemaps_data = self.__read_level_data(
+            full_level_path
+        )
+
+        for tilemap_name, tilemap_data in level_tilemaps_data.items():
+            self.__levels_logger.debug("Creating '%s' tilemap ...", tilemap_name)
+            self.__tilemaps_manager.load_tilemap(tilemap_data)
+
+        for entity_name, entity_data in level_entities_data.items():
+            self.__levels_logger.debug("Creating '%s' entity ...", entity_name)
+            self.__spawn_entity(entity_data["class"], entity_name, entity_data)
 
-        with open(full_level_path, "r", encoding="UTF-8") as level_file:
+        self.__levels_entities_data[full_level_path] = level_entities_data
+        self.__levels_tilemaps_data[full_level_path] = level_tilemaps_data
+
+        if self.__files_watcher is not None:
+            self.__files_watcher.watch_file(full_level_path)
+
+        self.__levels_logger.info(
+            "Loaded '%s' level in %.1f ms (%d entities, %d tilemaps)",
+            level_name,
+            (time.perf_counter() - started_at) * 1000,
+            len(level_entities_data),
+            len(level_tilemaps_data),
+        )
+
+    def __read_level_data(
+        self, level_path: str
+    ) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+        """
+        Reads the entities and tilemaps declared in a level file.
+
+        Args:
+            level_path (str): The path of the level file.
+
+        Returns:
+            Tuple[Dict[str, dict], Dict[str, dict]]: The creation data of the level's
+                                                     entities and tilemaps, by name.
+        """
+        with open(level_path, "r", encoding="UTF-8") as level_file:
             yaml_data = yaml.safe_load(level_file)
 
-            for entity_data in yaml_data["entities"]:
-                entity_name: str = entity_data["name"]
-                entity_class: str = entity_data["class"]
+        entities_data = {
+            entity_data["name"]: entity_data
+            for entity_data in yaml_data.get("entities") or []
+        }
+        tilemaps_data = {
+            tilemap_data["name"]: tilemap_data
+            for tilemap_data in yaml_data.get("tilemaps") or []
+        }
 
-                self.log(f"Creating '{entity_name}' entity ...")
-                self.__spawn_entity(entity_class, entity_name, entity_data)
+        return entities_data, tilemaps_data
 
-    def __spawn_entity(self, _class: str, entity_name: str, creation_data: dict):
+    def __spawn_entity(
+        self, _class: str, entity_name: str, creation_data: dict
+    ) -> EmEntity:
         """
         Instantiates and registers a new entity with the factory and manager.
 
@@ -174,36 +1176,251 @@ class EmEngine:
             _class (str): The class name of the entity to spawn.
             entity_name (str): The name of the entity.
             creation_data (dict): The data needed to create the entity.
+
+        Returns:
+            EmEntity: The spawned entity.
+        """
+        entity_instance = self.__create_entity(_class, entity_name, creation_data)
+        self.__register_entity(entity_instance)
+
+        return entity_instance
+
+    def __register_entity(self, entity: EmEntity):
+        """
+        Adds a created entity to the game, considered visible until the next cull.
+
+        Args:
+            entity (EmEntity): The entity to add.
+        """
+        entity_id = entity.get_entity_id()
+
+        self.__entities_manager.append(new_entity=entity)
+
+        entity.set_moved_listener(self.__on_entity_moved)
+        self.__moved_entities[entity_id] = entity
+        self.__visible_entities_ids.add(entity_id)
+
+    def __unregister_entity(self, entity: EmEntity):
+        """
+        Removes an entity from the game and from every manager tracking it.
+
+        Args:
+            entity (EmEntity): The entity to remove.
+        """
+        entity_id = entity.get_entity_id()
+
+        self.__entities_manager.remove(entity)
+        self.__components_manager.remove_entity(entity)
+        self.__behaviors_scheduler.remove_entity(entity)
+        self.__collisions_manager.remove_entity(entity)
+
+        entity.set_moved_listener(None)
+        self.__spatial_grid.remove(entity)
+        self.__moved_entities.pop(entity_id, None)
+        self.__unbounded_entities.pop(entity_id, None)
+        self.__visible_entities_ids.discard(entity_id)
+
+    def __on_entity_moved(self, entity: EmEntity):
+        """
+        Queues an entity whose bounding box may have changed, to index it again on
+        the next cull.
+        """
+        self.__moved_entities[entity.get_entity_id()] = entity
+
+    def __create_entity(
+        self, _class: str, entity_name: str, creation_data: dict
+    ) -> EmEntity:
+        """
+        Instantiates a new entity with the factory, without registering it.
+
+        Args:
+            _class (str): The class name of the entity to create.
+            entity_name (str): The name of the entity.
+            creation_data (dict): The data needed to create the entity.
+
+        Returns:
+            EmEntity: The created entity.
         """
         entity_instance: EmEntity = self.__entities_factory.instantiate_class_by_name(
             _class, creation_data
         )
 
-        # Create a helper for the new entity to manage dependencies
-        new_helper = EmEntityHelper(
+        # Set ID, name, and helper for the new entity
+        entity_instance.set_entity_id(self.__next_entity_id)
+        entity_instance.set_entity_name(entity_name)
+        entity_instance.set_helper(self.__create_helper(self.__camera))
+
+        self.__next_entity_id += 1
+
+        return entity_instance
+
+    def __create_helper(self, camera: EmCamera) -> EmEntityHelper:
+        """
+        Creates a helper giving an entity access to the managers.
+
+        Args:
+            camera (EmCamera): The camera returned by the helper, the engine's one or
+                               a frame's copy for draw copies.
+
+        Returns:
+            EmEntityHelper: The helper.
+        """
+        return EmEntityHelper(
             window_manager=self.__window_manager,
             entities_manager=self.__entities_manager,
             keyboard_manager=self.__keyboard_manager,
+            inputs_manager=self.__inputs_manager,
             sounds_manager=self.__sounds_manager,
             fonts_manager=self.__fonts_manager,
+            images_manager=self.__images_manager,
+            tilemaps_manager=self.__tilemaps_manager,
+            collisions_manager=self.__collisions_manager,
+            memory_profiler=self.__memory_profiler,
+            components_manager=self.__components_manager,
+            particles_manager=self.__particles_manager,
+            camera=camera,
+            behaviors_scheduler=self.__behaviors_scheduler,
+            logs_manager=self.__logs_manager,
+            metrics=self.__metrics,
         )
 
-        # Set ID, name, and helper for the new entity
-        entity_instance.set_entity_id(self.__entities_manager.count())
-        entity_instance.set_entity_name(entity_name)
-        entity_instance.set_helper(new_helper)
+    def __poll_hot_reload(self):
+        """
+        Applies the changes of the watched files, at most once per poll interval.
+        """
+        now = time.perf_counter()
+
+        if (now - self.__last_hot_reload_poll) * 1000 < self.__hot_reload_interval_ms:
+            return
+
+        self.__last_hot_reload_poll = now
+
+        for changed_path in self.__files_watcher.poll():
+            try:
+                if changed_path.endswith(".py"):
+                    self.__reload_entities_module(changed_path)
+                else:
+                    self.__reload_level(changed_path)
+
+            # A broken edit must not bring the running game down
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.__reload_logger.error(
+                    "Hot reload of '%s' failed : %r", changed_path, error
+                )
+
+    def __reload_entities_module(self, module_path: str):
+        """
+        Executes an entities module again and switches the live entities of its
+        classes to the new class objects.
+
+        Args:
+            module_path (str): The file path of the changed module.
+        """
+        started_at = time.perf_counter()
+
+        previous_classes = dict(self.__entities_factory.classes)
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+
+        self.__execute_python_module(f"entities.{module_name}", module_path)
 
-        self.__entities_manager.append(new_entity=entity_instance)
+        swapped_count = 0
 
-    def __process_window_events(self):
+        for class_name, new_class in self.__entities_factory.classes.items():
+            old_class = previous_classes.get(class_name)
+
+            if old_class is None or old_class is new_class:
+                continue
+
+            for entity in self.__entities_manager.get_all_instanciated_entities():
+                if type(entity) is old_class:
+                    entity.__class__ = new_class
+                    entity.invalidate_bounding_box()
+                    swapped_count += 1
+
+        self.__reload_logger.info(
+            "Reloaded '%s' module in %.1f ms (%d entities swapped)",
+            module_name,
+            (time.perf_counter() - started_at) * 1000,
+            swapped_count,
+        )
+
+    def __reload_level(self, level_path: str):
+        """
+        Applies the changes of a loaded level: entities removed from the file are
+        despawned, new ones are spawned and modified ones are spawned again.
+
+        The new entities are instantiated before any old one is despawned, so an
+        entity failing to instantiate leaves the running level untouched.
+        Entities referencing a respawned entity keep referencing the old instance.
+
+        Args:
+            level_path (str): The path of the changed level file.
+        """
+        started_at = time.perf_counter()
+
+        old_entities_data = self.__levels_entities_data[level_path]
+        old_tilemaps_data = self.__levels_tilemaps_data[level_path]
+        new_entities_data, new_tilemaps_data = self.__read_level_data(level_path)
+
+        spawned_entities: List[EmEntity] = [
+            self.__create_entity(entity_data["class"], entity_name, entity_data)
+            for entity_name, entity_data in new_entities_data.items()
+            if old_entities_data.get(entity_name) != entity_data
+        ]
+
+        for tilemap_name in old_tilemaps_data:
+            if tilemap_name not in new_tilemaps_data:
+                self.__tilemaps_manager.remove_tilemap(tilemap_name)
+
+        for tilemap_name, tilemap_data in new_tilemaps_data.items():
+            if old_tilemaps_data.get(tilemap_name) != tilemap_data:
+                self.__tilemaps_manager.load_tilemap(tilemap_data)
+
+        for entity_name, entity_data in old_entities_data.items():
+            if new_entities_data.get(entity_name) != entity_data:
+                entity = self.__entities_manager.get_entity_by_name(entity_name)
+
+                if entity is not None:
+                    self.__unregister_entity(entity)
+
+        for entity in spawned_entities:
+            self.__register_entity(entity)
+
+        self.__levels_entities_data[level_path] = new_entities_data
+        self.__levels_tilemaps_data[level_path] = new_tilemaps_data
+
+        if self.__running:
+            for entity in spawned_entities:
+                entity.on_begin_play()
+
+        self.__reload_logger.info(
+            "Reloaded '%s' level in %.1f ms (%d entities spawned)",
+            os.path.basename(level_path),
+            (time.perf_counter() - started_at) * 1000,
+            len(spawned_entities),
+        )
+
+    def __process_window_events(self, events: List[pygame.event.Event]):
         """
         Processes window events, such as quitting the application.
+
+        Args:
+            events (List[pygame.event.Event]): The events of the current frame.
         """
-        for event in pygame.event.get():
+        for event in events:
+            self.__keyboard_manager.process_event(event)
+
             if event.type == pygame.QUIT:
                 self.__running = False
 
-            if event.type == pygame.KEYDOWN:
+            if (
+                event.type == pygame.KEYDOWN
+                and event.key == self.__performance_hud.get_hotkey()
+            ):
+                self.__performance_hud.toggle()
+
+            # Pausing would desynchronize the peers of a networked game
+            if event.type == pygame.KEYDOWN and self.__net_session is None:
                 if event.key == pygame.K_ESCAPE:
                     self.set_game_paused(not self.is_game_paused())
 
@@ -215,7 +1432,7 @@ class EmEngine:
             class_name (str): The name of the class being registered.
             _class (any): The class object being registered.
         """
-        self.log(f"Registered '{class_name}' class ({_class})")
+        self.__entities_logger.debug("Registered '%s' class (%s)", class_name, _class)
         self.__entities_factory.register_class(class_name=class_name, _class=_class)
 
     def __execute_python_module(self, module_name: str, module_path: str):
@@ -235,7 +1452,7 @@ class EmEngine:
 
         module.expose_entity = self.__callback_expose_entity
 
-        self.log(f"Executing '{module_name}' module ...")
+        self.__entities_logger.debug("Executing '%s' module ...", module_name)
         spec.loader.exec_module(module)
 
     def __execute_entities_modules(self):
@@ -245,19 +1462,20 @@ class EmEngine:
         This method scans the entities directory and imports each Python file
         to register the defined entity classes.
         """
-        self.log(
-            f"Loading modules from entities directory : {self.__entities_directory}"
+        self.__entities_logger.info(
+            "Loading modules from entities directory : %s", self.__entities_directory
         )
 
         for python_file in os.listdir(self.__entities_directory):
             full_file_path = os.path.join(self.__entities_directory, python_file)
 
             if not os.path.isfile(full_file_path):
-                return
+                continue
 
-            file_name = python_file.split(".")[0]
-            file_ext = python_file.split(".")[1]
+            file_name, file_ext = os.path.splitext(python_file)
 
-            if file_ext == "py":
-                self.log(f"Entity module found '{file_name}' ({python_file})")
+            if file_ext == ".py":
+                self.__entities_logger.debug(
+                    "Entity module found '%s' (%s)", file_name, python_file
+                )
                 self.__execute_python_module(f"entities.{file_name}", full_file_path)
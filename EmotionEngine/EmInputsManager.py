@@ -0,0 +1,112 @@
+from typing import Dict, List
+
+from EmotionEngine.EmKeyboardManager import EmKeyboardManager
+
+
+class EmInputsManager:
+    """
+    A manager class for the inputs of each player, as seen by the simulation.
+
+    A player's input is a bitmask of the bound keys (one bit per key, in binding
+    order), set once per simulated frame: from the local keyboard, or by the network
+    session for the remote player. Reading inputs through this manager rather than
+    the keyboard keeps the simulation identical on every peer of a networked game.
+    """
+
+    MAX_INPUT_KEYS = 16
+
+    def __init__(self, keyboard_manager: EmKeyboardManager) -> None:
+        self.__keyboard_manager = keyboard_manager
+        self.__input_keys: List[int] = []
+        self.__keys_bits: Dict[int, int] = {}
+        self.__players_inputs: List[int] = [0]
+
+    def set_input_keys(self, input_keys: List[int]):
+        """
+        Binds the keys making up a player's input.
+
+        Args:
+            input_keys (List[int]): The pygame key constants (e.g. pygame.K_UP), at
+                                    most 16.
+        """
+        assert len(input_keys) <= EmInputsManager.MAX_INPUT_KEYS
+
+        self.__input_keys = list(input_keys)
+        self.__keys_bits = {key: 1 << index for index, key in enumerate(input_keys)}
+
+    def get_input_keys(self) -> List[int]:
+        """
+        Returns the keys making up a player's input.
+
+        Returns:
+            List[int]: The bound pygame key constants.
+        """
+        return self.__input_keys
+
+    def set_players_count(self, players_count: int):
+        """
+        Sets the number of players, resetting their inputs.
+
+        Args:
+            players_count (int): The number of players.
+        """
+        self.__players_inputs = [0] * players_count
+
+    def get_players_count(self) -> int:
+        """
+        Returns the number of players.
+
+        Returns:
+            int: The number of players (1 unless a networked game is running).
+        """
+        return len(self.__players_inputs)
+
+    def capture_local_input(self) -> int:
+        """
+        Reads the local player's input from the keyboard.
+
+        Returns:
+            int: The bitmask of the bound keys currently pressed.
+        """
+        input_bits = 0
+
+        for key, bit in self.__keys_bits.items():
+            if self.__keyboard_manager.is_key_pressed(key):
+                input_bits |= bit
+
+        return input_bits
+
+    def set_player_input(self, player_index: int, input_bits: int):
+        """
+        Sets the input of a player for the frame being simulated.
+
+        Args:
+            player_index (int): The index of the player.
+            input_bits (int): The bitmask of the bound keys pressed by the player.
+        """
+        self.__players_inputs[player_index] = input_bits
+
+    def get_player_input(self, player_index: int) -> int:
+        """
+        Returns the input of a player for the frame being simulated.
+
+        Args:
+            player_index (int): The index of the player.
+
+        Returns:
+            int: The bitmask of the bound keys pressed by the player.
+        """
+        return self.__players_inputs[player_index]
+
+    def is_player_key_pressed(self, player_index: int, key: int) -> bool:
+        """
+        Checks if a bound key is pressed by a player in the frame being simulated.
+
+        Args:
+            player_index (int): The index of the player.
+            key (int): The bound pygame key constant to check.
+
+        Returns:
+            bool: True if the player presses the key, False otherwise.
+        """
+        return bool(self.__players_inputs[player_index] & self.__keys_bits[key])
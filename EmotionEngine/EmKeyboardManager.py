@@ -1,14 +1,35 @@
 import pygame
 
+from typing import Set
+
 
 class EmKeyboardManager:
     """
     A manager class for handling keyboard input in the game.
 
     This class provides functionality to check if specific keys are pressed
-    during the game loop.
+    during the game loop. The pressed keys are tracked from the key events fed
+    by the engine, so the keyboard state is fully determined by the event stream
+    (which allows input sessions to be recorded and replayed).
     """
 
+    def __init__(self) -> None:
+        self.__pressed_keys: Set[int] = set()
+
+    def process_event(self, event: pygame.event.Event):
+        """
+        Updates the pressed keys from a pygame event.
+
+        Args:
+            event (pygame.event.Event): The event to process. Events other than
+                                        KEYDOWN and KEYUP are ignored.
+        """
+        if event.type == pygame.KEYDOWN:
+            self.__pressed_keys.add(event.key)
+
+        elif event.type == pygame.KEYUP:
+            self.__pressed_keys.discard(event.key)
+
     def is_key_pressed(self, key: any):
         """
         Checks if a specific key is currently pressed.
@@ -20,5 +41,4 @@ class EmKeyboardManager:
         Returns:
             bool: True if the specified key is pressed, False otherwise.
         """
-        keys = pygame.key.get_pressed()
-        return keys[key]
+        return key in self.__pressed_keys
@@ -12,20 +12,43 @@ class EmWindowManager:
 
     This class handles the creation and management of the game window, including
     its dimensions, title, and the ability to fill the screen with a specific color.
+
+    An internal render resolution can be set: entities then draw to an offscreen
+    surface of that size, which is upscaled to the window once per frame, so the
+    drawing cost does not depend on the window size. In that case, the width and
+    height of the window manager are the ones of the internal resolution.
     """
 
+    SCALE_FILTERS = ("nearest", "smooth")
+
     def __init__(
         self,
         width: int = 600,
         height: int = 600,
         title: str = "Emotion Engine Application",
         engine_ref: "EmEngine" = None,
+        render_width: int = None,
+        render_height: int = None,
+        scale_filter: str = "nearest",
     ) -> None:
-        self.__width = width
-        self.__height = height
-        self.__title = title
+        assert scale_filter in EmWindowManager.SCALE_FILTERS
+
+        self.__display = pygame.display.set_mode((width, height))
+        self.__scale_filter = scale_filter
 
-        self.__screen = pygame.display.set_mode((self.__width, self.__height))
+        if render_width is None or render_height is None:
+            self.__width = width
+            self.__height = height
+            self.__screen = self.__display
+
+        else:
+            self.__width = render_width
+            self.__height = render_height
+            self.__screen = pygame.Surface((render_width, render_height)).convert(
+                self.__display
+            )
+
+        self.__title = title
 
         self.__engine_ref = engine_ref
         self.__title = title
@@ -67,10 +90,32 @@ class EmWindowManager:
         """
         return self.__height
 
+    def get_display_size(self) -> Tuple[int, int]:
+        """
+        Returns the size of the window, which may differ from the drawing size when
+        an internal render resolution is used.
+
+        Returns:
+            Tuple[int, int]: The width and height of the window in pixels.
+        """
+        return self.__display.get_size()
+
+    def get_display_surface(self) -> pygame.Surface:
+        """
+        Returns the window's surface, holding the frames as presented.
+
+        Returns:
+            pygame.Surface: The display surface.
+        """
+        return self.__display
+
     def get_screen_surface(self) -> pygame.Surface:
         """
         Returns the current screen surface for drawing.
 
+        With an internal render resolution, this is the offscreen surface presented
+        by `present`.
+
         Returns:
             pygame.Surface: The surface on which to draw graphics.
         """
@@ -85,3 +130,34 @@ class EmWindowManager:
                                                  to fill the screen. Default is black (0, 0, 0).
         """
         self.get_screen_surface().fill(fill_color)
+
+    def present(self):
+        """
+        Presents the frame drawn on the screen surface in the window.
+
+        With an internal render resolution, the offscreen surface is first scaled to
+        the window with the configured filter, straight into the display surface.
+        """
+        self.compose()
+        self.flip()
+
+    def compose(self):
+        """
+        Writes the frame drawn on the screen surface into the display surface,
+        without showing it. Does nothing without an internal render resolution.
+        """
+        if self.__screen is not self.__display:
+            if self.__scale_filter == "smooth":
+                pygame.transform.smoothscale(
+                    self.__screen, self.__display.get_size(), self.__display
+                )
+            else:
+                pygame.transform.scale(
+                    self.__screen, self.__display.get_size(), self.__display
+                )
+
+    def flip(self):
+        """
+        Shows the display surface in the window.
+        """
+        pygame.display.flip()
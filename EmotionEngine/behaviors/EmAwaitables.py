@@ -0,0 +1,51 @@
+from typing import Any, Generator, Optional
+from dataclasses import dataclass
+
+
+@dataclass
+class EmWaitFrame:
+    """
+    Awaitable suspending a behavior until the next simulated frame.
+
+    Resolves to the time delta of the frame, in milliseconds.
+    """
+
+    def __await__(self) -> Generator["EmWaitFrame", Any, float]:
+        return (yield self)
+
+
+@dataclass
+class EmWaitTime:
+    """
+    Awaitable suspending a behavior until the game time reaches `wake_time`.
+
+    Resolves to the game time the behavior was resumed at, in milliseconds.
+
+    Attributes:
+        wake_time (float): The game time to resume at, in milliseconds.
+    """
+
+    wake_time: float
+
+    def __await__(self) -> Generator["EmWaitTime", Any, float]:
+        return (yield self)
+
+
+@dataclass
+class EmWaitCollision:
+    """
+    Awaitable suspending a behavior until an entity starts colliding with another.
+
+    Resolves to the other entity.
+
+    Attributes:
+        entity_id (int): The ID of the entity to watch.
+        other_id (Optional[int]): The ID of the other entity to wait for, or None to
+                                  wait for any entity.
+    """
+
+    entity_id: int
+    other_id: Optional[int] = None
+
+    def __await__(self) -> Generator["EmWaitCollision", Any, Any]:
+        return (yield self)
@@ -0,0 +1,77 @@
+from typing import Any, Coroutine, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmBehavior:
+    """
+    A coroutine run by the behaviors scheduler on behalf of an entity.
+
+    Returned by `EmEntity.start_behavior`, to check whether the behavior is still
+    running or to cancel it.
+    """
+
+    def __init__(self, entity: "EmEntity", coroutine: Coroutine) -> None:
+        self.__entity = entity
+        self.__coroutine = coroutine
+        self.__running = True
+        self.__result: Any = None
+
+    def get_entity(self) -> "EmEntity":
+        """
+        Returns the entity running the behavior.
+
+        Returns:
+            EmEntity: The entity that started the behavior.
+        """
+        return self.__entity
+
+    def is_running(self) -> bool:
+        """
+        Checks whether the behavior has neither returned nor been cancelled.
+
+        Returns:
+            bool: True if the behavior is running or suspended.
+        """
+        return self.__running
+
+    def get_result(self) -> Any:
+        """
+        Returns the value returned by the behavior.
+
+        Returns:
+            Any: The coroutine's return value, or None while it is running.
+        """
+        return self.__result
+
+    def cancel(self):
+        """
+        Stops the behavior where it is suspended. Its `finally` blocks are run.
+        """
+        if self.__running:
+            self.__running = False
+            self.__coroutine.close()
+
+    def resume(self, value: Any) -> Any:
+        """
+        Runs the behavior until its next `await`. Called by the behaviors scheduler.
+
+        Args:
+            value (Any): The value the awaited object resolves to.
+
+        Returns:
+            Any: The awaitable the behavior is now waiting for, or None once the
+                 behavior returned.
+        """
+        try:
+            return self.__coroutine.send(value)
+
+        except StopIteration as stop:
+            self.__running = False
+            self.__result = stop.value
+            return None
+
+        except BaseException:
+            self.__running = False
+            raise
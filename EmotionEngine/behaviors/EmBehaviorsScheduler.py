@@ -0,0 +1,242 @@
+import heapq
+import itertools
+
+from typing import Any, Coroutine, Dict, List, Tuple, TYPE_CHECKING
+
+from EmotionEngine.behaviors.EmBehavior import EmBehavior
+from EmotionEngine.behaviors.EmAwaitables import (
+    EmWaitCollision,
+    EmWaitFrame,
+    EmWaitTime,
+)
+from EmotionEngine.collisions.EmCollisionsManager import EmCollisionsManager
+from EmotionEngine.utils.EmGameClock import EmGameClock
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmBehaviorsScheduler:
+    """
+    Runs the entities' `async` behaviors from the engine's frame loop.
+
+    A behavior is a coroutine awaiting `EmWaitFrame`, `EmWaitTime` or
+    `EmWaitCollision` objects (see `EmEntity.next_frame`, `EmEntity.sleep` and
+    `EmEntity.collision`). Suspended behaviors are kept in the queue of what they
+    wait for: a list for the next frame, a heap ordered by wake time for sleeps and
+    a dictionary by entity for collisions, so a suspended behavior costs nothing
+    until its wake condition fires.
+
+    Behaviors of frozen entities are resumed once the entity is unfrozen. Behaviors
+    are not part of world snapshots, so they should not drive the state of networked
+    games.
+    """
+
+    def __init__(self) -> None:
+        # Behaviors resumed by this frame's run_frame, and those queued since
+        # begin_frame, resumed on the next frame
+        self.__due_frame_waiters: List[EmBehavior] = []
+        self.__frame_waiters: List[EmBehavior] = []
+        self.__frozen_waiters: List[Tuple[EmBehavior, Any]] = []
+        self.__time_waiters: List[Tuple[float, int, EmBehavior]] = []
+        self.__collision_waiters: Dict[
+            int, List[Tuple[EmBehavior, EmWaitCollision]]
+        ] = {}
+        self.__entities_behaviors: Dict[int, List[EmBehavior]] = {}
+
+        # Breaks wake time ties in the heap, in sleeping order
+        self.__sequence = itertools.count()
+
+    def start(self, entity: "EmEntity", coroutine: Coroutine) -> EmBehavior:
+        """
+        Starts a behavior: runs it right away until its first `await`.
+
+        Args:
+            entity (EmEntity): The entity running the behavior.
+            coroutine (Coroutine): The coroutine, e.g. `self.serve()` for an
+                                   `async def serve(self)` method.
+
+        Returns:
+            EmBehavior: The behavior.
+        """
+        behavior = EmBehavior(entity, coroutine)
+        behaviors = self.__entities_behaviors.setdefault(entity.get_entity_id(), [])
+        behaviors.append(behavior)
+
+        self.__resume(behavior, None)
+
+        return behavior
+
+    def get_behaviors_count(self) -> int:
+        """
+        Returns the number of running behaviors.
+
+        Returns:
+            int: The number of behaviors started and not finished nor cancelled.
+        """
+        return sum(
+            1
+            for behaviors in self.__entities_behaviors.values()
+            for behavior in behaviors
+            if behavior.is_running()
+        )
+
+    def remove_entity(self, entity: "EmEntity"):
+        """
+        Cancels every behavior of an entity.
+
+        Args:
+            entity (EmEntity): The entity whose behaviors to cancel.
+        """
+        entity_id = entity.get_entity_id()
+
+        for behavior in self.__entities_behaviors.pop(entity_id, ()):
+            behavior.cancel()
+
+        self.__collision_waiters.pop(entity_id, None)
+
+    def begin_frame(self):
+        """
+        Marks the behaviors waiting for the next frame as due this frame. Called by
+        the engine once per frame, before `on_tick`, so a behavior awaiting
+        `next_frame` from `on_tick` is resumed on the next frame, not this one.
+        """
+        self.__due_frame_waiters.extend(self.__frame_waiters)
+        self.__frame_waiters = []
+
+    def run_frame(self, dt: float):
+        """
+        Resumes the behaviors waiting for this frame and the sleeping ones whose wake
+        time is reached. Called by the engine once per frame, after `on_tick`.
+
+        Args:
+            dt (float): The time delta of the frame in milliseconds.
+        """
+        # Behaviors woken while their entity was frozen get the value they waited for
+        if self.__frozen_waiters:
+            frozen_waiters = self.__frozen_waiters
+            self.__frozen_waiters = []
+
+            for behavior, value in frozen_waiters:
+                self.__resume(behavior, value)
+
+        if self.__due_frame_waiters:
+            frame_waiters = self.__due_frame_waiters
+            self.__due_frame_waiters = []
+
+            for behavior in frame_waiters:
+                self.__resume(behavior, dt)
+
+        if self.__time_waiters:
+            now = EmGameClock.get_milli_time()
+            woken: List[EmBehavior] = []
+
+            # Behaviors sleeping again while resumed wake up on a later frame
+            while self.__time_waiters and self.__time_waiters[0][0] <= now:
+                woken.append(heapq.heappop(self.__time_waiters)[2])
+
+            for behavior in woken:
+                self.__resume(behavior, now)
+
+    def on_collisions_entered(self, contacts: List[Tuple["EmEntity", "EmEntity"]]):
+        """
+        Resumes the behaviors waiting for the collisions that started this frame.
+        Called by the engine after the collision pass.
+
+        Args:
+            contacts (List[Tuple[EmEntity, EmEntity]]): The pairs of entities that
+                                                        started colliding.
+        """
+        if not self.__collision_waiters:
+            return
+
+        # Like the collision callbacks, only the entities reacting to the other's
+        # layer are notified
+        for entity_a, entity_b in contacts:
+            if EmCollisionsManager.reacts_to(entity_a, entity_b):
+                self.__wake_collision_waiters(entity_a, entity_b)
+            if EmCollisionsManager.reacts_to(entity_b, entity_a):
+                self.__wake_collision_waiters(entity_b, entity_a)
+
+    def __wake_collision_waiters(self, entity: "EmEntity", other: "EmEntity"):
+        """
+        Resumes the behaviors waiting for `entity` to collide with `other`.
+        """
+        waiters = self.__collision_waiters.get(entity.get_entity_id())
+
+        if waiters is None:
+            return
+
+        other_id = other.get_entity_id()
+        woken = [
+            behavior
+            for behavior, waited in waiters
+            if waited.other_id is None or waited.other_id == other_id
+        ]
+
+        if not woken:
+            return
+
+        waiters[:] = [
+            (behavior, waited) for behavior, waited in waiters if behavior not in woken
+        ]
+
+        if not waiters:
+            del self.__collision_waiters[entity.get_entity_id()]
+
+        for behavior in woken:
+            self.__resume(behavior, other)
+
+    def __resume(self, behavior: EmBehavior, value: Any):
+        """
+        Resumes a behavior, or postpones it to the next frame while its entity is
+        frozen, then queues it according to what it awaits next.
+        """
+        if not behavior.is_running():
+            return
+
+        if behavior.get_entity().is_frozen():
+            self.__frozen_waiters.append((behavior, value))
+            return
+
+        awaited = behavior.resume(value)
+
+        if awaited is None:
+            self.__forget(behavior)
+            return
+
+        if isinstance(awaited, EmWaitFrame):
+            self.__frame_waiters.append(behavior)
+
+        elif isinstance(awaited, EmWaitTime):
+            heapq.heappush(
+                self.__time_waiters,
+                (awaited.wake_time, next(self.__sequence), behavior),
+            )
+
+        elif isinstance(awaited, EmWaitCollision):
+            self.__collision_waiters.setdefault(awaited.entity_id, []).append(
+                (behavior, awaited)
+            )
+
+        else:
+            behavior.cancel()
+            raise TypeError(
+                f"Behaviors can only await EmWaitFrame, EmWaitTime and "
+                f"EmWaitCollision objects, not {awaited!r}"
+            )
+
+    def __forget(self, behavior: EmBehavior):
+        """
+        Drops a finished behavior from its entity's behaviors.
+        """
+        entity_id = behavior.get_entity().get_entity_id()
+        behaviors = self.__entities_behaviors.get(entity_id)
+
+        if behaviors is None:
+            return
+
+        behaviors[:] = [other for other in behaviors if other.is_running()]
+
+        if not behaviors:
+            del self.__entities_behaviors[entity_id]
@@ -0,0 +1,3 @@
+from .EmAwaitables import *
+from .EmBehavior import *
+from .EmBehaviorsScheduler import *
@@ -0,0 +1,173 @@
+import pygame
+
+from typing import Tuple
+
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.types.EmVector2 import EmVector2
+
+
+class EmCamera:
+    """
+    A camera looking at the world through a viewport of the screen surface.
+
+    The camera's position is the world point shown at the center of the viewport,
+    and its zoom the number of screen pixels per world unit. The default camera of
+    the engine covers the whole screen surface without zoom, so world coordinates
+    are screen coordinates until it is moved.
+
+    Entities drawing in world coordinates convert their positions with
+    `world_to_screen`; the engine uses `get_view_bounds` to skip the entities out of
+    view and draws the tilemaps through the camera.
+    """
+
+    def __init__(
+        self,
+        viewport: pygame.Rect,
+        position: EmVector2 = None,
+        zoom: float = 1.0,
+    ) -> None:
+        """
+        Initializes the camera.
+
+        Args:
+            viewport (pygame.Rect): The area of the screen surface the camera draws to.
+            position (EmVector2): The world point shown at the center of the viewport.
+                                  Default is None (the viewport's center, so world and
+                                  screen coordinates match).
+            zoom (float): The number of screen pixels per world unit. Default is 1.
+        """
+        assert zoom > 0
+
+        self.__viewport = pygame.Rect(viewport)
+        self.__zoom = zoom
+
+        if position is None:
+            position = EmVector2(self.__viewport.centerx, self.__viewport.centery)
+
+        self.__position = EmVector2(position.x, position.y)
+
+    def get_position(self) -> EmVector2:
+        """
+        Returns a copy of the camera's position.
+
+        Returns:
+            EmVector2: The world point shown at the center of the viewport.
+        """
+        return EmVector2(self.__position.x, self.__position.y)
+
+    def set_position(self, new_position: EmVector2):
+        """
+        Moves the camera.
+
+        Args:
+            new_position (EmVector2): The world point to show at the center of the
+                                      viewport.
+        """
+        self.__position = EmVector2(new_position.x, new_position.y)
+
+    def get_zoom(self) -> float:
+        """
+        Returns the camera's zoom.
+
+        Returns:
+            float: The number of screen pixels per world unit.
+        """
+        return self.__zoom
+
+    def set_zoom(self, new_zoom: float):
+        """
+        Sets the camera's zoom, keeping the same world point at the viewport's center.
+
+        Args:
+            new_zoom (float): The number of screen pixels per world unit, above 0.
+        """
+        assert new_zoom > 0
+        self.__zoom = new_zoom
+
+    def get_viewport(self) -> pygame.Rect:
+        """
+        Returns a copy of the camera's viewport.
+
+        Returns:
+            pygame.Rect: The area of the screen surface the camera draws to.
+        """
+        return pygame.Rect(self.__viewport)
+
+    def set_viewport(self, new_viewport: pygame.Rect):
+        """
+        Sets the area of the screen surface the camera draws to.
+
+        Args:
+            new_viewport (pygame.Rect): The new viewport.
+        """
+        self.__viewport = pygame.Rect(new_viewport)
+
+    def get_view_bounds(self) -> AABB:
+        """
+        Returns the part of the world seen by the camera.
+
+        Returns:
+            AABB: The world box covered by the viewport.
+        """
+        half_width = self.__viewport.width / (2 * self.__zoom)
+        half_height = self.__viewport.height / (2 * self.__zoom)
+
+        return AABB(
+            self.__position.x - half_width,
+            self.__position.y - half_height,
+            self.__position.x + half_width,
+            self.__position.y + half_height,
+        )
+
+    def is_box_visible(self, box: AABB) -> bool:
+        """
+        Checks whether a world box is at least partly seen by the camera.
+
+        Args:
+            box (AABB): The box, in world coordinates.
+
+        Returns:
+            bool: True if the box overlaps the view bounds.
+        """
+        return self.get_view_bounds().intersects(box)
+
+    def world_to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Converts a world position to a position on the screen surface.
+
+        Args:
+            x (float): The world x coordinate.
+            y (float): The world y coordinate.
+
+        Returns:
+            Tuple[float, float]: The position on the screen surface.
+        """
+        return (
+            (x - self.__position.x) * self.__zoom + self.__viewport.centerx,
+            (y - self.__position.y) * self.__zoom + self.__viewport.centery,
+        )
+
+    def screen_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Converts a position on the screen surface (e.g. the mouse) to a world position.
+
+        Args:
+            x (float): The screen x coordinate.
+            y (float): The screen y coordinate.
+
+        Returns:
+            Tuple[float, float]: The world position.
+        """
+        return (
+            (x - self.__viewport.centerx) / self.__zoom + self.__position.x,
+            (y - self.__viewport.centery) / self.__zoom + self.__position.y,
+        )
+
+    def get_draw_offset(self) -> Tuple[float, float]:
+        """
+        Returns the world position drawn at the top left corner of the screen surface.
+
+        Returns:
+            Tuple[float, float]: The world position of the surface's origin.
+        """
+        return self.screen_to_world(0, 0)
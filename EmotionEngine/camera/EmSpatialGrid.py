@@ -0,0 +1,148 @@
+from typing import Dict, Tuple, TYPE_CHECKING
+
+from EmotionEngine.collisions.AABB import AABB
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmSpatialGrid:
+    """
+    A uniform grid indexing entities by their positioned bounding box.
+
+    Each entity is stored in every cell its box overlaps. Updating an entity whose
+    box stays over the same cells costs a single comparison, so static and slow
+    entities are not moved around the grid; querying a region only looks at the
+    cells it overlaps, whatever the number of entities in the world.
+    """
+
+    def __init__(self, cell_size: float = 256) -> None:
+        """
+        Initializes an empty grid.
+
+        Args:
+            cell_size (float): The width and height of a cell, in world units.
+                               Default is 256.
+        """
+        assert cell_size > 0
+
+        self.__cell_size = cell_size
+        self.__cells: Dict[Tuple[int, int], Dict[int, "EmEntity"]] = {}
+        self.__entities_ranges: Dict[int, Tuple[int, int, int, int]] = {}
+
+    def get_cell_size(self) -> float:
+        """
+        Returns the size of the grid's cells.
+
+        Returns:
+            float: The width and height of a cell, in world units.
+        """
+        return self.__cell_size
+
+    def get_entities_count(self) -> int:
+        """
+        Returns the number of indexed entities.
+
+        Returns:
+            int: The number of entities in the grid.
+        """
+        return len(self.__entities_ranges)
+
+    def update(self, entity: "EmEntity"):
+        """
+        Indexes an entity, or moves it to the cells of its current bounding box.
+
+        Args:
+            entity (EmEntity): The entity to index.
+        """
+        entity_id = entity.get_entity_id()
+        cells_range = self.__get_cells_range(entity.get_positioned_bounding_box())
+        previous_range = self.__entities_ranges.get(entity_id)
+
+        if previous_range == cells_range:
+            return
+
+        if previous_range is not None:
+            self.__remove_from_cells(entity_id, previous_range)
+
+        first_column, first_row, last_column, last_row = cells_range
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                self.__cells.setdefault((column, row), {})[entity_id] = entity
+
+        self.__entities_ranges[entity_id] = cells_range
+
+    def remove(self, entity: "EmEntity"):
+        """
+        Removes an entity from the grid, if it is indexed.
+
+        Args:
+            entity (EmEntity): The entity to remove.
+        """
+        entity_id = entity.get_entity_id()
+        cells_range = self.__entities_ranges.pop(entity_id, None)
+
+        if cells_range is not None:
+            self.__remove_from_cells(entity_id, cells_range)
+
+    def query(self, box: AABB) -> Dict[int, "EmEntity"]:
+        """
+        Returns the entities stored in the cells overlapped by a box.
+
+        The result may include entities near the box without overlapping it; test
+        their bounding boxes when an exact answer is needed.
+
+        Args:
+            box (AABB): The region to query, in world coordinates.
+
+        Returns:
+            Dict[int, EmEntity]: The entities found, by entity ID.
+        """
+        first_column, first_row, last_column, last_row = self.__get_cells_range(box)
+        found: Dict[int, "EmEntity"] = {}
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell = self.__cells.get((column, row))
+
+                if cell is not None:
+                    found.update(cell)
+
+        return found
+
+    def clear(self):
+        """
+        Removes every entity from the grid.
+        """
+        self.__cells.clear()
+        self.__entities_ranges.clear()
+
+    def __get_cells_range(self, box: AABB) -> Tuple[int, int, int, int]:
+        """
+        Returns the first and last columns and rows of the cells overlapped by a box.
+        """
+        cell_size = self.__cell_size
+
+        return (
+            int(box.left // cell_size),
+            int(box.bottom // cell_size),
+            int(box.right // cell_size),
+            int(box.top // cell_size),
+        )
+
+    def __remove_from_cells(
+        self, entity_id: int, cells_range: Tuple[int, int, int, int]
+    ):
+        """
+        Removes an entity from the cells of a range, dropping the cells left empty.
+        """
+        first_column, first_row, last_column, last_row = cells_range
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell = self.__cells[(column, row)]
+                del cell[entity_id]
+
+                if not cell:
+                    del self.__cells[(column, row)]
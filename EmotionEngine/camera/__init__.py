@@ -0,0 +1,2 @@
+from .EmCamera import *
+from .EmSpatialGrid import *
@@ -0,0 +1,240 @@
+import os
+import math
+import time
+import queue
+import threading
+import pygame
+
+from typing import Dict, Optional, Tuple
+
+try:
+    from PIL import Image, GifImagePlugin
+except ImportError:
+    Image = None
+
+
+class EmFrameCapture:
+    """
+    Records the presented frames to disk without stalling the game loop.
+
+    Each captured frame is copied into one of a fixed pool of surfaces and queued;
+    a writer thread encodes the queued frames and hands the surfaces back to the
+    pool. When the writer falls behind and the pool is empty, frames are dropped
+    instead of blocking the game loop. Dropped frames and encoding lag are reported
+    by `get_stats`.
+
+    Supported formats:
+        - "png": a PNG sequence (frame_000000.png, ...) in the output directory.
+        - "gif": an animated GIF, each frame appended as it is encoded (requires
+                 Pillow).
+        - "raw": raw RGB24 frames appended to the output file, e.g. for
+                 `ffmpeg -f rawvideo -pixel_format rgb24 -video_size WxH -i out.raw`.
+    """
+
+    FORMATS = ("png", "gif", "raw")
+
+    # GIF delays are stored in centiseconds, and viewers slow down shorter ones
+    MIN_GIF_FRAME_DURATION_MS = 20
+
+    def __init__(
+        self,
+        output_path: str,
+        frame_size: Tuple[int, int],
+        capture_format: str = "png",
+        queue_size: int = 8,
+        frame_step: Optional[int] = None,
+        frame_duration_ms: float = 1000 / 60,
+    ) -> None:
+        """
+        Initializes the capture and starts its writer thread.
+
+        Args:
+            output_path (str): The output directory ("png") or file ("gif", "raw").
+            frame_size (Tuple[int, int]): The size of the captured frames.
+            capture_format (str): One of "png", "gif" or "raw". Default is "png".
+            queue_size (int): The number of frames that can wait to be encoded.
+                              Default is 8.
+            frame_step (Optional[int]): Capture one frame every `frame_step` frames.
+                                        For GIFs, it is raised so a captured frame
+                                        lasts at least `MIN_GIF_FRAME_DURATION_MS`.
+                                        Default is None (1, or that minimum for GIFs).
+            frame_duration_ms (float): The duration of a game frame, used for the GIF
+                                       timing. Default is 1000 / 60.
+
+        Raises:
+            ImportError: If the "gif" format is requested and Pillow is not installed.
+        """
+        assert capture_format in EmFrameCapture.FORMATS
+
+        if capture_format == "gif" and Image is None:
+            raise ImportError(
+                "GIF capture requires Pillow, install it with 'pip install Pillow'"
+            )
+
+        if frame_step is None:
+            frame_step = 1
+
+        if capture_format == "gif":
+            frame_step = max(
+                frame_step,
+                math.ceil(
+                    EmFrameCapture.MIN_GIF_FRAME_DURATION_MS / frame_duration_ms - 1e-9
+                ),
+            )
+
+        self.__output_path = output_path
+        self.__capture_format = capture_format
+        self.__frame_step = frame_step
+        self.__frame_duration_ms = frame_duration_ms * frame_step
+
+        self.__free_surfaces: queue.Queue = queue.Queue()
+        self.__pending_frames: queue.Queue = queue.Queue()
+
+        for _ in range(queue_size):
+            self.__free_surfaces.put(pygame.Surface(frame_size).convert())
+
+        self.__frames_count = 0
+        self.__captured = 0
+        self.__encoded = 0
+        self.__dropped = 0
+        self.__total_lag_ms = 0.0
+        self.__max_lag_ms = 0.0
+
+        # Output file of the "gif" and "raw" formats
+        self.__output_file = None
+        self.__gif_frames_count = 0
+
+        if capture_format == "png":
+            os.makedirs(output_path, exist_ok=True)
+
+        else:
+            self.__output_file = open(output_path, "wb")
+
+        self.__writer_thread = threading.Thread(
+            target=self.__write_frames, name="EmFrameCapture", daemon=True
+        )
+        self.__writer_thread.start()
+
+    def capture_frame(self, surface: pygame.Surface) -> bool:
+        """
+        Queues a copy of a presented frame for encoding. Never blocks.
+
+        Args:
+            surface (pygame.Surface): The presented frame.
+
+        Returns:
+            bool: True if the frame was queued, False if it was skipped or dropped.
+        """
+        self.__frames_count += 1
+
+        if (self.__frames_count - 1) % self.__frame_step != 0:
+            return False
+
+        try:
+            frame_surface = self.__free_surfaces.get_nowait()
+
+        except queue.Empty:
+            self.__dropped += 1
+            return False
+
+        frame_surface.blit(surface, (0, 0))
+
+        self.__pending_frames.put((self.__captured, time.perf_counter(), frame_surface))
+        self.__captured += 1
+
+        return True
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns statistics about the capture.
+
+        Returns:
+            Dict[str, float]: The number of captured, encoded and dropped frames, the
+                              number of frames waiting to be encoded, and the average
+                              and maximum encoding lag in milliseconds (from the copy
+                              of a frame to the end of its encoding).
+        """
+        return {
+            "captured": self.__captured,
+            "encoded": self.__encoded,
+            "dropped": self.__dropped,
+            "pending": self.__pending_frames.qsize(),
+            "average_lag_ms": self.__total_lag_ms / max(self.__encoded, 1),
+            "max_lag_ms": self.__max_lag_ms,
+        }
+
+    def close(self):
+        """
+        Waits for the queued frames to be encoded and finalizes the output.
+        """
+        self.__pending_frames.put(None)
+        self.__writer_thread.join()
+
+        if self.__output_file is not None:
+            if self.__gif_frames_count:
+                # GIF trailer
+                self.__output_file.write(b";")
+
+            self.__output_file.close()
+
+    def __write_frames(self):
+        """
+        Writer thread: encodes the queued frames until the capture is closed.
+        """
+        while True:
+            pending_frame = self.__pending_frames.get()
+
+            if pending_frame is None:
+                break
+
+            frame_index, captured_at, frame_surface = pending_frame
+
+            if self.__capture_format == "png":
+                pygame.image.save(
+                    frame_surface,
+                    os.path.join(self.__output_path, f"frame_{frame_index:06d}.png"),
+                )
+
+            elif self.__capture_format == "raw":
+                self.__output_file.write(pygame.image.tobytes(frame_surface, "RGB"))
+
+            else:
+                frame_image = Image.frombytes(
+                    "RGB",
+                    frame_surface.get_size(),
+                    pygame.image.tobytes(frame_surface, "RGB"),
+                )
+                self.__write_gif_frame(frame_image.quantize())
+
+            self.__free_surfaces.put(frame_surface)
+
+            lag_ms = (time.perf_counter() - captured_at) * 1000
+            self.__total_lag_ms += lag_ms
+            self.__max_lag_ms = max(self.__max_lag_ms, lag_ms)
+            self.__encoded += 1
+
+    def __write_gif_frame(self, frame_image: "Image.Image"):
+        """
+        Appends a quantized frame to the GIF file, with its own color table, so
+        frames are never kept in memory. Writes the GIF header before the first one.
+
+        Frames start at their capture time rounded to the centisecond, so durations
+        alternate (e.g. 30 and 40 ms at 60 FPS, one frame out of two) without drift.
+        """
+        frames_count = self.__gif_frames_count
+        start_cs = round(frames_count * self.__frame_duration_ms / 10)
+        end_cs = round((frames_count + 1) * self.__frame_duration_ms / 10)
+        duration = (end_cs - start_cs) * 10
+
+        if frames_count == 0:
+            header, _ = GifImagePlugin.getheader(
+                frame_image, info={"loop": 0, "duration": duration}
+            )
+            self.__output_file.write(b"".join(header))
+
+        self.__gif_frames_count += 1
+
+        for frame_data in GifImagePlugin.getdata(
+            frame_image, duration=duration, include_color_table=True
+        ):
+            self.__output_file.write(frame_data)
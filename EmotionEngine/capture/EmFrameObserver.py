@@ -0,0 +1,132 @@
+import pygame
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from EmotionEngine.EmWindowManager import EmWindowManager
+
+# Integer luma weights (ITU-R BT.601), scaled to sum up to 256
+GRAYSCALE_WEIGHTS = (77, 150, 29)
+
+
+class EmFrameObserver:
+    """
+    Exposes the rendered frames as NumPy arrays, e.g. as observations for training.
+
+    `get_frame_view` returns a zero-copy view of the screen pixels. `observe` copies
+    the current frame, optionally downsampled and converted to grayscale, into a
+    preallocated ring of arrays and returns the last `stack_size` frames, without
+    allocating any pixel memory per frame.
+
+    Requires NumPy.
+    """
+
+    def __init__(
+        self,
+        window_manager: "EmWindowManager",
+        downsample: int = 1,
+        grayscale: bool = False,
+        stack_size: int = 1,
+    ) -> None:
+        """
+        Initializes the observer and preallocates its buffers.
+
+        Args:
+            window_manager (EmWindowManager): The window manager owning the frames.
+            downsample (int): Keep one pixel every `downsample` pixels on both axes
+                              (nearest neighbour). Default is 1.
+            grayscale (bool): Whether to convert frames to grayscale. Default is False.
+            stack_size (int): The number of frames returned by `observe`. Default is 1.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError(
+                "EmFrameObserver requires NumPy, install it with 'pip install numpy'"
+            )
+
+        assert downsample >= 1 and stack_size >= 1
+
+        self.__window_manager = window_manager
+        self.__downsample = downsample
+        self.__grayscale = grayscale
+        self.__stack_size = stack_size
+
+        width = -(-window_manager.get_width() // downsample)
+        height = -(-window_manager.get_height() // downsample)
+
+        frame_shape = (height, width) if grayscale else (height, width, 3)
+
+        # Every frame is written twice, stack_size apart, so the last stack_size
+        # frames are always a contiguous slice of the ring
+        self.__ring = numpy.zeros((stack_size * 2,) + frame_shape, dtype=numpy.uint8)
+        self.__next_index = 0
+
+        self.__luma = numpy.zeros((height, width), dtype=numpy.uint16)
+        self.__luma_channel = numpy.zeros((height, width), dtype=numpy.uint16)
+
+    def get_frame_view(self) -> "numpy.ndarray":
+        """
+        Returns a zero-copy view of the screen pixels, shaped (height, width, 3).
+
+        The view locks the screen surface: it must be released (deleted) before the
+        next frame is drawn.
+
+        Returns:
+            numpy.ndarray: The view of the screen pixels.
+        """
+        surface = self.__window_manager.get_screen_surface()
+        return pygame.surfarray.pixels3d(surface).transpose(1, 0, 2)
+
+    def observe(self) -> "numpy.ndarray":
+        """
+        Records the current frame and returns the last `stack_size` frames.
+
+        Returns:
+            numpy.ndarray: The frames, oldest first, shaped (stack_size, height, width)
+                           in grayscale or (stack_size, height, width, 3) otherwise.
+                           The array is a view of the observer's ring, overwritten by
+                           the following calls.
+        """
+        index = self.__next_index
+        first_slot = self.__ring[index]
+
+        frame = self.get_frame_view()[:: self.__downsample, :: self.__downsample]
+
+        if self.__grayscale:
+            luma = self.__luma
+            luma_channel = self.__luma_channel
+
+            numpy.multiply(
+                frame[..., 0], GRAYSCALE_WEIGHTS[0], out=luma, dtype=numpy.uint16
+            )
+
+            for channel in (1, 2):
+                numpy.multiply(
+                    frame[..., channel],
+                    GRAYSCALE_WEIGHTS[channel],
+                    out=luma_channel,
+                    dtype=numpy.uint16,
+                )
+                numpy.add(luma, luma_channel, out=luma)
+
+            numpy.right_shift(luma, 8, out=luma)
+            numpy.copyto(first_slot, luma, casting="unsafe")
+
+        else:
+            numpy.copyto(first_slot, frame)
+
+        # Release the surface lock as soon as the pixels are copied
+        del frame
+
+        numpy.copyto(self.__ring[index + self.__stack_size], first_slot)
+
+        self.__next_index = (index + 1) % self.__stack_size
+
+        return self.__ring[index + 1 : index + 1 + self.__stack_size]
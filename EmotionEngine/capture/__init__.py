@@ -0,0 +1,2 @@
+from .EmFrameObserver import *
+from .EmFrameCapture import *
@@ -1,9 +1,27 @@
-from typing import Tuple
+import math
+
+from typing import Iterable, Optional, Tuple
 from dataclasses import dataclass
 
 from EmotionEngine.types.EmVector2 import EmVector2
 
 
+@dataclass
+class AABBSweepHit:
+    """
+    Result of a swept AABB query: when and where a moving box first touches another one.
+
+    Attributes:
+        time (float): Time of impact, as a fraction in [0, 1] of the tested displacement.
+        normal (EmVector2): Contact normal, pointing out of the hit box.
+        index (int): Index of the hit box in the tested collection (-1 for a single box).
+    """
+
+    time: float
+    normal: EmVector2
+    index: int = -1
+
+
 @dataclass
 class AABB:
     """
@@ -53,12 +71,176 @@ class AABB:
             bool: True if the bounding boxes intersect, False otherwise.
         """
         return not (
-            self.top_right.x < other.bottom_left.x
-            or self.bottom_left.x > other.top_right.x
-            or self.top_right.y < other.bottom_left.y
-            or self.bottom_left.y > other.top_right.y
+            self.right < other.left
+            or self.left > other.right
+            or self.top < other.bottom
+            or self.bottom > other.top
+        )
+
+    def swept_bounds(self, displacement: EmVector2) -> "AABB":
+        """
+        Returns the box covering the whole path of this box moved by `displacement`.
+
+        Useful as a cheap broad-phase test before running `sweep`.
+
+        Args:
+            displacement (EmVector2): The movement applied to this box during the step.
+
+        Returns:
+            AABB: The bounding box of the start and end positions.
+        """
+        return AABB(
+            min(self.left, self.left + displacement.x),
+            min(self.bottom, self.bottom + displacement.y),
+            max(self.right, self.right + displacement.x),
+            max(self.top, self.top + displacement.y),
         )
 
+    def sweep(
+        self,
+        displacement: EmVector2,
+        other: "AABB",
+        other_displacement: EmVector2 = None,
+    ) -> Optional[AABBSweepHit]:
+        """
+        Computes the first contact between this box moving by `displacement` and
+        another box, optionally moving as well, during a single step.
+
+        Both boxes are swept at the same time, so fast movers cannot tunnel through
+        thin obstacles. Boxes that already overlap at the start of the step are
+        ignored, whatever their movement: separate them first with `penetration`.
+        Boxes touching without overlapping and moving towards each other hit at
+        time 0.
+
+        Args:
+            displacement (EmVector2): The movement of this box during the step.
+            other (AABB): The box to test against.
+            other_displacement (EmVector2): The movement of the other box during the
+                                            step. Default is None (static box).
+
+        Returns:
+            Optional[AABBSweepHit]: The time of impact and contact normal, or None if
+                                    the boxes do not touch during the step.
+        """
+        dx = displacement.x
+        dy = displacement.y
+
+        if other_displacement is not None:
+            dx -= other_displacement.x
+            dy -= other_displacement.y
+
+        x_entry, x_exit = self.__axis_times(
+            self.left, self.right, other.left, other.right, dx
+        )
+        y_entry, y_exit = self.__axis_times(
+            self.bottom, self.top, other.bottom, other.top, dy
+        )
+
+        entry_time = max(x_entry, y_entry)
+        exit_time = min(x_exit, y_exit)
+
+        # A negative entry time on both axes means the boxes already overlap
+        if entry_time > exit_time or entry_time > 1 or entry_time < 0:
+            return None
+
+        if x_entry > y_entry:
+            normal = EmVector2(-math.copysign(1, dx), 0)
+        else:
+            normal = EmVector2(0, -math.copysign(1, dy))
+
+        return AABBSweepHit(time=entry_time, normal=normal)
+
+    def penetration(self, other: "AABB") -> Optional[EmVector2]:
+        """
+        Computes the smallest translation moving this box out of another one.
+
+        Args:
+            other (AABB): The box to separate from.
+
+        Returns:
+            Optional[EmVector2]: The translation to apply to this box, along the axis
+                                 of least overlap, or None if the boxes do not overlap.
+        """
+        x_overlap = min(self.right, other.right) - max(self.left, other.left)
+        y_overlap = min(self.top, other.top) - max(self.bottom, other.bottom)
+
+        if x_overlap <= 0 or y_overlap <= 0:
+            return None
+
+        if x_overlap < y_overlap:
+            # Push towards the side of this box's center
+            if self.left + self.right < other.left + other.right:
+                return EmVector2(-x_overlap, 0)
+
+            return EmVector2(x_overlap, 0)
+
+        if self.bottom + self.top < other.bottom + other.top:
+            return EmVector2(0, -y_overlap)
+
+        return EmVector2(0, y_overlap)
+
+    def sweep_many(
+        self,
+        displacement: EmVector2,
+        others: Iterable["AABB"],
+        others_displacements: Iterable[EmVector2] = None,
+    ) -> Optional[AABBSweepHit]:
+        """
+        Sweeps this box against a collection of boxes and returns the earliest contact.
+
+        Args:
+            displacement (EmVector2): The movement of this box during the step.
+            others (Iterable[AABB]): The boxes to test against.
+            others_displacements (Iterable[EmVector2]): The movement of each box in
+                                                        `others`, in the same order.
+                                                        Default is None (static boxes).
+
+        Returns:
+            Optional[AABBSweepHit]: The earliest contact, with `index` set to the
+                                    position of the hit box in `others`, or None.
+        """
+        if others_displacements is None:
+            pairs = ((other, None) for other in others)
+        else:
+            pairs = zip(others, others_displacements)
+
+        sweep_bounds = self.swept_bounds(displacement)
+        earliest: AABBSweepHit = None
+
+        for index, (other, other_displacement) in enumerate(pairs):
+            if other_displacement is None and not sweep_bounds.intersects(other):
+                continue
+
+            hit = self.sweep(displacement, other, other_displacement)
+
+            if hit is not None and (earliest is None or hit.time < earliest.time):
+                hit.index = index
+                earliest = hit
+
+        return earliest
+
+    @staticmethod
+    def __axis_times(
+        min_a: float, max_a: float, min_b: float, max_b: float, delta: float
+    ) -> Tuple[float, float]:
+        """
+        Computes the entry and exit times of a moving interval against a static one.
+
+        Returns:
+            Tuple[float, float]: The (entry, exit) times, infinite when the intervals
+                                 always or never overlap on this axis.
+        """
+        if delta > 0:
+            return (min_b - max_a) / delta, (max_b - min_a) / delta
+
+        if delta < 0:
+            return (max_b - min_a) / delta, (min_b - max_a) / delta
+
+        if max_a < min_b or min_a > max_b:
+            return math.inf, -math.inf
+
+        return -math.inf, math.inf
+
     def to_tuple(self) -> Tuple[float, float, float, float]:
         """
         Converts the bounding box to a tuple of its edges.
@@ -0,0 +1,178 @@
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmCollisionsManager:
+    """
+    A manager class that runs a single collision pass over all entities once per frame.
+
+    Entities opt in by setting a collision layer and/or mask. Pairs are pruned with
+    layers and masks, then with a sort-and-sweep along the x-axis, so each candidate
+    pair is tested exactly once per frame. Contacts are tracked between frames to
+    dispatch `on_collision_enter`, `on_collision_stay` and `on_collision_exit`, to
+    each entity of a pair whose mask includes the other's layer.
+    """
+
+    def __init__(self) -> None:
+        self.__contacts: Dict[Tuple[int, int], Tuple["EmEntity", "EmEntity"]] = {}
+        self.__entered_contacts: List[Tuple["EmEntity", "EmEntity"]] = []
+
+    @staticmethod
+    def can_collide(a: "EmEntity", b: "EmEntity") -> bool:
+        """
+        Checks whether two entities' layers and masks allow them to collide.
+
+        Args:
+            a (EmEntity): The first entity.
+            b (EmEntity): The second entity.
+
+        Returns:
+            bool: True if either entity's mask includes the other's layer.
+        """
+        return bool(
+            (a.get_collision_layer() & b.get_collision_mask())
+            or (b.get_collision_layer() & a.get_collision_mask())
+        )
+
+    @staticmethod
+    def reacts_to(entity: "EmEntity", other: "EmEntity") -> bool:
+        """
+        Checks whether an entity's mask includes another entity's layer, i.e. whether
+        it receives the collision callbacks of their contact.
+
+        Args:
+            entity (EmEntity): The entity receiving the callbacks.
+            other (EmEntity): The other entity of the contact.
+
+        Returns:
+            bool: True if the entity reacts to the other's layer.
+        """
+        return bool(other.get_collision_layer() & entity.get_collision_mask())
+
+    def get_contacts_count(self) -> int:
+        """
+        Returns the number of entity pairs currently in contact.
+
+        Returns:
+            int: The number of contacts found by the last collision pass.
+        """
+        return len(self.__contacts)
+
+    def get_entered_contacts(self) -> List[Tuple["EmEntity", "EmEntity"]]:
+        """
+        Returns the entity pairs that started colliding during the last pass.
+
+        Returns:
+            List[Tuple[EmEntity, EmEntity]]: The new contacts.
+        """
+        return self.__entered_contacts
+
+    def reset_contacts(self, entities: List["EmEntity"]):
+        """
+        Replaces the tracked contacts with the pairs overlapping in the given
+        entities, without dispatching any callback, e.g. after the world state was
+        restored. The next pass then only reports the contacts changed since.
+
+        Args:
+            entities (List[EmEntity]): The entities to test against each other.
+        """
+        self.__contacts = self.__find_contacts(entities)
+        self.__entered_contacts = []
+
+    def remove_entity(self, entity: "EmEntity"):
+        """
+        Forgets the contacts of a despawned entity, so that neither it nor the
+        entities it touched receive `on_collision_exit` on the next pass.
+
+        Args:
+            entity (EmEntity): The despawned entity.
+        """
+        entity_id = entity.get_entity_id()
+
+        self.__contacts = {
+            key: contact
+            for key, contact in self.__contacts.items()
+            if entity_id not in key
+        }
+        self.__entered_contacts = [
+            contact for contact in self.__entered_contacts if entity not in contact
+        ]
+
+    def process_collisions(self, entities: List["EmEntity"]):
+        """
+        Runs the collision pass over the given entities and dispatches callbacks.
+
+        Args:
+            entities (List[EmEntity]): The entities to test against each other.
+        """
+        new_contacts = self.__find_contacts(entities)
+
+        old_contacts = self.__contacts
+        self.__contacts = new_contacts
+        self.__entered_contacts = []
+
+        reacts_to = EmCollisionsManager.reacts_to
+
+        for key, (entity_a, entity_b) in new_contacts.items():
+            a_reacts = reacts_to(entity_a, entity_b)
+            b_reacts = reacts_to(entity_b, entity_a)
+
+            if key in old_contacts:
+                if a_reacts:
+                    entity_a.on_collision_stay(entity_b)
+                if b_reacts:
+                    entity_b.on_collision_stay(entity_a)
+            else:
+                self.__entered_contacts.append((entity_a, entity_b))
+
+                if a_reacts:
+                    entity_a.on_collision_enter(entity_b)
+                if b_reacts:
+                    entity_b.on_collision_enter(entity_a)
+
+        for key, (entity_a, entity_b) in old_contacts.items():
+            if key not in new_contacts:
+                if reacts_to(entity_a, entity_b):
+                    entity_a.on_collision_exit(entity_b)
+                if reacts_to(entity_b, entity_a):
+                    entity_b.on_collision_exit(entity_a)
+
+    def __find_contacts(
+        self, entities: List["EmEntity"]
+    ) -> Dict[Tuple[int, int], Tuple["EmEntity", "EmEntity"]]:
+        """
+        Returns the pairs of entities allowed to collide whose bounding boxes overlap,
+        by ordered pair of entity ids.
+        """
+        colliders = [
+            (entity.get_positioned_bounding_box(), entity)
+            for entity in entities
+            if entity.get_collision_layer() or entity.get_collision_mask()
+        ]
+        colliders.sort(key=lambda collider: collider[0].left)
+
+        new_contacts: Dict[Tuple[int, int], Tuple["EmEntity", "EmEntity"]] = {}
+
+        for i, (box_a, entity_a) in enumerate(colliders):
+            for j in range(i + 1, len(colliders)):
+                box_b, entity_b = colliders[j]
+
+                # Colliders are sorted by their left edge: nothing further can overlap
+                if box_b.left > box_a.right:
+                    break
+
+                if not self.can_collide(entity_a, entity_b):
+                    continue
+
+                if box_a.intersects(box_b):
+                    id_a = entity_a.get_entity_id()
+                    id_b = entity_b.get_entity_id()
+
+                    if id_a < id_b:
+                        new_contacts[(id_a, id_b)] = (entity_a, entity_b)
+                    else:
+                        new_contacts[(id_b, id_a)] = (entity_b, entity_a)
+
+        return new_contacts
@@ -1 +1,2 @@
 from .AABB import *
+from .EmCollisionsManager import *
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmComponentStore:
+    """
+    Dense storage of every component of a given type.
+
+    Components and their entities are kept in two parallel lists without holes, so
+    systems can process all of them in a single pass. Removal swaps the last
+    component into the freed slot.
+    """
+
+    def __init__(self, component_type: type) -> None:
+        self.__component_type = component_type
+        self.__entities: List["EmEntity"] = []
+        self.__components: List[Any] = []
+        self.__indices: Dict[int, int] = {}
+
+    def get_component_type(self) -> type:
+        """
+        Returns the type of the stored components.
+
+        Returns:
+            type: The component type.
+        """
+        return self.__component_type
+
+    def get_entities(self) -> List["EmEntity"]:
+        """
+        Returns the entities owning the stored components, in storage order.
+
+        Returns:
+            List[EmEntity]: The entities, aligned with `get_components`.
+        """
+        return self.__entities
+
+    def get_components(self) -> List[Any]:
+        """
+        Returns the stored components, in storage order.
+
+        Returns:
+            List[Any]: The components, aligned with `get_entities`.
+        """
+        return self.__components
+
+    def get(self, entity: "EmEntity") -> Any:
+        """
+        Returns the component of an entity.
+
+        Args:
+            entity (EmEntity): The entity owning the component.
+
+        Returns:
+            Any: The entity's component, or None if it has none.
+        """
+        index = self.__indices.get(entity.get_entity_id())
+
+        if index is None:
+            return None
+
+        return self.__components[index]
+
+    def add(self, entity: "EmEntity", component: Any):
+        """
+        Stores the component of an entity, replacing its previous one.
+
+        Args:
+            entity (EmEntity): The entity owning the component.
+            component (Any): The component to store.
+        """
+        entity_id = entity.get_entity_id()
+        index = self.__indices.get(entity_id)
+
+        if index is not None:
+            self.__components[index] = component
+            return
+
+        self.__indices[entity_id] = len(self.__components)
+        self.__entities.append(entity)
+        self.__components.append(component)
+
+    def remove(self, entity: "EmEntity"):
+        """
+        Removes the component of an entity, if it has one.
+
+        Args:
+            entity (EmEntity): The entity owning the component.
+        """
+        index = self.__indices.pop(entity.get_entity_id(), None)
+
+        if index is None:
+            return
+
+        last_entity = self.__entities.pop()
+        last_component = self.__components.pop()
+
+        if index < len(self.__components):
+            self.__entities[index] = last_entity
+            self.__components[index] = last_component
+            self.__indices[last_entity.get_entity_id()] = index
@@ -0,0 +1,33 @@
+import pygame
+
+from dataclasses import dataclass
+
+
+@dataclass
+class EmVelocity:
+    """
+    Component moving its entity every frame, processed by `movement_system`.
+
+    Attributes:
+        x (float): The horizontal speed, in pixels per millisecond.
+        y (float): The vertical speed, in pixels per millisecond.
+    """
+
+    x: float = 0.0
+    y: float = 0.0
+
+
+@dataclass
+class EmSprite:
+    """
+    Component drawing an image at its entity's position, processed by `sprite_system`.
+
+    Attributes:
+        image (pygame.Surface): The image to draw.
+        offset_x (float): The horizontal offset of the image from the entity position.
+        offset_y (float): The vertical offset of the image from the entity position.
+    """
+
+    image: pygame.Surface
+    offset_x: float = 0.0
+    offset_y: float = 0.0
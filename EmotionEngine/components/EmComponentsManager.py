@@ -0,0 +1,263 @@
+import pygame
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from EmotionEngine.components.EmComponents import EmSprite, EmVelocity
+from EmotionEngine.components.EmComponentStore import EmComponentStore
+from EmotionEngine.components.EmKinematicsSystem import EmKinematicsSystem
+from EmotionEngine.components.systems import movement_system, sprite_system
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmComponentsManager:
+    """
+    A manager class for the optional component/system layer of the engine.
+
+    Entities can carry typed components (any class, e.g. `EmVelocity`), stored per
+    type in dense arrays. Systems are functions registered for a set of component
+    types: once per frame, each system is called a single time with every matching
+    entity and their components, instead of one method call per entity. Tick
+    systems run after the entities' `on_tick`, draw systems after their `on_draw`,
+    for the entities seen by the camera.
+
+    The movement system (`EmVelocity`) and the sprite system (`EmSprite`) are
+    registered by default. Entities with many moving siblings can instead be moved
+    by the kinematics system (see `get_kinematics_system`), integrated in one NumPy
+    pass after the tick systems.
+    """
+
+    PHASES = ("tick", "draw")
+
+    def __init__(self) -> None:
+        self.__stores: Dict[type, EmComponentStore] = {}
+        self.__kinematics_system: EmKinematicsSystem = None
+        self.__systems: Dict[str, List[Tuple[Callable, Tuple[type, ...]]]] = {
+            phase: [] for phase in EmComponentsManager.PHASES
+        }
+
+        self.register_system(movement_system, (EmVelocity,), phase="tick")
+        self.register_system(sprite_system, (EmSprite,), phase="draw")
+
+    def register_system(
+        self, system: Callable, component_types: Tuple[type, ...], phase: str = "tick"
+    ):
+        """
+        Registers a system processing the entities having all the given components.
+
+        The system is called as `system(argument, entities, *components_lists)`, where
+        `argument` is the frame's time delta for tick systems or the drawing surface
+        for draw systems, and each components list is aligned with `entities`. Draw
+        systems are also given the camera's `offset` (the world position shown at the
+        surface's top left corner) and `zoom` as keyword arguments.
+
+        Args:
+            system (Callable): The system function.
+            component_types (Tuple[type, ...]): The component types the entities must
+                                                have to be processed.
+            phase (str): "tick" or "draw". Default is "tick".
+        """
+        assert phase in EmComponentsManager.PHASES
+        self.__systems[phase].append((system, tuple(component_types)))
+
+    def add_component(self, entity: "EmEntity", component: Any):
+        """
+        Adds a component to an entity, replacing its component of the same type.
+
+        Args:
+            entity (EmEntity): The entity to add the component to.
+            component (Any): The component to add.
+        """
+        self.__get_store(type(component)).add(entity, component)
+
+    def get_component(self, entity: "EmEntity", component_type: type) -> Any:
+        """
+        Returns the component of a given type of an entity.
+
+        Args:
+            entity (EmEntity): The entity owning the component.
+            component_type (type): The type of the component.
+
+        Returns:
+            Any: The component, or None if the entity has none of this type.
+        """
+        store = self.__stores.get(component_type)
+
+        if store is None:
+            return None
+
+        return store.get(entity)
+
+    def remove_component(self, entity: "EmEntity", component_type: type):
+        """
+        Removes the component of a given type from an entity, if it has one.
+
+        Args:
+            entity (EmEntity): The entity owning the component.
+            component_type (type): The type of the component.
+        """
+        store = self.__stores.get(component_type)
+
+        if store is not None:
+            store.remove(entity)
+
+    def remove_entity(self, entity: "EmEntity"):
+        """
+        Removes every component of an entity.
+
+        Args:
+            entity (EmEntity): The entity to remove the components of.
+        """
+        for store in self.__stores.values():
+            store.remove(entity)
+
+        if self.__kinematics_system is not None:
+            self.__kinematics_system.remove_entity(entity)
+
+    def get_kinematics_system(self) -> EmKinematicsSystem:
+        """
+        Returns the kinematics system, creating it on the first call.
+
+        Returns:
+            EmKinematicsSystem: The kinematics system.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if self.__kinematics_system is None:
+            self.__kinematics_system = EmKinematicsSystem()
+
+        return self.__kinematics_system
+
+    def run_systems(self, phase: str, argument: Any):
+        """
+        Runs the systems of a phase. Called by the engine once per frame with the
+        "tick" phase; the draw systems are run through `capture_draw_batches`.
+
+        Args:
+            phase (str): "tick" or "draw".
+            argument (Any): The time delta for "tick", the drawing surface for "draw".
+        """
+        for system, component_types in self.__systems[phase]:
+            joined = self.__join_stores(component_types)
+
+            if joined is not None:
+                system(argument, *joined)
+
+        if phase == "tick" and self.__kinematics_system is not None:
+            self.__kinematics_system.integrate(argument)
+
+    def capture_draw_batches(
+        self, drawn_entities: Dict[int, "EmEntity"]
+    ) -> List[Tuple[Callable, List["EmEntity"], List[List[Any]]]]:
+        """
+        Gathers the arguments of the draw systems, so they can be run later (and on
+        another thread) with `run_draw_batches`.
+
+        Args:
+            drawn_entities (Dict[int, EmEntity]): The entities to draw, by entity ID,
+                                                  which may be draw copies of the
+                                                  live entities. Other entities are
+                                                  skipped.
+
+        Returns:
+            List[Tuple[Callable, List[EmEntity], List[List[Any]]]]: The draw systems,
+                with their entities and components lists.
+        """
+        batches = []
+
+        for system, component_types in self.__systems["draw"]:
+            joined = self.__join_stores(component_types)
+
+            if joined is None:
+                continue
+
+            entities: List["EmEntity"] = []
+            components_lists: List[List[Any]] = [[] for _ in component_types]
+
+            for index, entity in enumerate(joined[0]):
+                drawn_entity = drawn_entities.get(entity.get_entity_id())
+
+                if drawn_entity is None:
+                    continue
+
+                entities.append(drawn_entity)
+
+                for components_list, components in zip(components_lists, joined[1:]):
+                    components_list.append(components[index])
+
+            if entities:
+                batches.append((system, entities, components_lists))
+
+        return batches
+
+    @staticmethod
+    def run_draw_batches(
+        surface: pygame.Surface,
+        batches: List[Tuple[Callable, List["EmEntity"], List[List[Any]]]],
+        offset: Tuple[float, float] = (0, 0),
+        zoom: float = 1.0,
+    ):
+        """
+        Runs the draw systems gathered by `capture_draw_batches`.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto.
+            batches (List[Tuple[Callable, List[EmEntity], List[List[Any]]]]): The
+                draw systems, with their entities and components lists.
+            offset (Tuple[float, float]): The world position shown at the surface's
+                                          top left corner. Default is (0, 0).
+            zoom (float): The number of surface pixels per world unit. Default is 1.
+        """
+        for system, entities, components_lists in batches:
+            system(surface, entities, *components_lists, offset=offset, zoom=zoom)
+
+    def __join_stores(
+        self, component_types: Tuple[type, ...]
+    ) -> Optional[Tuple[List["EmEntity"], ...]]:
+        """
+        Returns the entities having all the given components, followed by the lists
+        of their components (aligned with the entities), or None if there are none.
+        """
+        stores = [
+            self.__get_store(component_type) for component_type in component_types
+        ]
+
+        if len(stores) == 1:
+            if not stores[0].get_components():
+                return None
+
+            return stores[0].get_entities(), stores[0].get_components()
+
+        # Join the stores, starting from the smallest one
+        smallest_store = min(stores, key=lambda store: len(store.get_components()))
+        entities: List["EmEntity"] = []
+        components_lists: List[List[Any]] = [[] for _ in stores]
+
+        for entity in smallest_store.get_entities():
+            components = [store.get(entity) for store in stores]
+
+            if any(component is None for component in components):
+                continue
+
+            entities.append(entity)
+
+            for components_list, component in zip(components_lists, components):
+                components_list.append(component)
+
+        if not entities:
+            return None
+
+        return (entities, *components_lists)
+
+    def __get_store(self, component_type: type) -> EmComponentStore:
+        """
+        Returns the store of a component type, creating it if needed.
+        """
+        store = self.__stores.get(component_type)
+
+        if store is None:
+            store = self.__stores[component_type] = EmComponentStore(component_type)
+
+        return store
@@ -0,0 +1,359 @@
+from collections import deque
+from itertools import compress, repeat
+from operator import attrgetter, methodcaller, not_
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.types.EmVector2 import EmVector2, EmTrackedVector2
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+# Applied with `map`, so the positions, dirty flags and frozen states are gathered
+# without a Python loop
+get_dirty = attrgetter("dirty")
+is_frozen = methodcaller("is_frozen")
+
+
+class EmKinematicsSystem:
+    """
+    Integrates the motion of many entities in a single vectorized NumPy pass.
+
+    Each registered entity has a velocity, an acceleration and a damping factor,
+    stored with its position in preallocated arrays (one row per entity). Every step,
+    the positions are gathered from the entities in one bulk read, integrated with
+    semi-implicit Euler, optionally kept inside world bounds (reflecting off the
+    walls with a per-entity restitution), and only the positions that changed are
+    scattered back. Frozen entities are not moved.
+
+    Units are pixels and milliseconds: velocities in px/ms, accelerations in px/ms²
+    and damping as the fraction of velocity lost per millisecond.
+
+    Requires NumPy.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initializes the system and preallocates its arrays.
+
+        Args:
+            capacity (int): The initial number of entities the arrays can hold. The
+                            arrays grow as needed. Default is 64.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError(
+                "EmKinematicsSystem requires NumPy, install it with 'pip install numpy'"
+            )
+
+        self.__entities: List["EmEntity"] = []
+        self.__positions_vectors: List[EmTrackedVector2] = []
+        self.__positions_dicts: List[dict] = []
+        self.__indices: Dict[int, int] = {}
+        self.__bounds: Optional[AABB] = None
+        self.__wall_hits: List["EmEntity"] = []
+
+        capacity = max(capacity, 1)
+
+        self.__positions = numpy.zeros((capacity, 2))
+        self.__previous_positions = numpy.zeros((capacity, 2))
+        self.__velocities = numpy.zeros((capacity, 2))
+        self.__accelerations = numpy.zeros((capacity, 2))
+        self.__damping = numpy.zeros(capacity)
+        self.__restitution = numpy.ones(capacity)
+        self.__box_min = numpy.zeros((capacity, 2))
+        self.__box_max = numpy.zeros((capacity, 2))
+        self.__moving = numpy.zeros(capacity, dtype=bool)
+
+    def __grow(self):
+        """
+        Doubles the capacity of the arrays, keeping the rows of the registered entities.
+        """
+
+        def grow(array: "numpy.ndarray") -> "numpy.ndarray":
+            grown = numpy.zeros((len(array) * 2,) + array.shape[1:], dtype=array.dtype)
+            grown[: len(array)] = array
+            return grown
+
+        self.__positions = grow(self.__positions)
+        self.__previous_positions = grow(self.__previous_positions)
+        self.__velocities = grow(self.__velocities)
+        self.__accelerations = grow(self.__accelerations)
+        self.__damping = grow(self.__damping)
+        self.__restitution = grow(self.__restitution)
+        self.__box_min = grow(self.__box_min)
+        self.__box_max = grow(self.__box_max)
+        self.__moving = grow(self.__moving)
+
+    def add_entity(
+        self,
+        entity: "EmEntity",
+        velocity: Tuple[float, float] = (0.0, 0.0),
+        acceleration: Tuple[float, float] = (0.0, 0.0),
+        damping: float = 0.0,
+        restitution: float = 1.0,
+    ):
+        """
+        Registers an entity, or updates its motion if it is already registered.
+
+        The entity's bounding box is read once here and used to keep the whole box
+        inside the bounds; call `add_entity` again if it changes.
+
+        Args:
+            entity (EmEntity): The entity to move.
+            velocity (Tuple[float, float]): The velocity, in px/ms. Default is (0, 0).
+            acceleration (Tuple[float, float]): The acceleration, in px/ms².
+                                                Default is (0, 0).
+            damping (float): The fraction of velocity lost per millisecond, in [0, 1[.
+                             Default is 0.
+            restitution (float): The fraction of velocity kept when bouncing off a
+                                 wall: 1 reflects perfectly, 0 stops the entity
+                                 against the wall. Default is 1.
+        """
+        assert 0 <= damping < 1
+
+        entity_id = entity.get_entity_id()
+        index = self.__indices.get(entity_id)
+
+        if index is None:
+            index = len(self.__entities)
+
+            if index == len(self.__damping):
+                self.__grow()
+
+            self.__indices[entity_id] = index
+            self.__entities.append(entity)
+            position_vector = entity.retrieve_pos()
+            self.__positions_vectors.append(position_vector)
+            self.__positions_dicts.append(position_vector.__dict__)
+
+        bbox = entity.get_bounding_box()
+
+        self.__velocities[index] = velocity
+        self.__accelerations[index] = acceleration
+        self.__damping[index] = damping
+        self.__restitution[index] = restitution
+        self.__box_min[index] = (bbox.left, bbox.bottom)
+        self.__box_max[index] = (bbox.right, bbox.top)
+
+    def remove_entity(self, entity: "EmEntity"):
+        """
+        Unregisters an entity, if it is registered. The entity keeps its position.
+
+        Args:
+            entity (EmEntity): The entity to stop moving.
+        """
+        index = self.__indices.pop(entity.get_entity_id(), None)
+
+        if index is None:
+            return
+
+        last_index = len(self.__entities) - 1
+        last_entity = self.__entities.pop()
+        last_position_vector = self.__positions_vectors.pop()
+        last_position_dict = self.__positions_dicts.pop()
+
+        if index < last_index:
+            self.__entities[index] = last_entity
+            self.__positions_vectors[index] = last_position_vector
+            self.__positions_dicts[index] = last_position_dict
+            self.__indices[last_entity.get_entity_id()] = index
+
+            for array in (
+                self.__velocities,
+                self.__accelerations,
+                self.__damping,
+                self.__restitution,
+                self.__box_min,
+                self.__box_max,
+            ):
+                array[index] = array[last_index]
+
+    def has_entity(self, entity: "EmEntity") -> bool:
+        """
+        Checks whether an entity is registered.
+
+        Args:
+            entity (EmEntity): The entity to check.
+
+        Returns:
+            bool: True if the system moves the entity.
+        """
+        return entity.get_entity_id() in self.__indices
+
+    def get_velocity(self, entity: "EmEntity") -> EmVector2:
+        """
+        Returns a copy of the velocity of a registered entity.
+
+        Args:
+            entity (EmEntity): The registered entity.
+
+        Returns:
+            EmVector2: The entity's velocity, in px/ms.
+        """
+        vx, vy = self.__velocities[self.__indices[entity.get_entity_id()]]
+        return EmVector2(float(vx), float(vy))
+
+    def set_velocity(self, entity: "EmEntity", velocity: Tuple[float, float]):
+        """
+        Sets the velocity of a registered entity.
+
+        Args:
+            entity (EmEntity): The registered entity.
+            velocity (Tuple[float, float]): The new velocity, in px/ms.
+        """
+        self.__velocities[self.__indices[entity.get_entity_id()]] = velocity
+
+    def set_acceleration(self, entity: "EmEntity", acceleration: Tuple[float, float]):
+        """
+        Sets the acceleration of a registered entity.
+
+        Args:
+            entity (EmEntity): The registered entity.
+            acceleration (Tuple[float, float]): The new acceleration, in px/ms².
+        """
+        self.__accelerations[self.__indices[entity.get_entity_id()]] = acceleration
+
+    def set_bounds(self, bounds: Optional[AABB]):
+        """
+        Sets the world bounds the entities' bounding boxes are kept in.
+
+        Args:
+            bounds (Optional[AABB]): The bounds (with `bottom` as the smallest y), or
+                                     None to let entities move freely.
+        """
+        self.__bounds = bounds
+
+    def get_wall_hits(self) -> List["EmEntity"]:
+        """
+        Returns the entities that hit a wall of the bounds during the last step.
+
+        Returns:
+            List[EmEntity]: The entities that hit a wall.
+        """
+        return self.__wall_hits
+
+    def integrate(self, dt: float):
+        """
+        Moves every registered, non-frozen entity. Called by the components manager
+        once per frame, after the tick systems.
+
+        Args:
+            dt (float): The time delta since the last frame, in milliseconds.
+        """
+        count = len(self.__entities)
+        self.__wall_hits = []
+
+        if count == 0:
+            return
+
+        # Entities keep the same position vector for their whole life. Components
+        # are read and written straight from the vectors' dicts, much faster than
+        # their attributes, and the written vectors are marked dirty afterwards
+        positions_vectors = self.__positions_vectors
+        positions_dicts = self.__positions_dicts
+
+        moving = self.__moving[:count]
+        numpy.logical_not(
+            numpy.fromiter(map(is_frozen, self.__entities), dtype=bool, count=count),
+            out=moving,
+        )
+
+        positions = self.__positions[:count]
+
+        for axis, component in enumerate(("x", "y")):
+            positions[:, axis] = numpy.fromiter(
+                map(dict.__getitem__, positions_dicts, repeat(component)),
+                dtype=float,
+                count=count,
+            )
+
+        previous_positions = self.__previous_positions[:count]
+        numpy.copyto(previous_positions, positions)
+
+        velocities = self.__velocities[:count]
+        mask = moving[:, None]
+
+        # Semi-implicit Euler: the new velocity moves the entity
+        numpy.add(
+            velocities, self.__accelerations[:count] * dt, out=velocities, where=mask
+        )
+        numpy.multiply(
+            velocities,
+            ((1 - self.__damping[:count]) ** dt)[:, None],
+            out=velocities,
+            where=mask,
+        )
+        numpy.add(positions, velocities * dt, out=positions, where=mask)
+
+        if self.__bounds is not None:
+            self.__apply_bounds(count, positions, velocities, mask)
+
+        # Entities at rest are not written, so they are not marked as moved
+        changed = (positions != previous_positions).any(axis=1)
+        changed_positions = positions[changed]
+        changed_flags = changed.tolist()
+
+        changed_vectors = list(compress(positions_vectors, changed_flags))
+        clean_vectors = list(
+            compress(changed_vectors, map(not_, map(get_dirty, changed_vectors)))
+        )
+
+        changed_dicts = list(compress(positions_dicts, changed_flags))
+
+        for axis, component in enumerate(("x", "y")):
+            deque(
+                map(
+                    dict.__setitem__,
+                    changed_dicts,
+                    repeat(component),
+                    changed_positions[:, axis].tolist(),
+                ),
+                maxlen=0,
+            )
+
+        for vector in clean_vectors:
+            vector.mark_dirty()
+
+    def __apply_bounds(
+        self,
+        count: int,
+        positions: "numpy.ndarray",
+        velocities: "numpy.ndarray",
+        mask: "numpy.ndarray",
+    ):
+        """
+        Reflects the entities whose bounding box crossed a wall back into the bounds.
+        """
+        bounds = self.__bounds
+        low = numpy.array((bounds.left, bounds.bottom)) - self.__box_min[:count]
+        high = numpy.array((bounds.right, bounds.top)) - self.__box_max[:count]
+
+        below = (positions < low) & mask
+        above = (positions > high) & mask
+        hits = below | above
+
+        if not hits.any():
+            return
+
+        restitution = self.__restitution[:count, None]
+
+        # Reflect the overshoot (scaled by the restitution), then clamp in case it
+        # exceeds the size of the bounds
+        numpy.copyto(positions, low + (low - positions) * restitution, where=below)
+        numpy.copyto(positions, high + (high - positions) * restitution, where=above)
+        numpy.clip(positions, low, numpy.maximum(low, high), out=positions)
+
+        bounced = numpy.where(below, numpy.abs(velocities), -numpy.abs(velocities))
+        numpy.copyto(velocities, bounced * restitution, where=hits)
+
+        self.__wall_hits = [
+            self.__entities[index] for index in numpy.flatnonzero(hits.any(axis=1))
+        ]
@@ -0,0 +1,5 @@
+from .EmComponents import *
+from .EmComponentStore import *
+from .systems import *
+from .EmKinematicsSystem import *
+from .EmComponentsManager import *
@@ -0,0 +1,88 @@
+import math
+import weakref
+import pygame
+
+from typing import List, Tuple, TYPE_CHECKING
+
+from EmotionEngine.components.EmComponents import EmSprite, EmVelocity
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+# Sprite images scaled by `sprite_system`, with the zoom they were scaled for
+_scaled_images = weakref.WeakKeyDictionary()
+
+
+def movement_system(
+    dt: float, entities: List["EmEntity"], velocities: List[EmVelocity]
+):
+    """
+    Moves every non-frozen entity with an `EmVelocity` component.
+
+    Args:
+        dt (float): The time delta since the last frame, in milliseconds.
+        entities (List[EmEntity]): The entities to move.
+        velocities (List[EmVelocity]): The entities' velocities.
+    """
+    for entity, velocity in zip(entities, velocities):
+        if entity.is_frozen():
+            continue
+
+        pos = entity.retrieve_pos()
+        pos.x += velocity.x * dt
+        pos.y += velocity.y * dt
+
+
+def sprite_system(
+    surface: pygame.Surface,
+    entities: List["EmEntity"],
+    sprites: List[EmSprite],
+    offset: Tuple[float, float] = (0, 0),
+    zoom: float = 1.0,
+):
+    """
+    Draws every entity with an `EmSprite` component, with a single `blits` call.
+
+    Args:
+        surface (pygame.Surface): The surface to draw onto.
+        entities (List[EmEntity]): The entities to draw.
+        sprites (List[EmSprite]): The entities' sprites.
+        offset (Tuple[float, float]): The world position shown at the surface's top
+                                      left corner. Default is (0, 0).
+        zoom (float): The number of surface pixels per world unit. Default is 1.
+    """
+    offset_x, offset_y = offset
+    blits = []
+
+    for entity, sprite in zip(entities, sprites):
+        pos = entity.retrieve_pos()
+        image = sprite.image if zoom == 1 else _get_scaled_image(sprite.image, zoom)
+
+        blits.append(
+            (
+                image,
+                (
+                    (pos.x + sprite.offset_x - offset_x) * zoom,
+                    (pos.y + sprite.offset_y - offset_y) * zoom,
+                ),
+            )
+        )
+
+    surface.blits(blits, doreturn=False)
+
+
+def _get_scaled_image(image: pygame.Surface, zoom: float) -> pygame.Surface:
+    """
+    Returns an image scaled by a zoom, scaling it again only when the zoom changes.
+    """
+    scaled = _scaled_images.get(image)
+
+    if scaled is None or scaled[0] != zoom:
+        scaled_image = pygame.transform.scale(
+            image,
+            (math.ceil(image.get_width() * zoom), math.ceil(image.get_height() * zoom)),
+        )
+        scaled = (zoom, scaled_image)
+        _scaled_images[image] = scaled
+
+    return scaled[1]
@@ -1,18 +1,27 @@
-from typing import List
+import struct
+
+from typing import Dict, List, Tuple
 
 from EmotionEngine.entity.EmEntity import EmEntity
 
+# Snapshot layout: entities count, then for each entity its id, position, frozen
+# flag and the fields declared in its class's SNAPSHOT_FIELDS
+SNAPSHOT_HEADER = struct.Struct("<I")
+SNAPSHOT_ENTITY_FORMAT = "<IddB"
+
 
 class EmEntitiesManager:
     """
     A manager class responsible for handling a collection of instantiated entities.
 
     This class allows for adding new entities, retrieving them by name,
-    and querying the total number of entities in the system.
+    and querying the total number of entities in the system. The state of the
+    entities can be saved to and restored from a compact binary snapshot.
     """
 
     def __init__(self) -> None:
         self.__instanciated_entities: List[EmEntity] = []
+        self.__snapshot_structs: Dict[type, struct.Struct] = {}
 
     def append(self, new_entity: EmEntity):
         """
@@ -23,6 +32,15 @@ class EmEntitiesManager:
         """
         self.__instanciated_entities.append(new_entity)
 
+    def remove(self, entity: EmEntity):
+        """
+        Removes an entity from the manager's collection of instantiated entities.
+
+        Args:
+            entity (EmEntity): The entity to be removed from the collection.
+        """
+        self.__instanciated_entities.remove(entity)
+
     def count(self) -> int:
         """
         Returns the total number of instantiated entities managed by this instance.
@@ -62,3 +80,109 @@ class EmEntitiesManager:
                 break
 
         return result
+
+    def take_snapshot(self, position_step: float = 0) -> bytes:
+        """
+        Saves the position, frozen flag and declared snapshot fields of every entity.
+
+        Args:
+            position_step (float): If not 0, positions are rounded to a multiple of
+                                   this step, which makes snapshots compress better
+                                   (e.g. to be sent over the network). Default is 0.
+
+        Returns:
+            bytes: The snapshot, to be passed to `restore_snapshot`.
+        """
+        entities = self.__instanciated_entities
+        records = [SNAPSHOT_HEADER.pack(len(entities))]
+
+        for entity in entities:
+            pos = entity.retrieve_pos()
+            x, y = pos.x, pos.y
+
+            if position_step:
+                x = round(x / position_step) * position_step
+                y = round(y / position_step) * position_step
+
+            values = [entity.get_entity_id(), x, y, entity.is_frozen()]
+
+            for field_name, field_format in entity.SNAPSHOT_FIELDS:
+                value = getattr(entity, field_name)
+
+                if len(field_format) == 1:
+                    values.append(value)
+                else:
+                    values.extend(value.get_state())
+
+            records.append(self.__get_snapshot_struct(type(entity)).pack(*values))
+
+        return b"".join(records)
+
+    def restore_snapshot(self, snapshot: bytes):
+        """
+        Restores the state saved by `take_snapshot` into the existing entities, in
+        place. Entities spawned after the snapshot was taken are left untouched.
+
+        Args:
+            snapshot (bytes): The snapshot to restore.
+
+        Raises:
+            ValueError: If an entity of the snapshot no longer exists. Nothing is
+                        restored then.
+        """
+        entities_by_id = {
+            entity.get_entity_id(): entity for entity in self.__instanciated_entities
+        }
+
+        (entities_count,) = SNAPSHOT_HEADER.unpack_from(snapshot, 0)
+        offset = SNAPSHOT_HEADER.size
+
+        # Decode every record first, so that a missing entity leaves the world as is
+        records: List[Tuple[EmEntity, tuple]] = []
+
+        for _ in range(entities_count):
+            entity_id = struct.unpack_from("<I", snapshot, offset)[0]
+            entity = entities_by_id.get(entity_id)
+
+            if entity is None:
+                raise ValueError(f"Snapshot entity {entity_id} no longer exists")
+
+            snapshot_struct = self.__get_snapshot_struct(type(entity))
+            records.append((entity, snapshot_struct.unpack_from(snapshot, offset)))
+            offset += snapshot_struct.size
+
+        for entity, (_, x, y, frozen, *values) in records:
+            pos = entity.retrieve_pos()
+            pos.x = x
+            pos.y = y
+            entity.set_frozen(bool(frozen))
+
+            value_index = 0
+
+            for field_name, field_format in entity.SNAPSHOT_FIELDS:
+                values_count = len(field_format)
+
+                if values_count == 1:
+                    setattr(entity, field_name, values[value_index])
+                else:
+                    getattr(entity, field_name).set_state(
+                        tuple(values[value_index : value_index + values_count])
+                    )
+
+                value_index += values_count
+
+    def __get_snapshot_struct(self, entity_class: type) -> struct.Struct:
+        """
+        Returns the compiled snapshot record layout of an entity class.
+        """
+        snapshot_struct = self.__snapshot_structs.get(entity_class)
+
+        if snapshot_struct is None:
+            snapshot_struct = self.__snapshot_structs[entity_class] = struct.Struct(
+                SNAPSHOT_ENTITY_FORMAT
+                + "".join(
+                    field_format for _, field_format in entity_class.SNAPSHOT_FIELDS
+                )
+            )
+
+        return snapshot_struct
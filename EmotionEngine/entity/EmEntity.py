@@ -1,8 +1,18 @@
 import pygame
 
-from EmotionEngine.types.EmVector2 import EmVector2
+from functools import partial
+from typing import Callable, Coroutine, Optional, Tuple
+
+from EmotionEngine.types.EmVector2 import EmVector2, EmTrackedVector2
 from EmotionEngine.entity.EmEntityHelper import EmEntityHelper
 from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.behaviors.EmAwaitables import (
+    EmWaitCollision,
+    EmWaitFrame,
+    EmWaitTime,
+)
+from EmotionEngine.behaviors.EmBehavior import EmBehavior
+from EmotionEngine.utils.EmGameClock import EmGameClock
 
 
 class EmEntity:
@@ -12,15 +22,31 @@ class EmEntity:
 
     This class provides methods for managing the entity's state, including setting
     its ID, name, position, and handling interactions like movement, drawing, and collision.
+
+    Attributes:
+        SNAPSHOT_FIELDS (Tuple[Tuple[str, str], ...]): The attributes saved in world
+            snapshots along with the position and frozen flag, as (attribute name,
+            `struct` format character) pairs, e.g. (("speed", "d"), ("score", "i")).
+            A format of several characters (one per value) declares an object
+            saved through its `get_state` and `set_state` methods, such as
+            ("start_timer", EmTimer.STATE_FORMAT).
     """
 
+    SNAPSHOT_FIELDS: Tuple[Tuple[str, str], ...] = ()
+
     def __init__(self, creation_data: dict) -> None:
         self.__creation_data = creation_data
         self.__entity_id: int = None
         self.__entity_name: str = None
         self.__helper: EmEntityHelper = None
-        self.__pos = EmVector2(0, 0)
+        self.__pos = EmTrackedVector2(0, 0)
+        self.__local_bounding_box: AABB = None
+        self.__positioned_bounding_box: AABB = None
+        self.__moved_listener: Optional[Callable[[], None]] = None
         self.__frozen = False
+        self.__ticked_offscreen = True
+        self.__collision_layer = 0
+        self.__collision_mask = 0
 
     def retrieve_creation_data(self) -> dict:
         """
@@ -41,6 +67,19 @@ class EmEntity:
         assert self.__entity_id is None
         self.__entity_id = new_entity_id
 
+    def get_entity_id(self) -> int:
+        """
+        Retrieves the entity's unique ID.
+
+        Returns:
+            int: The unique identifier of the entity.
+
+        Raises:
+            AssertionError: If the entity ID has not been set.
+        """
+        assert self.__entity_id is not None
+        return self.__entity_id
+
     def set_entity_name(self, new_name: str):
         """
         Sets the entity's name if it hasn't been set already.
@@ -91,15 +130,22 @@ class EmEntity:
         """
         Sets the entity's position.
 
+        The components are copied into the entity's own position vector, so later
+        changes to `new_pos` do not move the entity.
+
         Args:
             new_pos (EmVector2): The new position to assign to the entity.
         """
-        self.__pos = new_pos
+        self.__pos.x = new_pos.x
+        self.__pos.y = new_pos.y
 
     def retrieve_pos(self) -> EmVector2:
         """
         Retrieves the entity's current position.
 
+        The returned vector may be mutated in place to move the entity; writes are
+        tracked so cached values such as the positioned bounding box stay valid.
+
         Returns:
             EmVector2: The entity's current position as a 2D vector.
         """
@@ -124,15 +170,69 @@ class EmEntity:
         """
         A method called to draw the entity on the provided surface.
 
+        Not called while the entity's positioned bounding box is out of the camera's
+        view; entities with an empty bounding box are always drawn. Entities drawing
+        in world coordinates convert them with the camera (see `EmCamera`).
+
         Args:
             surface (pygame.display): The surface to draw the entity onto.
         """
 
+    def create_draw_copy(self) -> "EmEntity":
+        """
+        Creates a copy of the entity for drawing, while the live entity keeps being
+        updated (see `EmEngine.enable_pipelining`).
+
+        The copy shares the values of the entity's attributes, so attributes that are
+        reassigned by `on_tick` keep their drawn value, and has its own position. It
+        has no helper: the engine gives it one seeing the frame's camera.
+        Entities whose `on_draw` reads containers mutated in place by `on_tick` should
+        override this method to copy them as well.
+
+        Returns:
+            EmEntity: The copy, whose `on_draw` draws the entity as it is now.
+        """
+        draw_copy = object.__new__(type(self))
+        draw_copy.__dict__.update(self.__dict__)
+        draw_copy.__pos = EmTrackedVector2(self.__pos.x, self.__pos.y)
+        draw_copy.__helper = None
+        draw_copy.__moved_listener = None
+
+        return draw_copy
+
+    def on_collision_enter(self, other: "EmEntity"):
+        """
+        A method called by the engine's collision pass when this entity starts
+        overlapping another entity.
+
+        Args:
+            other (EmEntity): The entity this entity collided with.
+        """
+
+    def on_collision_stay(self, other: "EmEntity"):
+        """
+        A method called by the engine's collision pass on every frame this entity
+        keeps overlapping another entity.
+
+        Args:
+            other (EmEntity): The entity this entity is colliding with.
+        """
+
+    def on_collision_exit(self, other: "EmEntity"):
+        """
+        A method called by the engine's collision pass when this entity stops
+        overlapping another entity.
+
+        Args:
+            other (EmEntity): The entity this entity was colliding with.
+        """
+
     def get_bounding_box(self) -> AABB:
         """
         Returns the entity's axis-aligned bounding box (AABB).
 
         This method can be overridden to provide a specific bounding box for the entity.
+        Its result is cached: call `invalidate_bounding_box` when it changes.
 
         Returns:
             AABB: The entity's bounding box.
@@ -144,20 +244,63 @@ class EmEntity:
         Returns the entity's bounding box, adjusted by its current position.
 
         Combines the entity's position with its local bounding box to get the
-        positioned bounding box in world coordinates.
+        positioned bounding box in world coordinates. The result is cached until the
+        position changes or `invalidate_bounding_box` is called, so it must not be
+        modified by the caller.
 
         Returns:
             AABB: The positioned bounding box of the entity.
         """
-        pos = self.retrieve_pos()
-        bbox = self.get_bounding_box()
+        pos = self.__pos
 
-        return AABB(
-            pos.x + bbox.left,
-            pos.y + bbox.bottom,
-            pos.x + bbox.right,
-            pos.y + bbox.top,
-        )
+        if pos.dirty or self.__positioned_bounding_box is None:
+            bbox = self.__local_bounding_box
+
+            if bbox is None:
+                bbox = self.__local_bounding_box = self.get_bounding_box()
+
+            self.__positioned_bounding_box = AABB(
+                pos.x + bbox.left,
+                pos.y + bbox.bottom,
+                pos.x + bbox.right,
+                pos.y + bbox.top,
+            )
+            pos.clear_dirty()
+
+        return self.__positioned_bounding_box
+
+    def invalidate_bounding_box(self):
+        """
+        Discards the cached bounding boxes of the entity.
+
+        Must be called whenever the value returned by `get_bounding_box` changes
+        (e.g. the entity was resized), as it is only queried again after this call.
+        """
+        self.__local_bounding_box = None
+        self.__positioned_bounding_box = None
+
+        if self.__moved_listener is not None:
+            self.__moved_listener()
+
+    def set_moved_listener(
+        self, new_moved_listener: Optional[Callable[["EmEntity"], None]]
+    ):
+        """
+        Sets the function called with the entity when its positioned bounding box may
+        have changed: on the first write to its position after the box was computed,
+        and when `invalidate_bounding_box` is called. Used by the engine to keep its
+        spatial index up to date.
+
+        Args:
+            new_moved_listener (Optional[Callable[[EmEntity], None]]): The function,
+                                                                     or None.
+        """
+        if new_moved_listener is None:
+            self.__moved_listener = None
+        else:
+            self.__moved_listener = partial(new_moved_listener, self)
+
+        self.__pos.set_listener(self.__moved_listener)
 
     def collide_with(self, other: "EmEntity"):
         """
@@ -193,3 +336,171 @@ class EmEntity:
             new_frozen (bool): The new frozen state to assign to the entity.
         """
         self.__frozen = new_frozen
+
+    def is_ticked_offscreen(self) -> bool:
+        """
+        Checks whether the entity is updated while it is out of the camera's view.
+
+        Returns:
+            bool: True if `on_tick` is called whatever the entity's visibility.
+        """
+        return self.__ticked_offscreen
+
+    def set_ticked_offscreen(self, new_ticked_offscreen: bool):
+        """
+        Sets whether the entity is updated while it is out of the camera's view.
+
+        When False, `on_tick` is only called on frames where the entity's positioned
+        bounding box was visible in the previous frame. Entities with an empty
+        bounding box are always visible. Visibility depends on the local camera, so
+        this must stay True for entities of networked games.
+
+        Args:
+            new_ticked_offscreen (bool): False to skip `on_tick` while off-screen.
+        """
+        self.__ticked_offscreen = new_ticked_offscreen
+
+    def get_collision_layer(self) -> int:
+        """
+        Retrieves the collision layers this entity belongs to, as a bit field.
+
+        Returns:
+            int: The entity's collision layer bits (0 if it is not collidable).
+        """
+        return self.__collision_layer
+
+    def set_collision_layer(self, new_layer: int):
+        """
+        Sets the collision layers this entity belongs to, as a bit field.
+
+        Entities with both a layer and a mask of 0 are skipped by the engine's
+        collision pass.
+
+        Args:
+            new_layer (int): The new collision layer bits.
+        """
+        self.__collision_layer = new_layer
+
+    def get_collision_mask(self) -> int:
+        """
+        Retrieves the collision layers this entity reacts to, as a bit field.
+
+        Returns:
+            int: The entity's collision mask bits.
+        """
+        return self.__collision_mask
+
+    def set_collision_mask(self, new_mask: int):
+        """
+        Sets the collision layers this entity reacts to, as a bit field.
+
+        Two entities are tested against each other if either one's mask includes
+        the other's layer, and each one receives the collision callbacks only if its
+        own mask includes the other's layer.
+
+        Args:
+            new_mask (int): The new collision mask bits.
+        """
+        self.__collision_mask = new_mask
+
+    def add_component(self, component: any):
+        """
+        Adds a component to the entity, processed by the systems registered in the
+        components manager. Replaces the entity's component of the same type.
+
+        Must be called once the entity is spawned (e.g. in `on_begin_play`).
+
+        Args:
+            component (any): The component to add (e.g. an `EmVelocity`).
+        """
+        self.retrieve_helper().retrieve_components_manager().add_component(
+            self, component
+        )
+
+    def get_component(self, component_type: type) -> any:
+        """
+        Retrieves the entity's component of a given type.
+
+        Args:
+            component_type (type): The type of the component.
+
+        Returns:
+            any: The component, or None if the entity has none of this type.
+        """
+        return (
+            self.retrieve_helper()
+            .retrieve_components_manager()
+            .get_component(self, component_type)
+        )
+
+    def remove_component(self, component_type: type):
+        """
+        Removes the entity's component of a given type, if it has one.
+
+        Args:
+            component_type (type): The type of the component.
+        """
+        self.retrieve_helper().retrieve_components_manager().remove_component(
+            self, component_type
+        )
+
+    def start_behavior(self, coroutine: Coroutine) -> EmBehavior:
+        """
+        Starts an `async` behavior, run by the engine's frame loop instead of polling
+        state in `on_tick`. It runs right away until its first `await`, e.g.:
+
+            async def serve(self):
+                await self.sleep(1500)
+                self.launch()
+                other = await self.collision()
+
+            def on_begin_play(self):
+                self.start_behavior(self.serve())
+
+        Must be called once the entity is spawned (e.g. in `on_begin_play`).
+
+        Args:
+            coroutine (Coroutine): The coroutine to run.
+
+        Returns:
+            EmBehavior: The behavior, which can be cancelled.
+        """
+        return (
+            self.retrieve_helper().retrieve_behaviors_scheduler().start(self, coroutine)
+        )
+
+    def next_frame(self) -> EmWaitFrame:
+        """
+        Returns an awaitable resuming a behavior on the next frame.
+
+        Returns:
+            EmWaitFrame: The awaitable, resolving to the frame's time delta.
+        """
+        return EmWaitFrame()
+
+    def sleep(self, delay_ms: float) -> EmWaitTime:
+        """
+        Returns an awaitable resuming a behavior once some game time has passed.
+
+        Args:
+            delay_ms (float): The delay, in milliseconds of game time.
+
+        Returns:
+            EmWaitTime: The awaitable, resolving to the game time it resumed at.
+        """
+        return EmWaitTime(EmGameClock.get_milli_time() + delay_ms)
+
+    def collision(self, other: Optional["EmEntity"] = None) -> EmWaitCollision:
+        """
+        Returns an awaitable resuming a behavior when this entity starts colliding.
+
+        Args:
+            other (Optional[EmEntity]): The entity to wait for. Default is None (any
+                                        entity).
+
+        Returns:
+            EmWaitCollision: The awaitable, resolving to the other entity.
+        """
+        return EmWaitCollision(
+            self.get_entity_id(), None if other is None else other.get_entity_id()
+        )
@@ -4,8 +4,20 @@ if TYPE_CHECKING:
     from EmotionEngine.entity.EmEntitiesManager import EmEntitiesManager
     from EmotionEngine.EmWindowManager import EmWindowManager
     from EmotionEngine.EmKeyboardManager import EmKeyboardManager
+    from EmotionEngine.EmInputsManager import EmInputsManager
     from EmotionEngine.sound.EmSoundsManager import EmSoundsManager
     from EmotionEngine.text.EmFontsManager import EmFontsManager
+    from EmotionEngine.image.EmImagesManager import EmImagesManager
+    from EmotionEngine.tilemap.EmTilemapsManager import EmTilemapsManager
+    from EmotionEngine.collisions.EmCollisionsManager import EmCollisionsManager
+    from EmotionEngine.profiling.EmMemoryProfiler import EmMemoryProfiler
+    from EmotionEngine.components.EmComponentsManager import EmComponentsManager
+    from EmotionEngine.particles.EmParticlesManager import EmParticlesManager
+    from EmotionEngine.camera.EmCamera import EmCamera
+    from EmotionEngine.behaviors.EmBehaviorsScheduler import EmBehaviorsScheduler
+    from EmotionEngine.log.EmLogger import EmLogger
+    from EmotionEngine.log.EmLogsManager import EmLogsManager
+    from EmotionEngine.metrics.EmMetricsRegistry import EmMetricsRegistry
 
 
 class EmEntityHelper:
@@ -22,14 +34,36 @@ class EmEntityHelper:
         entities_manager: "EmEntitiesManager",
         window_manager: "EmWindowManager",
         keyboard_manager: "EmKeyboardManager",
+        inputs_manager: "EmInputsManager",
         sounds_manager: "EmSoundsManager",
         fonts_manager: "EmFontsManager",
+        images_manager: "EmImagesManager",
+        tilemaps_manager: "EmTilemapsManager",
+        collisions_manager: "EmCollisionsManager",
+        memory_profiler: "EmMemoryProfiler",
+        components_manager: "EmComponentsManager",
+        particles_manager: "EmParticlesManager",
+        camera: "EmCamera",
+        behaviors_scheduler: "EmBehaviorsScheduler",
+        logs_manager: "EmLogsManager",
+        metrics: "EmMetricsRegistry",
     ) -> None:
         self.__entities_manager = entities_manager
         self.__window_manager = window_manager
         self.__keyboard_manager = keyboard_manager
+        self.__inputs_manager = inputs_manager
         self.__sounds_manager = sounds_manager
         self.__fonts_manager = fonts_manager
+        self.__images_manager = images_manager
+        self.__tilemaps_manager = tilemaps_manager
+        self.__collisions_manager = collisions_manager
+        self.__memory_profiler = memory_profiler
+        self.__components_manager = components_manager
+        self.__particles_manager = particles_manager
+        self.__camera = camera
+        self.__behaviors_scheduler = behaviors_scheduler
+        self.__logs_manager = logs_manager
+        self.__metrics = metrics
 
     def get_window_width(self) -> int:
         """
@@ -67,6 +101,16 @@ class EmEntityHelper:
         """
         return self.__keyboard_manager
 
+    def retrieve_inputs_manager(self) -> "EmInputsManager":
+        """
+        Retrieves the inputs manager, holding the players' inputs of the frame being
+        simulated (used by networked games).
+
+        Returns:
+            EmInputsManager: The inputs manager instance.
+        """
+        return self.__inputs_manager
+
     def retrieve_sounds_manager(self) -> "EmSoundsManager":
         """
         Retrieves the sounds manager, responsible for handling in-game sounds.
@@ -84,3 +128,96 @@ class EmEntityHelper:
             EmFontsManager: The fonts manager instance.
         """
         return self.__fonts_manager
+
+    def retrieve_images_manager(self) -> "EmImagesManager":
+        """
+        Retrieves the images manager, responsible for loading and caching images.
+
+        Returns:
+            EmImagesManager: The images manager instance.
+        """
+        return self.__images_manager
+
+    def retrieve_tilemaps_manager(self) -> "EmTilemapsManager":
+        """
+        Retrieves the tilemaps manager, holding the tilemaps declared by the levels.
+
+        Returns:
+            EmTilemapsManager: The tilemaps manager instance.
+        """
+        return self.__tilemaps_manager
+
+    def retrieve_collisions_manager(self) -> "EmCollisionsManager":
+        """
+        Retrieves the collisions manager, responsible for the per-frame collision pass.
+
+        Returns:
+            EmCollisionsManager: The collisions manager instance.
+        """
+        return self.__collisions_manager
+
+    def retrieve_memory_profiler(self) -> "EmMemoryProfiler":
+        """
+        Retrieves the memory profiler, which can be switched on and off at runtime.
+
+        Returns:
+            EmMemoryProfiler: The memory profiler instance.
+        """
+        return self.__memory_profiler
+
+    def retrieve_components_manager(self) -> "EmComponentsManager":
+        """
+        Retrieves the components manager, responsible for components and systems.
+
+        Returns:
+            EmComponentsManager: The components manager instance.
+        """
+        return self.__components_manager
+
+    def retrieve_particles_manager(self) -> "EmParticlesManager":
+        """
+        Retrieves the particles manager, creating and drawing the particle emitters.
+
+        Returns:
+            EmParticlesManager: The particles manager instance.
+        """
+        return self.__particles_manager
+
+    def retrieve_camera(self) -> "EmCamera":
+        """
+        Retrieves the camera, converting world positions to screen positions.
+
+        Returns:
+            EmCamera: The engine's camera.
+        """
+        return self.__camera
+
+    def retrieve_behaviors_scheduler(self) -> "EmBehaviorsScheduler":
+        """
+        Retrieves the behaviors scheduler, running the entities' `async` behaviors.
+
+        Returns:
+            EmBehaviorsScheduler: The behaviors scheduler instance.
+        """
+        return self.__behaviors_scheduler
+
+    def retrieve_logger(self, name: str) -> "EmLogger":
+        """
+        Retrieves the logger of a subsystem, e.g. the entity's game system.
+
+        Args:
+            name (str): The name of the subsystem.
+
+        Returns:
+            EmLogger: The logger, created on the first call.
+        """
+        return self.__logs_manager.get_logger(name)
+
+    def retrieve_metrics(self) -> "EmMetricsRegistry":
+        """
+        Retrieves the runtime metrics registry, to record the game's own metrics.
+
+        Returns:
+            EmMetricsRegistry: The engine's metrics registry.
+        """
+        return self.__metrics
@@ -0,0 +1,365 @@
+import time
+import heapq
+import pygame
+import threading
+
+from operator import itemgetter
+from typing import Dict, List, TYPE_CHECKING
+
+from EmotionEngine.text.EmGlyphCache import EmGlyphCache
+
+if TYPE_CHECKING:
+    from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class EmPerformanceHud:
+    """
+    An overlay showing the engine's performance, toggled with a hotkey (F3 by
+    default). The engine draws it on the window right before the flip and erases it
+    right after, so captured and observed frames never include it.
+
+    It shows the FPS, a sparkline of the last frame times, the tick / draw / flip
+    split, the active and frozen entities counts and the five entities costing the
+    most time in `on_tick` and `on_draw` (only measured while the overlay is shown).
+
+    The text is drawn from cached glyphs into a panel surface rebuilt every
+    `refresh_interval_ms`, with the values averaged over the interval; the sparkline
+    is scrolled by one column per frame. Other frames only blit the two surfaces, and
+    the panel is transparent around the text, so only the text's pixels are copied.
+    """
+
+    TOP_ENTITIES_COUNT = 5
+
+    PANEL_WIDTH = 200
+    PANEL_MARGIN = 8
+    SPARKLINE_HEIGHT = 32
+
+    BACKGROUND_COLOR = (16, 16, 16)
+    TRANSPARENT_COLOR = (255, 0, 255)
+    BUDGET_COLOR = (90, 90, 90)
+    FAST_FRAME_COLOR = (80, 200, 120)
+    SLOW_FRAME_COLOR = (230, 190, 60)
+    DROPPED_FRAME_COLOR = (230, 70, 60)
+
+    def __init__(
+        self,
+        hotkey: int = pygame.K_F3,
+        refresh_interval_ms: float = 250,
+        history_size: int = 120,
+        frame_budget_ms: float = 1000 / 60,
+        font_size: int = 16,
+    ) -> None:
+        """
+        Initializes the overlay, hidden.
+
+        Args:
+            hotkey (int): The pygame key toggling the overlay. Default is F3.
+            refresh_interval_ms (float): The delay between two refreshes of the text.
+                                         Default is 250.
+            history_size (int): The number of frames in the sparkline. Default is 120.
+            frame_budget_ms (float): The target frame time, marked on the sparkline.
+                                     Default is 1000 / 60.
+            font_size (int): The size of the default font. Default is 16.
+        """
+        self.__hotkey = hotkey
+        self.__visible = False
+        self.__refresh_interval = refresh_interval_ms / 1000
+        self.__history_size = history_size
+        self.__frame_budget_ms = frame_budget_ms
+        self.__font_size = font_size
+
+        # Created on the first draw, once the display is initialized
+        self.__glyph_cache: EmGlyphCache = None
+        self.__panel: pygame.Surface = None
+        self.__sparkline: pygame.Surface = None
+
+        # The pixels under the overlay, saved by draw and restored by erase
+        self.__rect: pygame.Rect = None
+        self.__background: pygame.Surface = None
+        self.__background_rect: pygame.Rect = None
+
+        self.__last_refresh = 0.0
+
+        # Sums over the current refresh interval
+        self.__frames_count = 0
+        self.__frame_ms = 0.0
+        self.__max_frame_ms = 0.0
+        self.__tick_ms = 0.0
+        self.__draw_ms = 0.0
+        self.__flip_ms = 0.0
+        self.__hud_ms = 0.0
+
+        # Costs are added by the simulation worker (on_tick) and the main thread
+        # (on_draw), and swapped out by the main thread on refresh
+        self.__entities_costs_lock = threading.Lock()
+        self.__entities_costs: Dict[str, float] = {}
+
+    def get_hotkey(self) -> int:
+        """
+        Returns the key toggling the overlay.
+
+        Returns:
+            int: The pygame key, e.g. `pygame.K_F3`.
+        """
+        return self.__hotkey
+
+    def set_hotkey(self, new_hotkey: int):
+        """
+        Sets the key toggling the overlay.
+
+        Args:
+            new_hotkey (int): The pygame key, e.g. `pygame.K_F3`.
+        """
+        self.__hotkey = new_hotkey
+
+    def is_visible(self) -> bool:
+        """
+        Checks whether the overlay is shown.
+
+        Returns:
+            bool: True if the overlay is shown.
+        """
+        return self.__visible
+
+    def set_visible(self, new_visible: bool):
+        """
+        Shows or hides the overlay. Showing it starts a new sparkline.
+
+        Args:
+            new_visible (bool): True to show the overlay.
+        """
+        if new_visible and not self.__visible:
+            self.__reset_interval()
+            self.__last_refresh = 0.0
+
+            if self.__sparkline is not None:
+                self.__sparkline.fill(EmPerformanceHud.BACKGROUND_COLOR)
+
+        self.__visible = new_visible
+
+    def toggle(self):
+        """
+        Shows the overlay if it is hidden, hides it otherwise.
+        """
+        self.set_visible(not self.__visible)
+
+    def record_frame(
+        self, frame_ms: float, tick_ms: float, draw_ms: float, flip_ms: float
+    ):
+        """
+        Records the timings of a frame. Called by the engine while the overlay is
+        shown.
+
+        Args:
+            frame_ms (float): The time between the starts of the last two frames.
+            tick_ms (float): The time spent simulating the frame.
+            draw_ms (float): The time spent drawing the frame.
+            flip_ms (float): The time spent presenting the frame.
+        """
+        self.__frames_count += 1
+        self.__frame_ms += frame_ms
+        self.__max_frame_ms = max(self.__max_frame_ms, frame_ms)
+        self.__tick_ms += tick_ms
+        self.__draw_ms += draw_ms
+        self.__flip_ms += flip_ms
+
+        if self.__sparkline is not None:
+            self.__add_sparkline_column(frame_ms)
+
+    def add_entity_cost(self, entity: "EmEntity", cost_ms: float):
+        """
+        Adds time spent in an entity's `on_tick` or `on_draw`. Called by the engine
+        while the overlay is shown, from the simulation worker or the main thread.
+
+        Args:
+            entity (EmEntity): The entity.
+            cost_ms (float): The time spent, in milliseconds.
+        """
+        entity_name = entity.get_entity_name()
+
+        with self.__entities_costs_lock:
+            entities_costs = self.__entities_costs
+            entities_costs[entity_name] = entities_costs.get(entity_name, 0.0) + cost_ms
+
+    def draw(self, surface: pygame.Surface, entities: List["EmEntity"]):
+        """
+        Draws the overlay in the top left corner of a surface, refreshing its text
+        first if the refresh interval is over. The pixels under it are saved, to be
+        restored by `erase`.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            entities (List[EmEntity]): The instantiated entities, counted on refresh.
+        """
+        started_at = time.perf_counter()
+
+        if self.__glyph_cache is None:
+            self.__create_surfaces()
+
+        if started_at - self.__last_refresh >= self.__refresh_interval:
+            self.__last_refresh = started_at
+            self.__refresh(entities)
+
+        background_rect = self.__rect.clip(surface.get_rect())
+        self.__background.blit(surface, (0, 0), background_rect)
+        self.__background_rect = background_rect
+
+        margin = EmPerformanceHud.PANEL_MARGIN
+        surface.blit(self.__panel, (margin, margin))
+        surface.blit(
+            self.__sparkline,
+            (margin * 2, margin * 2 + 3 * self.__glyph_cache.get_line_height()),
+        )
+
+        self.__hud_ms += (time.perf_counter() - started_at) * 1000
+
+    def erase(self, surface: pygame.Surface):
+        """
+        Restores the pixels covered by the last `draw` on a surface.
+
+        Args:
+            surface (pygame.Surface): The surface the overlay was drawn on.
+        """
+        if self.__background_rect is None:
+            return
+
+        started_at = time.perf_counter()
+
+        surface.blit(
+            self.__background,
+            self.__background_rect.topleft,
+            (0, 0, self.__background_rect.width, self.__background_rect.height),
+        )
+        self.__background_rect = None
+
+        self.__hud_ms += (time.perf_counter() - started_at) * 1000
+
+    def __create_surfaces(self):
+        """
+        Creates the font, the glyph cache, the panel, the sparkline and the
+        background surfaces.
+        """
+        self.__glyph_cache = EmGlyphCache(
+            pygame.font.Font(None, self.__font_size),
+            background=EmPerformanceHud.BACKGROUND_COLOR,
+        )
+        line_height = self.__glyph_cache.get_line_height()
+
+        # 3 lines, the sparkline, then the title, top entities and overlay cost lines
+        lines_count = 3 + 2 + EmPerformanceHud.TOP_ENTITIES_COUNT
+        panel_height = (
+            lines_count * line_height
+            + EmPerformanceHud.SPARKLINE_HEIGHT
+            + EmPerformanceHud.PANEL_MARGIN * 3
+        )
+
+        self.__panel = pygame.Surface(
+            (EmPerformanceHud.PANEL_WIDTH, panel_height)
+        ).convert()
+        self.__panel.set_colorkey(EmPerformanceHud.TRANSPARENT_COLOR)
+        self.__panel.fill(EmPerformanceHud.TRANSPARENT_COLOR)
+
+        self.__sparkline = pygame.Surface(
+            (self.__history_size, EmPerformanceHud.SPARKLINE_HEIGHT)
+        ).convert()
+        self.__sparkline.fill(EmPerformanceHud.BACKGROUND_COLOR)
+
+        margin = EmPerformanceHud.PANEL_MARGIN
+        self.__rect = self.__panel.get_rect(topleft=(margin, margin)).union(
+            self.__sparkline.get_rect(
+                topleft=(margin * 2, margin * 2 + 3 * line_height)
+            )
+        )
+        self.__background = pygame.Surface(self.__rect.size).convert()
+
+    def __add_sparkline_column(self, frame_ms: float):
+        """
+        Scrolls the sparkline left by one column and draws the frame's bar in the
+        new column. The bar's full height is two frame budgets.
+        """
+        sparkline = self.__sparkline
+        width, height = sparkline.get_size()
+
+        sparkline.scroll(-1, 0)
+        sparkline.fill(EmPerformanceHud.BACKGROUND_COLOR, (width - 1, 0, 1, height))
+
+        if frame_ms <= self.__frame_budget_ms:
+            color = EmPerformanceHud.FAST_FRAME_COLOR
+        elif frame_ms <= self.__frame_budget_ms * 1.5:
+            color = EmPerformanceHud.SLOW_FRAME_COLOR
+        else:
+            color = EmPerformanceHud.DROPPED_FRAME_COLOR
+
+        bar_height = max(
+            1, min(height, round(frame_ms / (self.__frame_budget_ms * 2) * height))
+        )
+        sparkline.fill(color, (width - 1, height - bar_height, 1, bar_height))
+        sparkline.set_at((width - 1, height // 2), EmPerformanceHud.BUDGET_COLOR)
+
+    def __refresh(self, entities: List["EmEntity"]):
+        """
+        Averages the timings of the last interval and draws them on the panel.
+        """
+        frames_count = max(self.__frames_count, 1)
+
+        frame_ms = self.__frame_ms / frames_count
+        frozen_count = sum(1 for entity in entities if entity.is_frozen())
+
+        with self.__entities_costs_lock:
+            entities_costs = self.__entities_costs
+            self.__entities_costs = {}
+
+        top_entities = heapq.nlargest(
+            EmPerformanceHud.TOP_ENTITIES_COUNT,
+            entities_costs.items(),
+            key=itemgetter(1),
+        )
+
+        lines = [
+            f"{1000 / frame_ms if frame_ms else 0:.0f} FPS  {frame_ms:.1f} ms  "
+            f"max {self.__max_frame_ms:.1f} ms",
+            f"tick {self.__tick_ms / frames_count:.2f}  "
+            f"draw {self.__draw_ms / frames_count:.2f}  "
+            f"flip {self.__flip_ms / frames_count:.2f} ms",
+            f"entities {len(entities) - frozen_count} active  {frozen_count} frozen",
+            "costliest entities (ms / frame)",
+        ]
+        lines.extend(
+            f"  {cost_ms / frames_count:.3f}  {entity_name}"
+            for entity_name, cost_ms in top_entities
+        )
+        lines.extend(
+            "" for _ in range(EmPerformanceHud.TOP_ENTITIES_COUNT - len(top_entities))
+        )
+        lines.append(f"overlay {self.__hud_ms / frames_count:.3f} ms / frame")
+
+        self.__reset_interval()
+
+        # Draw the lines around the sparkline, which is blitted over the panel
+        self.__panel.fill(EmPerformanceHud.TRANSPARENT_COLOR)
+
+        margin = EmPerformanceHud.PANEL_MARGIN
+        line_height = self.__glyph_cache.get_line_height()
+        y = margin
+
+        for line_index, line in enumerate(lines):
+            if line_index == 3:
+                y += EmPerformanceHud.SPARKLINE_HEIGHT + margin
+
+            self.__glyph_cache.draw_text(self.__panel, line, (margin, y))
+            y += line_height
+
+    def __reset_interval(self):
+        """
+        Starts a new refresh interval.
+        """
+        self.__frames_count = 0
+        self.__frame_ms = 0.0
+        self.__max_frame_ms = 0.0
+        self.__tick_ms = 0.0
+        self.__draw_ms = 0.0
+        self.__flip_ms = 0.0
+        self.__hud_ms = 0.0
+
+        with self.__entities_costs_lock:
+            self.__entities_costs = {}
@@ -0,0 +1 @@
+from .EmPerformanceHud import *
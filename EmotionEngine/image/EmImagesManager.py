@@ -0,0 +1,357 @@
+import os
+import hashlib
+import pygame
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from EmotionEngine.image.EmTextureAtlas import EmAtlasSprite, EmTextureAtlas
+
+if TYPE_CHECKING:
+    from EmotionEngine.EmEngine import EmEngine
+
+
+IMAGES_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga", ".webp")
+
+
+def get_surface_memory_size(surface: pygame.Surface) -> int:
+    """
+    Computes the size of a surface's pixel data.
+
+    Args:
+        surface (pygame.Surface): The surface to measure.
+
+    Returns:
+        int: The size of the surface's pixels, in bytes.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+class EmImagesManager:
+    """
+    A manager class responsible for loading and caching images within the engine.
+
+    Images are loaded from the game's images directory and converted once to the
+    display's pixel format (keeping per-pixel alpha when the image has any), which
+    makes blitting them much faster. Loaded images are cached by path, and scaled or
+    rotated variants are memoized in a bounded least-recently-used cache.
+
+    Images can also be packed into texture atlases (see `build_atlas`): once packed,
+    `load_image` returns sub-surfaces of the atlas pages, and `get_sprite` gives the
+    (page, rect) pair for batched drawing.
+    """
+
+    def __init__(self, engine_ref: "EmEngine", max_variants: int = 256) -> None:
+        """
+        Initializes the images manager.
+
+        Args:
+            engine_ref (EmEngine): The engine owning the manager.
+            max_variants (int): The maximum number of scaled or rotated variants kept
+                                in cache. Default is 256.
+        """
+        self.__engine_ref = engine_ref
+
+        self.__images: Dict[str, pygame.Surface] = {}
+        self.__images_bytes = 0
+
+        self.__variants: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.__variants_bytes = 0
+        self.__max_variants = max_variants
+
+        self.__atlases: Dict[str, EmTextureAtlas] = {}
+        self.__atlases_sprites: Dict[str, EmAtlasSprite] = {}
+
+        self.__hits = 0
+        self.__misses = 0
+
+    def load_image(self, image_path: str) -> pygame.Surface:
+        """
+        Loads an image from the game's images directory, converted to the display format.
+
+        The returned surface is shared by every caller, so it must not be modified.
+
+        Args:
+            image_path (str): The path to the image file, relative to the game's
+            images directory.
+
+        Returns:
+            pygame.Surface: The converted image.
+        """
+        image = self.__images.get(image_path)
+
+        if image is not None:
+            self.__hits += 1
+            return image
+
+        self.__misses += 1
+
+        sprite = self.__atlases_sprites.get(image_path)
+
+        # Packed images share the atlas pixels: they are accounted in the atlases
+        if sprite is not None:
+            image = sprite.page.subsurface(sprite.rect)
+            self.__images[image_path] = image
+            return image
+
+        full_image_path = os.path.join(
+            self.__engine_ref.get_images_directory(), image_path
+        )
+        image = self.convert_surface(pygame.image.load(full_image_path))
+
+        self.__images[image_path] = image
+        self.__images_bytes += get_surface_memory_size(image)
+
+        return image
+
+    def build_atlas(
+        self,
+        atlas_name: str,
+        images_paths: List[str] = None,
+        page_size: int = 2048,
+        padding: int = 1,
+    ) -> EmTextureAtlas:
+        """
+        Packs images into a texture atlas, cached on disk under the engine's cache
+        directory until one of the images changes.
+
+        Once packed, the images are served by `load_image` as sub-surfaces of the
+        atlas pages, and their (page, rect) pairs are available through `get_sprite`.
+
+        Args:
+            atlas_name (str): The name of the atlas.
+            images_paths (List[str]): The paths to the images to pack, relative to the
+                                      game's images directory. Default is None (every
+                                      image of the images directory).
+            page_size (int): The maximum width and height of a page. Default is 2048.
+            padding (int): The empty space kept around every sprite. Default is 1.
+
+        Returns:
+            EmTextureAtlas: The texture atlas.
+        """
+        images_directory = self.__engine_ref.get_images_directory()
+
+        if images_paths is None:
+            images_paths = self.__find_images(images_directory)
+
+        key_parts = [str(page_size), str(padding)]
+
+        for image_path in sorted(images_paths):
+            image_stat = os.stat(os.path.join(images_directory, image_path))
+            key_parts.append(
+                f"{image_path}:{image_stat.st_size}:{image_stat.st_mtime_ns}"
+            )
+
+        key = hashlib.sha1("|".join(key_parts).encode("UTF-8")).hexdigest()
+        atlas_directory = os.path.join(
+            self.__engine_ref.get_cache_directory(), "atlases", atlas_name
+        )
+
+        atlas = EmTextureAtlas.load_from_directory(atlas_directory, key)
+
+        if atlas is None:
+            self.__engine_ref.get_logger("images").info(
+                "Packing %d images in '%s' atlas ...", len(images_paths), atlas_name
+            )
+
+            images = {
+                image_path: pygame.image.load(
+                    os.path.join(images_directory, image_path)
+                ).convert_alpha()
+                for image_path in images_paths
+            }
+            atlas = EmTextureAtlas.pack(images, page_size=page_size, padding=padding)
+            atlas.save_to_directory(atlas_directory, key)
+
+        self.__atlases[atlas_name] = atlas
+
+        for image_path, sprite in atlas.get_sprites().items():
+            self.__atlases_sprites[image_path] = sprite
+
+            # Serve the packed version from now on
+            image = self.__images.pop(image_path, None)
+
+            if image is not None and image.get_parent() is None:
+                self.__images_bytes -= get_surface_memory_size(image)
+
+        return atlas
+
+    def get_atlas(self, atlas_name: str) -> Optional[EmTextureAtlas]:
+        """
+        Returns a texture atlas built by `build_atlas`.
+
+        Args:
+            atlas_name (str): The name of the atlas.
+
+        Returns:
+            Optional[EmTextureAtlas]: The atlas, or None if it was not built.
+        """
+        return self.__atlases.get(atlas_name)
+
+    def get_sprite(self, image_path: str) -> Optional[EmAtlasSprite]:
+        """
+        Returns where an image is stored in the texture atlases.
+
+        Args:
+            image_path (str): The path to the image file, relative to the game's
+            images directory.
+
+        Returns:
+            Optional[EmAtlasSprite]: The atlas page and rect of the image, or None if
+                                     the image is not packed in any atlas.
+        """
+        return self.__atlases_sprites.get(image_path)
+
+    def get_scaled_image(
+        self, image_path: str, size: Tuple[int, int], smooth: bool = False
+    ) -> pygame.Surface:
+        """
+        Returns an image scaled to the given size, memoized.
+
+        Args:
+            image_path (str): The path to the image file, relative to the game's
+            images directory.
+            size (Tuple[int, int]): The width and height of the scaled image.
+            smooth (bool): Whether to use smooth (filtered) scaling. Default is False.
+
+        Returns:
+            pygame.Surface: The scaled image.
+        """
+        key = (image_path, "scaled", int(size[0]), int(size[1]), smooth)
+        variant = self.__get_variant(key)
+
+        if variant is None:
+            image = self.load_image(image_path)
+            scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+            variant = self.__add_variant(key, scale(image, key[2:4]))
+
+        return variant
+
+    def get_rotated_image(
+        self, image_path: str, angle_degrees: float, angle_step: float = 1.0
+    ) -> pygame.Surface:
+        """
+        Returns an image rotated counterclockwise, memoized.
+
+        The angle is rounded to a multiple of `angle_step`, which bounds the number of
+        variants a continuously rotating sprite creates.
+
+        Args:
+            image_path (str): The path to the image file, relative to the game's
+            images directory.
+            angle_degrees (float): The rotation angle, in degrees.
+            angle_step (float): The angle precision, in degrees. Default is 1.
+
+        Returns:
+            pygame.Surface: The rotated image.
+        """
+        angle = (round(angle_degrees / angle_step) * angle_step) % 360
+        key = (image_path, "rotated", angle)
+        variant = self.__get_variant(key)
+
+        if variant is None:
+            image = self.load_image(image_path)
+            variant = self.__add_variant(key, pygame.transform.rotate(image, angle))
+
+        return variant
+
+    def convert_surface(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Converts a surface to the display's pixel format, keeping its transparency.
+
+        Args:
+            surface (pygame.Surface): The surface to convert.
+
+        Returns:
+            pygame.Surface: The converted surface.
+        """
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+
+        return surface.convert()
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        Returns the memory used by the cached images' pixels.
+
+        Returns:
+            Dict[str, int]: The bytes used by the loaded images, by their variants and
+                            by the texture atlases.
+        """
+        return {
+            "images": self.__images_bytes,
+            "variants": self.__variants_bytes,
+            "atlases": sum(
+                atlas.get_memory_size() for atlas in self.__atlases.values()
+            ),
+        }
+
+    def get_hits(self) -> int:
+        """
+        Returns the number of image and variant requests served from the cache.
+
+        Returns:
+            int: The number of cache hits.
+        """
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Returns the number of image and variant requests that had to be computed.
+
+        Returns:
+            int: The number of cache misses.
+        """
+        return self.__misses
+
+    def clear_variants(self):
+        """
+        Discards every cached scaled and rotated variant.
+        """
+        self.__variants.clear()
+        self.__variants_bytes = 0
+
+    @staticmethod
+    def __find_images(images_directory: str) -> List[str]:
+        """
+        Lists every image file under a directory, relative to that directory.
+        """
+        images_paths = []
+
+        for directory, _, files_names in os.walk(images_directory):
+            for file_name in files_names:
+                if file_name.lower().endswith(IMAGES_EXTENSIONS):
+                    images_paths.append(
+                        os.path.relpath(
+                            os.path.join(directory, file_name), images_directory
+                        )
+                    )
+
+        return sorted(images_paths)
+
+    def __get_variant(self, key: tuple) -> pygame.Surface:
+        """
+        Returns a cached variant and marks it as recently used, or None.
+        """
+        variant = self.__variants.get(key)
+
+        if variant is not None:
+            self.__hits += 1
+            self.__variants.move_to_end(key)
+
+        return variant
+
+    def __add_variant(self, key: tuple, variant: pygame.Surface) -> pygame.Surface:
+        """
+        Caches a new variant, evicting the least recently used ones over the limit.
+        """
+        self.__misses += 1
+
+        self.__variants[key] = variant
+        self.__variants_bytes += get_surface_memory_size(variant)
+
+        while len(self.__variants) > self.__max_variants:
+            _, evicted = self.__variants.popitem(last=False)
+            self.__variants_bytes -= get_surface_memory_size(evicted)
+
+        return variant
@@ -0,0 +1,344 @@
+import os
+import math
+import json
+import pygame
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class EmAtlasSprite:
+    """
+    A sprite stored in a texture atlas, addressed as an (atlas page, rect) pair.
+
+    Attributes:
+        page (pygame.Surface): The atlas page holding the sprite.
+        page_index (int): The index of the page in its atlas.
+        rect (pygame.Rect): The area of the sprite in the page.
+    """
+
+    page: pygame.Surface
+    page_index: int
+    rect: pygame.Rect
+
+
+class EmTextureAtlas:
+    """
+    A set of images packed into a few large surfaces (pages).
+
+    Packing many small images together keeps their pixels contiguous in memory and
+    lets the sprites sharing a page be drawn with a single `Surface.blits()` call.
+    Images are packed with a shelf (first fit, decreasing height) bin-packing
+    algorithm, and atlases can be saved to and loaded from a directory holding the
+    page images and a JSON index.
+    """
+
+    INDEX_FILE_NAME = "index.json"
+
+    def __init__(
+        self, pages: List[pygame.Surface], sprites_rects: Dict[str, Tuple[int, ...]]
+    ) -> None:
+        """
+        Initializes the atlas from already packed pages.
+
+        Args:
+            pages (List[pygame.Surface]): The atlas pages.
+            sprites_rects (Dict[str, Tuple[int, ...]]): The (page index, x, y, width,
+                                                        height) of each sprite, by name.
+        """
+        self.__pages = pages
+        self.__sprites_rects = sprites_rects
+        self.__sprites: Dict[str, EmAtlasSprite] = {
+            sprite_name: EmAtlasSprite(
+                page=pages[page_index],
+                page_index=page_index,
+                rect=pygame.Rect(x, y, width, height),
+            )
+            for sprite_name, (page_index, x, y, width, height) in sprites_rects.items()
+        }
+
+        # Scaled sprites are only kept for the last zoom drawn
+        self.__scaled_sprites: Dict[str, pygame.Surface] = {}
+        self.__scaled_zoom = 1.0
+
+    @staticmethod
+    def pack(
+        images: Dict[str, pygame.Surface], page_size: int = 2048, padding: int = 1
+    ) -> "EmTextureAtlas":
+        """
+        Packs images into a new atlas.
+
+        Args:
+            images (Dict[str, pygame.Surface]): The images to pack, by sprite name.
+            page_size (int): The maximum width and height of a page. Default is 2048.
+            padding (int): The empty space kept around every sprite. Default is 1.
+
+        Returns:
+            EmTextureAtlas: The packed atlas.
+
+        Raises:
+            ValueError: If an image does not fit in a page.
+        """
+        # Each page is a list of shelves: [y, height, x cursor]
+        pages_shelves: List[List[List[int]]] = []
+        pages_extents: List[List[int]] = []
+        sprites_rects: Dict[str, Tuple[int, ...]] = {}
+
+        ordered_names = sorted(
+            images,
+            key=lambda name: (images[name].get_height(), images[name].get_width()),
+            reverse=True,
+        )
+
+        for sprite_name in ordered_names:
+            width, height = images[sprite_name].get_size()
+            padded_width = width + padding * 2
+            padded_height = height + padding * 2
+
+            if padded_width > page_size or padded_height > page_size:
+                raise ValueError(
+                    f"'{sprite_name}' ({width}x{height}) does not fit in a "
+                    f"{page_size}x{page_size} atlas page"
+                )
+
+            placement = EmTextureAtlas.__place(
+                pages_shelves, padded_width, padded_height, page_size
+            )
+
+            if placement is None:
+                pages_shelves.append([])
+                pages_extents.append([0, 0])
+                placement = EmTextureAtlas.__place(
+                    pages_shelves, padded_width, padded_height, page_size
+                )
+
+            page_index, x, y = placement
+            extents = pages_extents[page_index]
+            extents[0] = max(extents[0], x + padded_width)
+            extents[1] = max(extents[1], y + padded_height)
+
+            sprites_rects[sprite_name] = (
+                page_index,
+                x + padding,
+                y + padding,
+                width,
+                height,
+            )
+
+        pages = [
+            pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+            for width, height in pages_extents
+        ]
+
+        for sprite_name, (page_index, x, y, _, _) in sprites_rects.items():
+            # Copy the pixels as they are, alpha included, onto the transparent page
+            pages[page_index].blit(
+                images[sprite_name], (x, y), special_flags=pygame.BLEND_RGBA_MAX
+            )
+
+        return EmTextureAtlas(pages, sprites_rects)
+
+    @staticmethod
+    def __place(
+        pages_shelves: List[List[List[int]]], width: int, height: int, page_size: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Finds room for a rectangle in the existing pages, opening a new shelf if needed.
+
+        Returns:
+            Optional[Tuple[int, int, int]]: The (page index, x, y) of the rectangle,
+                                            or None if no page has room for it.
+        """
+        for page_index, shelves in enumerate(pages_shelves):
+            for shelf in shelves:
+                shelf_y, shelf_height, shelf_x = shelf
+
+                if height <= shelf_height and shelf_x + width <= page_size:
+                    shelf[2] += width
+                    return page_index, shelf_x, shelf_y
+
+            used_height = shelves[-1][0] + shelves[-1][1] if shelves else 0
+
+            if used_height + height <= page_size:
+                shelves.append([used_height, height, width])
+                return page_index, 0, used_height
+
+        return None
+
+    @staticmethod
+    def load_from_directory(
+        directory: str, expected_key: str
+    ) -> Optional["EmTextureAtlas"]:
+        """
+        Loads an atlas saved by `save_to_directory`, converted to the display format.
+
+        Args:
+            directory (str): The directory the atlas was saved to.
+            expected_key (str): The key the atlas must have been saved with.
+
+        Returns:
+            Optional[EmTextureAtlas]: The loaded atlas, or None if there is no saved
+                                      atlas with this key.
+        """
+        index_path = os.path.join(directory, EmTextureAtlas.INDEX_FILE_NAME)
+
+        if not os.path.isfile(index_path):
+            return None
+
+        with open(index_path, "r", encoding="UTF-8") as index_file:
+            index = json.load(index_file)
+
+        if index.get("key") != expected_key:
+            return None
+
+        pages = [
+            pygame.image.load(os.path.join(directory, page_file)).convert_alpha()
+            for page_file in index["pages"]
+        ]
+        sprites_rects = {
+            sprite_name: tuple(rect) for sprite_name, rect in index["sprites"].items()
+        }
+
+        return EmTextureAtlas(pages, sprites_rects)
+
+    def save_to_directory(self, directory: str, key: str):
+        """
+        Saves the atlas pages as PNG images, along with a JSON index.
+
+        Args:
+            directory (str): The directory to save the atlas to.
+            key (str): A key identifying the atlas sources, checked when loading.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        pages_files = []
+
+        for page_index, page in enumerate(self.__pages):
+            page_file = f"page{page_index}.png"
+            pygame.image.save(page, os.path.join(directory, page_file))
+            pages_files.append(page_file)
+
+        index = {
+            "key": key,
+            "pages": pages_files,
+            "sprites": {
+                sprite_name: list(rect)
+                for sprite_name, rect in self.__sprites_rects.items()
+            },
+        }
+
+        # The index is written last, so an interrupted save is never loaded
+        with open(
+            os.path.join(directory, EmTextureAtlas.INDEX_FILE_NAME),
+            "w",
+            encoding="UTF-8",
+        ) as index_file:
+            json.dump(index, index_file, indent=2)
+
+    def get_pages(self) -> List[pygame.Surface]:
+        """
+        Returns the atlas pages.
+
+        Returns:
+            List[pygame.Surface]: The surfaces the sprites are packed in.
+        """
+        return self.__pages
+
+    def get_sprite(self, sprite_name: str) -> Optional[EmAtlasSprite]:
+        """
+        Returns a sprite of the atlas.
+
+        Args:
+            sprite_name (str): The name of the sprite (its image path).
+
+        Returns:
+            Optional[EmAtlasSprite]: The sprite, or None if it is not in the atlas.
+        """
+        return self.__sprites.get(sprite_name)
+
+    def get_sprites(self) -> Dict[str, EmAtlasSprite]:
+        """
+        Returns every sprite of the atlas.
+
+        Returns:
+            Dict[str, EmAtlasSprite]: The sprites, by name.
+        """
+        return self.__sprites
+
+    def get_memory_size(self) -> int:
+        """
+        Returns the size of the atlas pages' pixel data.
+
+        Returns:
+            int: The size of the pages' pixels, in bytes.
+        """
+        return sum(page.get_pitch() * page.get_height() for page in self.__pages)
+
+    def draw_sprites(
+        self,
+        surface: pygame.Surface,
+        sprites_positions: Iterable[Tuple[str, Tuple[float, float]]],
+        offset: Tuple[float, float] = (0, 0),
+        zoom: float = 1.0,
+    ):
+        """
+        Draws many sprites of the atlas, with one `Surface.blits()` call per page.
+        Zoomed sprites are scaled on their first use and drawn with a single call.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto.
+            sprites_positions (Iterable[Tuple[str, Tuple[float, float]]]): The sprite
+                                names and the world positions to draw them at.
+            offset (Tuple[float, float]): The world position shown at the surface's
+                                          top left corner. Default is (0, 0).
+            zoom (float): The number of surface pixels per world unit. Default is 1.
+        """
+        offset_x, offset_y = offset
+
+        if zoom != 1:
+            if zoom != self.__scaled_zoom:
+                self.__scaled_sprites.clear()
+                self.__scaled_zoom = zoom
+
+            surface.blits(
+                [
+                    (
+                        self.__get_scaled_sprite(sprite_name, zoom),
+                        ((x - offset_x) * zoom, (y - offset_y) * zoom),
+                    )
+                    for sprite_name, (x, y) in sprites_positions
+                ],
+                doreturn=False,
+            )
+            return
+
+        blits_by_page: Dict[int, list] = {}
+
+        for sprite_name, (x, y) in sprites_positions:
+            sprite = self.__sprites[sprite_name]
+            blits_by_page.setdefault(sprite.page_index, []).append(
+                (sprite.page, (x - offset_x, y - offset_y), sprite.rect)
+            )
+
+        for blits in blits_by_page.values():
+            surface.blits(blits, doreturn=False)
+
+    def __get_scaled_sprite(self, sprite_name: str, zoom: float) -> pygame.Surface:
+        """
+        Returns a sprite scaled by the zoom, scaling it on first use.
+        """
+        scaled_sprite = self.__scaled_sprites.get(sprite_name)
+
+        if scaled_sprite is None:
+            sprite = self.__sprites[sprite_name]
+            scaled_sprite = pygame.transform.scale(
+                sprite.page.subsurface(sprite.rect),
+                (
+                    math.ceil(sprite.rect.width * zoom),
+                    math.ceil(sprite.rect.height * zoom),
+                ),
+            )
+            self.__scaled_sprites[sprite_name] = scaled_sprite
+
+        return scaled_sprite
@@ -0,0 +1,2 @@
+from .EmTextureAtlas import *
+from .EmImagesManager import *
@@ -0,0 +1,209 @@
+import time
+import threading
+
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from EmotionEngine.log.EmLogsManager import EmLogsManager
+
+
+class EmLogger:
+    """
+    A named logger of an engine subsystem (e.g. "engine", "levels", "network").
+
+    Messages are `%`-style templates formatted with their arguments only if their
+    level is enabled and they pass the rate limit: a disabled call costs a single
+    comparison. They are formatted on the calling thread, so arguments mutated after
+    the call are logged as they were; only the writing is left to the logs
+    manager's writer thread. Passing the arguments separately also lets messages be
+    rate limited by template: past `rate_limit` messages of the same template per
+    second, the next ones are counted and reported once instead of being written.
+
+        logger.debug("Creating '%s' entity ...", entity_name)
+    """
+
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+    LEVELS_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+    def __init__(
+        self, name: str, logs_manager: "EmLogsManager", level: int, rate_limit: int
+    ) -> None:
+        """
+        Initializes the logger. Loggers are created by `EmLogsManager.get_logger`.
+
+        Args:
+            name (str): The name of the subsystem.
+            logs_manager (EmLogsManager): The manager buffering the records.
+            level (int): The minimum level of the written messages.
+            rate_limit (int): The maximum number of messages written per template and
+                              per second, 0 for no limit.
+        """
+        self.__name = name
+        self.__logs_manager = logs_manager
+        self.__level = level
+        self.__rate_limit = rate_limit
+
+        # Per template: start of the current one second window, messages written
+        # and messages suppressed during it. Also read by the writer thread.
+        self.__rates: Dict[str, List[float]] = {}
+        self.__rates_lock = threading.Lock()
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the logger's subsystem.
+
+        Returns:
+            str: The logger's name.
+        """
+        return self.__name
+
+    def get_level(self) -> int:
+        """
+        Returns the minimum level of the written messages.
+
+        Returns:
+            int: The level, e.g. `EmLogger.INFO`.
+        """
+        return self.__level
+
+    def set_level(self, new_level: int):
+        """
+        Sets the minimum level of the written messages.
+
+        Args:
+            new_level (int): The new level, e.g. `EmLogger.DEBUG`.
+        """
+        self.__level = new_level
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Checks whether messages of a level are written, to skip building costly
+        arguments.
+
+        Args:
+            level (int): The level to check.
+
+        Returns:
+            bool: True if messages of this level are written.
+        """
+        return level >= self.__level
+
+    def debug(self, message: str, *args: Any):
+        """
+        Logs a debugging message.
+
+        Args:
+            message (str): The message template.
+            *args (Any): The template's arguments.
+        """
+        if EmLogger.DEBUG >= self.__level:
+            self.__log(EmLogger.DEBUG, message, args)
+
+    def info(self, message: str, *args: Any):
+        """
+        Logs an informational message.
+
+        Args:
+            message (str): The message template.
+            *args (Any): The template's arguments.
+        """
+        if EmLogger.INFO >= self.__level:
+            self.__log(EmLogger.INFO, message, args)
+
+    def warning(self, message: str, *args: Any):
+        """
+        Logs a warning message.
+
+        Args:
+            message (str): The message template.
+            *args (Any): The template's arguments.
+        """
+        if EmLogger.WARNING >= self.__level:
+            self.__log(EmLogger.WARNING, message, args)
+
+    def error(self, message: str, *args: Any):
+        """
+        Logs an error message.
+
+        Args:
+            message (str): The message template.
+            *args (Any): The template's arguments.
+        """
+        if EmLogger.ERROR >= self.__level:
+            self.__log(EmLogger.ERROR, message, args)
+
+    def report_suppressed(self, all_windows: bool = False):
+        """
+        Reports the number of suppressed messages of the templates whose one second
+        window is over, and forgets these windows. Called by the logs manager before
+        each write.
+
+        Args:
+            all_windows (bool): Whether to also report the messages suppressed during
+                                the current windows, e.g. before the program exits.
+                                Default is False.
+        """
+        if not self.__rate_limit:
+            return
+
+        now = time.perf_counter()
+
+        with self.__rates_lock:
+            for message, rate in list(self.__rates.items()):
+                if now - rate[0] >= 1.0:
+                    del self.__rates[message]
+                elif not all_windows:
+                    continue
+
+                if rate[2]:
+                    self.__add_suppressed_record(now, message, rate[2])
+                    rate[2] = 0
+
+    def __log(self, level: int, message: str, args: Tuple[Any, ...]):
+        """
+        Rate limits a message of an enabled level, then formats it and hands it to
+        the manager.
+        """
+        now = time.perf_counter()
+
+        if self.__rate_limit:
+            with self.__rates_lock:
+                rate = self.__rates.get(message)
+
+                if rate is None or now - rate[0] >= 1.0:
+                    if rate is not None and rate[2]:
+                        self.__add_suppressed_record(now, message, rate[2])
+
+                    rate = self.__rates[message] = [now, 0, 0]
+
+                if rate[1] >= self.__rate_limit:
+                    rate[2] += 1
+                    return
+
+                rate[1] += 1
+
+        if args:
+            try:
+                message = message % args
+
+            except (TypeError, ValueError):
+                message = f"{message} {args!r}"
+
+        self.__logs_manager.add_record(now, level, self.__name, message)
+
+    def __add_suppressed_record(
+        self, record_time: float, message: str, suppressed_count: int
+    ):
+        """
+        Hands the manager a warning counting the suppressed messages of a template.
+        """
+        self.__logs_manager.add_record(
+            record_time,
+            EmLogger.WARNING,
+            self.__name,
+            f"{suppressed_count} messages like '{message}' suppressed",
+        )
@@ -0,0 +1,211 @@
+import sys
+import time
+import atexit
+import threading
+import collections
+
+from typing import Deque, Dict, List, TextIO, Tuple
+
+from EmotionEngine.log.EmLogger import EmLogger
+
+
+class EmLogsManager:
+    """
+    A manager class for the engine's loggers, writing their messages off the game
+    loop.
+
+    Loggers add records (time, level, logger name and formatted message) to an
+    in-memory ring buffer; a writer thread wakes up every `flush_interval_ms`,
+    collects the loggers' counts of suppressed messages, formats the buffered
+    records into lines and writes them in one call. When the buffer is full, the
+    oldest records are dropped rather than blocking the game, and counted.
+    Remaining records are written when the program exits.
+    """
+
+    LEVELS = {
+        "debug": EmLogger.DEBUG,
+        "info": EmLogger.INFO,
+        "warning": EmLogger.WARNING,
+        "error": EmLogger.ERROR,
+    }
+
+    def __init__(
+        self,
+        level: str = "info",
+        capacity: int = 4096,
+        flush_interval_ms: float = 100,
+        rate_limit: int = 20,
+        stream: TextIO = None,
+    ) -> None:
+        """
+        Initializes the manager and starts its writer thread.
+
+        Args:
+            level (str): The default level of the loggers: "debug", "info",
+                         "warning" or "error". Default is "info".
+            capacity (int): The number of records the buffer holds. Default is 4096.
+            flush_interval_ms (float): The delay between two writes. Default is 100.
+            rate_limit (int): The maximum number of messages written per template, per
+                              logger and per second, 0 for no limit. Default is 20.
+            stream (TextIO): The stream to write to. Default is None (standard output).
+        """
+        assert level in EmLogsManager.LEVELS
+
+        self.__level = EmLogsManager.LEVELS[level]
+        self.__capacity = capacity
+        self.__flush_interval = flush_interval_ms / 1000
+        self.__rate_limit = rate_limit
+        self.__stream = stream
+        self.__started_at = time.perf_counter()
+
+        self.__loggers: Dict[str, EmLogger] = {}
+        self.__records: Deque[Tuple[float, int, str, str]] = collections.deque(
+            maxlen=capacity
+        )
+        self.__written = 0
+        self.__dropped = 0
+
+        self.__write_lock = threading.Lock()
+        self.__closed = threading.Event()
+        self.__writer_thread = threading.Thread(
+            target=self.__write_periodically, name="EmLogsManager", daemon=True
+        )
+        self.__writer_thread.start()
+
+        atexit.register(self.close)
+
+    def get_logger(self, name: str) -> EmLogger:
+        """
+        Returns the logger of a subsystem, creating it on the first call.
+
+        Args:
+            name (str): The name of the subsystem, e.g. "levels".
+
+        Returns:
+            EmLogger: The logger.
+        """
+        logger = self.__loggers.get(name)
+
+        if logger is None:
+            logger = self.__loggers[name] = EmLogger(
+                name, self, self.__level, self.__rate_limit
+            )
+
+        return logger
+
+    def set_level(self, level: str, logger_name: str = None):
+        """
+        Sets the minimum level of the written messages.
+
+        Args:
+            level (str): "debug", "info", "warning" or "error".
+            logger_name (str): The logger to configure. Default is None (every
+                               logger, and the ones created later).
+        """
+        assert level in EmLogsManager.LEVELS
+
+        if logger_name is not None:
+            self.get_logger(logger_name).set_level(EmLogsManager.LEVELS[level])
+            return
+
+        self.__level = EmLogsManager.LEVELS[level]
+
+        for logger in self.__loggers.values():
+            logger.set_level(self.__level)
+
+    def add_record(
+        self,
+        record_time: float,
+        level: int,
+        logger_name: str,
+        message: str,
+    ):
+        """
+        Buffers a record until the next write. Called by the loggers.
+
+        Args:
+            record_time (float): The `time.perf_counter` time of the record.
+            level (int): The level of the message.
+            logger_name (str): The name of the logger.
+            message (str): The formatted message.
+        """
+        if len(self.__records) == self.__capacity:
+            self.__dropped += 1
+
+        self.__records.append((record_time, level, logger_name, message))
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns statistics about the records.
+
+        Returns:
+            Dict[str, int]: The number of written, dropped and buffered records.
+        """
+        return {
+            "written": self.__written,
+            "dropped": self.__dropped,
+            "buffered": len(self.__records),
+        }
+
+    def flush(self):
+        """
+        Writes the buffered records right away, from the calling thread, with the
+        counts of the messages suppressed so far.
+        """
+        self.__write(report_all_suppressed=True)
+
+    def close(self):
+        """
+        Stops the writer thread and writes the remaining records.
+        """
+        if self.__closed.is_set():
+            return
+
+        self.__closed.set()
+        self.__writer_thread.join()
+        self.flush()
+
+    def __write(self, report_all_suppressed: bool):
+        """
+        Writes the buffered records, after the counts of the messages suppressed
+        during the elapsed rate limiting windows, or during every window.
+        """
+        for logger in list(self.__loggers.values()):
+            logger.report_suppressed(report_all_suppressed)
+
+        with self.__write_lock:
+            lines: List[str] = []
+
+            while self.__records:
+                lines.append(self.__format_record(*self.__records.popleft()))
+
+            if not lines:
+                return
+
+            stream = self.__stream or sys.stdout
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+
+            self.__written += len(lines)
+
+    def __format_record(
+        self,
+        record_time: float,
+        level: int,
+        logger_name: str,
+        message: str,
+    ) -> str:
+        """
+        Formats a record into a line.
+        """
+        return (
+            f"[EmotionEngine] {record_time - self.__started_at:9.3f} "
+            f"{EmLogger.LEVELS_NAMES[level]:<7} {logger_name}: {message}"
+        )
+
+    def __write_periodically(self):
+        """
+        Writes the buffered records every flush interval. Runs on the writer thread.
+        """
+        while not self.__closed.wait(self.__flush_interval):
+            self.__write(report_all_suppressed=False)
@@ -0,0 +1,2 @@
+from .EmLogger import *
+from .EmLogsManager import *
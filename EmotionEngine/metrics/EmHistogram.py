@@ -0,0 +1,134 @@
+import bisect
+
+from typing import Dict, List, Sequence
+
+
+class EmHistogram:
+    """
+    A histogram counting values in fixed buckets, e.g. frame times in milliseconds.
+
+    Recording a value costs a binary search over the buckets upper bounds and never
+    allocates, so it can be done every frame. The last bucket counts the values
+    above the highest bound.
+    """
+
+    # Upper bounds of the default buckets, in milliseconds (16.7 ms is a 60 FPS frame)
+    DEFAULT_BOUNDS = (1, 2, 4, 8, 12, 16.7, 20, 25, 33.3, 50, 66.7, 100, 250)
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> None:
+        """
+        Initializes an empty histogram.
+
+        Args:
+            bounds (Sequence[float]): The increasing upper bounds of the buckets.
+                                      Default is `EmHistogram.DEFAULT_BOUNDS`.
+        """
+        self.__bounds = tuple(bounds)
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__interval_max = 0.0
+
+    def observe(self, value: float):
+        """
+        Records a value.
+
+        Args:
+            value (float): The value to record.
+        """
+        self.__counts[bisect.bisect_left(self.__bounds, value)] += 1
+        self.__count += 1
+        self.__sum += value
+
+        if value > self.__interval_max:
+            self.__interval_max = value
+
+    def get_count(self) -> int:
+        """
+        Returns the number of recorded values.
+
+        Returns:
+            int: The number of values.
+        """
+        return self.__count
+
+    def get_mean(self) -> float:
+        """
+        Returns the mean of the recorded values.
+
+        Returns:
+            float: The mean, or 0 if no value was recorded.
+        """
+        return self.__sum / self.__count if self.__count else 0.0
+
+    def collect(self) -> Dict[str, object]:
+        """
+        Returns a copy of the histogram's state, and starts a new interval for the
+        maximum value.
+
+        Returns:
+            Dict[str, object]: The buckets "bounds" and "counts", and the "count",
+                               "sum" and "max" (since the previous collection) of
+                               the recorded values.
+        """
+        collected = {
+            "bounds": self.__bounds,
+            "counts": list(self.__counts),
+            "count": self.__count,
+            "sum": self.__sum,
+            "max": self.__interval_max,
+        }
+        self.__interval_max = 0.0
+
+        return collected
+
+    def reset(self):
+        """
+        Forgets every recorded value.
+        """
+        self.__counts = [0] * (len(self.__bounds) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__interval_max = 0.0
+
+    @staticmethod
+    def compute_percentile(
+        bounds: Sequence[float],
+        counts: List[int],
+        percentile: float,
+        max_value: float,
+    ) -> float:
+        """
+        Estimates a percentile from buckets counts, interpolating inside the bucket
+        holding it.
+
+        Args:
+            bounds (Sequence[float]): The upper bounds of the buckets.
+            counts (List[int]): The counts of the buckets, the last one counting the
+                                values above the highest bound.
+            percentile (float): The percentile, between 0 and 100.
+            max_value (float): The highest value, bounding the estimate.
+
+        Returns:
+            float: The estimated percentile, or 0 if the buckets are empty.
+        """
+        total = sum(counts)
+
+        if not total:
+            return 0.0
+
+        rank = total * percentile / 100
+        cumulated = 0
+
+        for index, count in enumerate(counts):
+            if count and cumulated + count >= rank:
+                lower = bounds[index - 1] if index > 0 else 0.0
+                upper = bounds[index] if index < len(bounds) else max(max_value, lower)
+
+                return min(
+                    lower + (upper - lower) * (rank - cumulated) / count, max_value
+                )
+
+            cumulated += count
+
+        return max_value
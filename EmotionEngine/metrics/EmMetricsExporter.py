@@ -0,0 +1,306 @@
+import os
+import json
+import queue
+import socket
+import threading
+
+from typing import Dict, List, Tuple
+
+from EmotionEngine.metrics.EmHistogram import EmHistogram
+
+
+class EmMetricsExporter:
+    """
+    Exports collected metrics (see `EmMetricsRegistry.collect`) on a background
+    thread, so writing them never stalls the game loop.
+
+    Supported targets:
+        - a file path: one JSON object per line, with the counters totals, the
+          gauges and a summary of each histogram over the exported interval (count,
+          mean, 50th, 95th and 99th percentiles, max). The file is rotated to
+          `path.1`, `path.2`, ... once it exceeds `max_bytes`.
+        - "udp://host:port": statsd lines sent to a local collector, counters as
+          interval increases (`|c`), gauges and histograms summaries as gauges (`|g`).
+
+    When the thread falls behind, collections are dropped rather than queued without
+    limit; dropped collections and export errors are reported by `get_stats`. The
+    next exported collection covers the values of the dropped or failed ones: the
+    counts are cumulative, and their histograms maxima are carried over.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(
+        self,
+        target: str,
+        prefix: str = "emotion",
+        max_bytes: int = 1024 * 1024,
+        backups_count: int = 3,
+        queue_size: int = 8,
+    ) -> None:
+        """
+        Initializes the exporter and starts its thread.
+
+        Args:
+            target (str): The file path, or "udp://host:port".
+            prefix (str): The prefix of the statsd metrics names. Default is "emotion".
+            max_bytes (int): The size a file is rotated at. Default is 1 MiB.
+            backups_count (int): The number of rotated files kept. Default is 3.
+            queue_size (int): The number of collections that can wait to be
+                              exported. Default is 8.
+        """
+        self.__prefix = prefix
+        self.__max_bytes = max_bytes
+        self.__backups_count = backups_count
+
+        self.__file_path: str = None
+        self.__file = None
+        self.__socket: socket.socket = None
+        self.__address: Tuple[str, int] = None
+
+        if target.startswith("udp://"):
+            host, port = target[len("udp://") :].rsplit(":", 1)
+            self.__address = (host, int(port))
+            self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        else:
+            self.__file_path = target
+            self.__file = open(target, "a", encoding="UTF-8")
+
+        self.__pending: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.__previous: Dict[str, object] = None
+
+        # Histograms maxima of the collections dropped or failed since the last export
+        self.__missed_maxima: Dict[str, float] = {}
+        self.__missed_maxima_lock = threading.Lock()
+
+        self.__exported = 0
+        self.__dropped = 0
+        self.__errors = 0
+
+        self.__thread = threading.Thread(
+            target=self.__export_collections, name="EmMetricsExporter", daemon=True
+        )
+        self.__thread.start()
+
+    def submit(self, collected: Dict[str, object]) -> bool:
+        """
+        Queues collected metrics for export. Never blocks.
+
+        Args:
+            collected (Dict[str, object]): The metrics, from `EmMetricsRegistry.collect`.
+
+        Returns:
+            bool: True if the metrics were queued, False if they were dropped.
+        """
+        try:
+            self.__pending.put_nowait(collected)
+
+        except queue.Full:
+            self.__dropped += 1
+            self.__carry_maxima(collected)
+            return False
+
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns statistics about the export.
+
+        Returns:
+            Dict[str, int]: The number of exported and dropped collections, and the
+                            number of failed writes or sends.
+        """
+        return {
+            "exported": self.__exported,
+            "dropped": self.__dropped,
+            "errors": self.__errors,
+        }
+
+    def close(self):
+        """
+        Waits for the queued metrics to be exported and closes the target.
+        """
+        self.__pending.put(None)
+        self.__thread.join()
+
+        if self.__file is not None:
+            self.__file.close()
+
+        if self.__socket is not None:
+            self.__socket.close()
+
+    def __export_collections(self):
+        """
+        Exporter thread: exports the queued metrics until the exporter is closed.
+        """
+        while True:
+            collected = self.__pending.get()
+
+            if collected is None:
+                break
+
+            collected = self.__merge_missed_maxima(collected)
+
+            try:
+                if self.__socket is not None:
+                    self.__send_statsd(collected)
+
+                else:
+                    self.__write_line(collected)
+
+            # A missing collector or a full disk must not stop the export: the next
+            # export covers this interval as well
+            except OSError:
+                self.__errors += 1
+                self.__carry_maxima(collected)
+                continue
+
+            self.__exported += 1
+            self.__previous = collected
+
+    def __carry_maxima(self, collected: Dict[str, object]):
+        """
+        Keeps the histograms maxima of a collection that was not exported, for the
+        next export.
+        """
+        with self.__missed_maxima_lock:
+            for histogram_name, histogram in collected["histograms"].items():
+                if histogram["max"] > self.__missed_maxima.get(histogram_name, 0.0):
+                    self.__missed_maxima[histogram_name] = histogram["max"]
+
+    def __merge_missed_maxima(self, collected: Dict[str, object]) -> Dict[str, object]:
+        """
+        Returns a collection whose histograms maxima include the ones of the
+        collections dropped or failed since the last export.
+        """
+        with self.__missed_maxima_lock:
+            missed_maxima = self.__missed_maxima
+            self.__missed_maxima = {}
+
+        if not missed_maxima:
+            return collected
+
+        histograms = {
+            histogram_name: dict(
+                histogram,
+                max=max(histogram["max"], missed_maxima.get(histogram_name, 0.0)),
+            )
+            for histogram_name, histogram in collected["histograms"].items()
+        }
+
+        return dict(collected, histograms=histograms)
+
+    def __summarize_histograms(
+        self, collected: Dict[str, object]
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Summarizes the values recorded by each histogram since the previous export.
+        """
+        previous_histograms = (
+            self.__previous["histograms"] if self.__previous is not None else {}
+        )
+        summaries = {}
+
+        for histogram_name, histogram in collected["histograms"].items():
+            counts = histogram["counts"]
+            count = histogram["count"]
+            total = histogram["sum"]
+
+            previous = previous_histograms.get(histogram_name)
+
+            if previous is not None:
+                counts = [
+                    count - previous_count
+                    for count, previous_count in zip(counts, previous["counts"])
+                ]
+                count -= previous["count"]
+                total -= previous["sum"]
+
+            summary = {"count": count, "mean": total / count if count else 0.0}
+
+            for percentile in EmMetricsExporter.PERCENTILES:
+                summary[f"p{percentile}"] = EmHistogram.compute_percentile(
+                    histogram["bounds"], counts, percentile, histogram["max"]
+                )
+
+            summary["max"] = histogram["max"]
+            summaries[histogram_name] = summary
+
+        return summaries
+
+    def __write_line(self, collected: Dict[str, object]):
+        """
+        Appends the metrics to the file as a JSON line, and rotates the file once it
+        is too large.
+        """
+        line = json.dumps(
+            {
+                "time": collected["time"],
+                "counters": collected["counters"],
+                "gauges": collected["gauges"],
+                "histograms": self.__summarize_histograms(collected),
+            }
+        )
+        self.__file.write(line + "\n")
+        self.__file.flush()
+
+        if self.__file.tell() >= self.__max_bytes:
+            self.__rotate_file()
+
+    def __rotate_file(self):
+        """
+        Shifts the rotated files (`path.1` becomes `path.2`, ...) and starts a new
+        file.
+        """
+        self.__file.close()
+
+        for index in range(self.__backups_count - 1, 0, -1):
+            rotated_path = f"{self.__file_path}.{index}"
+
+            if os.path.exists(rotated_path):
+                os.replace(rotated_path, f"{self.__file_path}.{index + 1}")
+
+        if self.__backups_count > 0:
+            os.replace(self.__file_path, f"{self.__file_path}.1")
+
+        else:
+            os.remove(self.__file_path)
+
+        self.__file = open(self.__file_path, "a", encoding="UTF-8")
+
+    def __send_statsd(self, collected: Dict[str, object]):
+        """
+        Sends the metrics as statsd lines, in datagrams of at most 1400 bytes.
+        """
+        previous_counters = (
+            self.__previous["counters"] if self.__previous is not None else {}
+        )
+        lines: List[str] = []
+
+        for counter_name, value in collected["counters"].items():
+            increase = value - previous_counters.get(counter_name, 0)
+            lines.append(f"{self.__prefix}.{counter_name}:{increase}|c")
+
+        for gauge_name, value in collected["gauges"].items():
+            lines.append(f"{self.__prefix}.{gauge_name}:{value:g}|g")
+
+        for histogram_name, summary in self.__summarize_histograms(collected).items():
+            for statistic, value in summary.items():
+                lines.append(
+                    f"{self.__prefix}.{histogram_name}.{statistic}:{value:g}|g"
+                )
+
+        datagram = b""
+
+        for line in lines:
+            encoded_line = line.encode("UTF-8")
+
+            if datagram and len(datagram) + 1 + len(encoded_line) > 1400:
+                self.__socket.sendto(datagram, self.__address)
+                datagram = b""
+
+            datagram = datagram + b"\n" + encoded_line if datagram else encoded_line
+
+        if datagram:
+            self.__socket.sendto(datagram, self.__address)
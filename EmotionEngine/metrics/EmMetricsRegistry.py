@@ -0,0 +1,127 @@
+import time
+
+from typing import Dict, Sequence
+
+from EmotionEngine.metrics.EmHistogram import EmHistogram
+
+
+class EmMetricsRegistry:
+    """
+    Holds the engine's runtime metrics, by name:
+
+        - counters, only increasing (e.g. "frames", "dropped_frames"),
+        - gauges, set to the latest value (e.g. "entities.Ball", "cache.images.hit_rate"),
+        - histograms of values (e.g. "frame_ms").
+
+    Games can record their own metrics through `EmEntityHelper.retrieve_metrics`.
+    `collect` copies every metric, to be exported by an `EmMetricsExporter`.
+    """
+
+    def __init__(self) -> None:
+        self.__counters: Dict[str, int] = {}
+        self.__gauges: Dict[str, float] = {}
+        self.__histograms: Dict[str, EmHistogram] = {}
+
+    def increment(self, counter_name: str, value: int = 1):
+        """
+        Increases a counter, created at 0 on the first call.
+
+        Args:
+            counter_name (str): The name of the counter.
+            value (int): The increase. Default is 1.
+        """
+        self.__counters[counter_name] = self.__counters.get(counter_name, 0) + value
+
+    def get_counter(self, counter_name: str) -> int:
+        """
+        Returns the value of a counter.
+
+        Args:
+            counter_name (str): The name of the counter.
+
+        Returns:
+            int: The counter's value, 0 if it was never increased.
+        """
+        return self.__counters.get(counter_name, 0)
+
+    def set_gauge(self, gauge_name: str, value: float):
+        """
+        Sets the value of a gauge.
+
+        Args:
+            gauge_name (str): The name of the gauge.
+            value (float): The new value.
+        """
+        self.__gauges[gauge_name] = value
+
+    def get_gauge(self, gauge_name: str) -> float:
+        """
+        Returns the value of a gauge.
+
+        Args:
+            gauge_name (str): The name of the gauge.
+
+        Returns:
+            float: The gauge's value, 0 if it was never set.
+        """
+        return self.__gauges.get(gauge_name, 0.0)
+
+    def get_histogram(
+        self, histogram_name: str, bounds: Sequence[float] = EmHistogram.DEFAULT_BOUNDS
+    ) -> EmHistogram:
+        """
+        Returns a histogram, created with the given buckets on the first call.
+
+        Args:
+            histogram_name (str): The name of the histogram.
+            bounds (Sequence[float]): The upper bounds of the buckets, used when the
+                                      histogram is created.
+                                      Default is `EmHistogram.DEFAULT_BOUNDS`.
+
+        Returns:
+            EmHistogram: The histogram.
+        """
+        histogram = self.__histograms.get(histogram_name)
+
+        if histogram is None:
+            histogram = self.__histograms[histogram_name] = EmHistogram(bounds)
+
+        return histogram
+
+    def observe(self, histogram_name: str, value: float):
+        """
+        Records a value in a histogram, created with the default buckets on the first
+        call.
+
+        Args:
+            histogram_name (str): The name of the histogram.
+            value (float): The value to record.
+        """
+        self.get_histogram(histogram_name).observe(value)
+
+    def collect(self) -> Dict[str, object]:
+        """
+        Copies every metric. The histograms start a new interval for their maximum.
+
+        Returns:
+            Dict[str, object]: The collection "time" (`time.time`), and the
+                               "counters", "gauges" and "histograms" by name (see
+                               `EmHistogram.collect`).
+        """
+        return {
+            "time": time.time(),
+            "counters": dict(self.__counters),
+            "gauges": dict(self.__gauges),
+            "histograms": {
+                histogram_name: histogram.collect()
+                for histogram_name, histogram in self.__histograms.items()
+            },
+        }
+
+    def reset(self):
+        """
+        Forgets every metric.
+        """
+        self.__counters.clear()
+        self.__gauges.clear()
+        self.__histograms.clear()
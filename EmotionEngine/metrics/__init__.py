@@ -0,0 +1,3 @@
+from .EmHistogram import *
+from .EmMetricsRegistry import *
+from .EmMetricsExporter import *
@@ -0,0 +1,557 @@
+import time
+import zlib
+import random
+import socket
+import struct
+
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+from EmotionEngine.EmInputsManager import EmInputsManager
+
+if TYPE_CHECKING:
+    from EmotionEngine.EmEngine import EmEngine
+    from EmotionEngine.sound.EmChannelsManager import EmChannelsManager
+
+PACKET_INPUTS = 1
+PACKET_STATE = 2
+
+# Inputs packet: type, first input frame, last remote frame received without gaps,
+# last state frame received, inputs count, then one bitmask per frame
+INPUTS_HEADER = struct.Struct("<BiiiB")
+INPUT_FORMAT = "<{}H"
+
+# State packet: type, frame, baseline frame (-1 if none), then the compressed state
+STATE_HEADER = struct.Struct("<Bii")
+
+MAX_INPUTS_PER_PACKET = 64
+MAX_PACKET_SIZE = 65507
+KEPT_STATES_COUNT = 8
+
+
+class EmNetSession:
+    """
+    A two-player networked session over UDP, kept in sync by rollback.
+
+    Both peers run the same deterministic simulation, with a fixed frame duration,
+    and only exchange their inputs. Every packet repeats the local inputs the remote
+    peer has not acknowledged yet, so lost packets need no retransmission. When the
+    remote input of a frame is not known yet, it is predicted (the last known input
+    is repeated) and the frame is simulated right away. If a prediction turns out to
+    be wrong, the world snapshot saved before the mispredicted frame is restored and
+    the frames since are simulated again with the right inputs (with the sounds
+    muted), before the current frame is drawn.
+
+    Player 0 also sends, every `state_sync_interval` frames, the world state of its
+    latest frame whose inputs are all confirmed. The state is quantized and
+    delta-compressed against the last state acknowledged by player 1, which checks it
+    against its own state of that frame and adopts it if they diverged.
+
+    Rollbacks, re-simulation cost, prediction and bandwidth are reported by
+    `get_stats`.
+    """
+
+    def __init__(
+        self,
+        engine_ref: "EmEngine",
+        inputs_manager: EmInputsManager,
+        channels_manager: "EmChannelsManager",
+        local_player: int,
+        local_port: int,
+        remote_address: Tuple[str, int],
+        frame_duration_ms: float = 1000 / 60,
+        input_delay: int = 2,
+        max_prediction: int = 8,
+        state_sync_interval: int = 30,
+        position_step: float = 1 / 64,
+    ) -> None:
+        """
+        Initializes the session and opens its socket.
+
+        Args:
+            engine_ref (EmEngine): The engine running the simulation.
+            inputs_manager (EmInputsManager): The manager holding the players' inputs.
+            channels_manager (EmChannelsManager): The channels manager, muted while
+                                                  frames are simulated again.
+            local_player (int): The index of the local player, 0 or 1.
+            local_port (int): The UDP port to listen on.
+            remote_address (Tuple[str, int]): The host and UDP port of the remote peer.
+            frame_duration_ms (float): The fixed duration of a simulated frame, in
+                                       milliseconds. Default is 1000 / 60.
+            input_delay (int): The number of frames local inputs are delayed by, which
+                               gives them time to reach the remote peer and makes
+                               rollbacks rarer. Default is 2.
+            max_prediction (int): The maximum number of frames simulated ahead of the
+                                  last confirmed remote input. Beyond that, the
+                                  simulation waits for the remote peer. Default is 8.
+            state_sync_interval (int): The number of frames between two state
+                                       synchronizations. Default is 30.
+            position_step (float): The precision positions are quantized to in the
+                                   synchronized states. Default is 1 / 64 pixel.
+        """
+        assert local_player in (0, 1)
+
+        self.__engine_ref = engine_ref
+        self.__inputs_manager = inputs_manager
+        self.__channels_manager = channels_manager
+        self.__local_player = local_player
+        self.__remote_player = 1 - local_player
+        self.__remote_address = remote_address
+        self.__frame_duration_ms = frame_duration_ms
+        self.__input_delay = input_delay
+        self.__max_prediction = max_prediction
+        self.__state_sync_interval = state_sync_interval
+        self.__position_step = position_step
+
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__socket.bind(("", local_port))
+        self.__socket.setblocking(False)
+
+        # Inputs by frame. The first frames, before the input delay, have no input
+        self.__local_inputs: Dict[int, int] = {frame: 0 for frame in range(input_delay)}
+        self.__remote_inputs: Dict[int, int] = {}
+        self.__predicted_inputs: Dict[int, int] = {}
+
+        # Last remote frame whose inputs (and all the previous ones) are known, and
+        # last local frame the remote peer acknowledged
+        self.__remote_confirmed_frame = -1
+        self.__remote_acknowledged_frame = -1
+        self.__rollback_frame: Optional[int] = None
+
+        # World snapshot and random generator state before each unconfirmed frame
+        self.__snapshots: Dict[int, Tuple[bytes, object]] = {}
+
+        # Quantized states of the synchronization frames: simulated locally, sent
+        # (player 0) and received (player 1)
+        self.__local_states: Dict[int, Tuple[bytes, object]] = {}
+        self.__sent_states: Dict[int, bytes] = {}
+        self.__received_states: Dict[int, bytes] = {}
+        self.__last_sent_state_frame = -1
+        self.__acknowledged_state_frame = -1
+        self.__last_received_state_frame = -1
+        self.__last_checked_state_frame = -1
+
+        self.__stats = {
+            "predicted_frames": 0,
+            "mispredictions": 0,
+            "rollbacks": 0,
+            "max_rollback_depth": 0,
+            "resimulated_frames": 0,
+            "resimulation_ms": 0.0,
+            "max_resimulation_ms": 0.0,
+            "stalled_frames": 0,
+            "states_sent": 0,
+            "states_received": 0,
+            "states_checked": 0,
+            "desyncs": 0,
+            "packets_sent": 0,
+            "packets_received": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+        }
+
+    def get_local_player(self) -> int:
+        """
+        Returns the index of the local player.
+
+        Returns:
+            int: 0 or 1.
+        """
+        return self.__local_player
+
+    def get_frame_duration_ms(self) -> float:
+        """
+        Returns the fixed duration of a simulated frame.
+
+        Returns:
+            float: The frame duration, in milliseconds.
+        """
+        return self.__frame_duration_ms
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns statistics about the session.
+
+        Returns:
+            Dict[str, float]: The number of frames simulated with a predicted remote
+                              input, of mispredictions and rollbacks, the maximum
+                              and average rollback depth (in frames), the number of
+                              frames simulated again and the time spent doing so, the
+                              number of frames spent waiting for the remote peer, the
+                              number of synchronized states and desyncs, and the
+                              packets and bytes sent and received.
+        """
+        stats = dict(self.__stats)
+        stats["frame"] = self.__engine_ref.get_frame_number()
+        stats["remote_confirmed_frame"] = self.__remote_confirmed_frame
+        stats["average_rollback_depth"] = stats["resimulated_frames"] / max(
+            stats["rollbacks"], 1
+        )
+
+        return stats
+
+    def advance_frame(self, simulate: Callable[[float], None]) -> bool:
+        """
+        Runs the network side of a frame: receives the remote inputs and states,
+        rolls back if needed, then simulates the next frame unless the local peer is
+        too far ahead of the remote one. Called by the engine once per frame.
+
+        Args:
+            simulate (Callable[[float], None]): The engine function simulating a frame
+                                                of a given duration.
+
+        Returns:
+            bool: True if a new frame was simulated, False if the session is waiting
+                  for the remote peer.
+        """
+        self.__receive_packets()
+
+        if self.__rollback_frame is not None:
+            self.__rollback(self.__rollback_frame, simulate)
+            self.__rollback_frame = None
+
+        self.__check_received_states(simulate)
+
+        frame = self.__engine_ref.get_frame_number()
+
+        if frame - self.__remote_confirmed_frame > self.__max_prediction:
+            self.__stats["stalled_frames"] += 1
+            self.__send_inputs()
+            return False
+
+        self.__local_inputs[frame + self.__input_delay] = (
+            self.__inputs_manager.capture_local_input()
+        )
+        self.__send_inputs()
+
+        self.__simulate_frame(frame, simulate)
+
+        if self.__local_player == 0:
+            self.__send_state()
+
+        self.__prune()
+
+        return True
+
+    def close(self):
+        """
+        Closes the session's socket.
+        """
+        self.__socket.close()
+
+    def __simulate_frame(self, frame: int, simulate: Callable[[float], None]):
+        """
+        Saves the world before a frame, sets the players' inputs and simulates it.
+        """
+        engine = self.__engine_ref
+        self.__snapshots[frame] = (engine.take_snapshot(), random.getstate())
+
+        if frame % self.__state_sync_interval == 0:
+            self.__local_states[frame] = (
+                engine.take_snapshot(self.__position_step),
+                random.getstate(),
+            )
+
+        remote_input = self.__remote_inputs.get(frame)
+
+        if remote_input is None:
+            remote_input = self.__remote_inputs.get(self.__remote_confirmed_frame, 0)
+            self.__predicted_inputs[frame] = remote_input
+            self.__stats["predicted_frames"] += 1
+
+        else:
+            self.__predicted_inputs.pop(frame, None)
+
+        self.__inputs_manager.set_player_input(
+            self.__local_player, self.__local_inputs[frame]
+        )
+        self.__inputs_manager.set_player_input(self.__remote_player, remote_input)
+
+        simulate(self.__frame_duration_ms)
+
+    def __rollback(self, from_frame: int, simulate: Callable[[float], None]):
+        """
+        Restores the world as it was before a frame, and simulates the following
+        frames again up to the current one.
+        """
+        engine = self.__engine_ref
+        current_frame = engine.get_frame_number()
+
+        if from_frame not in self.__snapshots or from_frame >= current_frame:
+            return
+
+        started_at = time.perf_counter()
+
+        snapshot, random_state = self.__snapshots[from_frame]
+        engine.restore_snapshot(snapshot)
+        random.setstate(random_state)
+
+        self.__channels_manager.set_muted(True)
+
+        for frame in range(from_frame, current_frame):
+            self.__simulate_frame(frame, simulate)
+
+        self.__channels_manager.set_muted(False)
+
+        depth = current_frame - from_frame
+        resimulation_ms = (time.perf_counter() - started_at) * 1000
+
+        stats = self.__stats
+        stats["rollbacks"] += 1
+        stats["max_rollback_depth"] = max(stats["max_rollback_depth"], depth)
+        stats["resimulated_frames"] += depth
+        stats["resimulation_ms"] += resimulation_ms
+        stats["max_resimulation_ms"] = max(
+            stats["max_resimulation_ms"], resimulation_ms
+        )
+
+    def __receive_packets(self):
+        """
+        Reads every pending packet from the socket.
+        """
+        while True:
+            try:
+                packet = self.__socket.recv(MAX_PACKET_SIZE)
+
+            except (BlockingIOError, ConnectionResetError):
+                break
+
+            self.__stats["packets_received"] += 1
+            self.__stats["bytes_received"] += len(packet)
+
+            if packet[0] == PACKET_INPUTS:
+                self.__receive_inputs(packet)
+
+            elif packet[0] == PACKET_STATE:
+                self.__receive_state(packet)
+
+    def __receive_inputs(self, packet: bytes):
+        """
+        Stores the remote inputs of a packet and schedules a rollback if one of them
+        was mispredicted.
+        """
+        _, first_frame, acknowledged_frame, state_frame, count = (
+            INPUTS_HEADER.unpack_from(packet)
+        )
+        inputs = struct.unpack_from(
+            INPUT_FORMAT.format(count), packet, INPUTS_HEADER.size
+        )
+
+        self.__remote_acknowledged_frame = max(
+            self.__remote_acknowledged_frame, acknowledged_frame
+        )
+        self.__acknowledged_state_frame = max(
+            self.__acknowledged_state_frame, state_frame
+        )
+
+        for frame, remote_input in enumerate(inputs, first_frame):
+            if frame <= self.__remote_confirmed_frame or frame in self.__remote_inputs:
+                continue
+
+            self.__remote_inputs[frame] = remote_input
+            predicted_input = self.__predicted_inputs.pop(frame, None)
+
+            if predicted_input is not None and predicted_input != remote_input:
+                self.__stats["mispredictions"] += 1
+
+                if self.__rollback_frame is None or frame < self.__rollback_frame:
+                    self.__rollback_frame = frame
+
+        while self.__remote_confirmed_frame + 1 in self.__remote_inputs:
+            self.__remote_confirmed_frame += 1
+
+    def __send_inputs(self):
+        """
+        Sends the local inputs the remote peer has not acknowledged yet.
+        """
+        first_frame = self.__remote_acknowledged_frame + 1
+        last_frame = min(
+            max(self.__local_inputs, default=first_frame - 1),
+            first_frame + MAX_INPUTS_PER_PACKET - 1,
+        )
+        inputs = [
+            self.__local_inputs.get(frame, 0)
+            for frame in range(first_frame, last_frame + 1)
+        ]
+
+        self.__send(
+            INPUTS_HEADER.pack(
+                PACKET_INPUTS,
+                first_frame,
+                self.__remote_confirmed_frame,
+                self.__last_received_state_frame,
+                len(inputs),
+            )
+            + struct.pack(INPUT_FORMAT.format(len(inputs)), *inputs)
+        )
+
+    def __send_state(self):
+        """
+        Sends the latest synchronization state whose inputs are all confirmed, delta
+        compressed against the last state acknowledged by the remote peer.
+        """
+        confirmed_frames = self.__remote_confirmed_frame + 1
+        frame = confirmed_frames - confirmed_frames % self.__state_sync_interval
+
+        if frame <= self.__last_sent_state_frame or frame not in self.__local_states:
+            return
+
+        state = self.__local_states[frame][0]
+        baseline_frame = self.__acknowledged_state_frame
+        baseline = self.__sent_states.get(baseline_frame)
+
+        if baseline is None or len(baseline) != len(state):
+            baseline_frame = -1
+            baseline = None
+
+        self.__send(
+            STATE_HEADER.pack(PACKET_STATE, frame, baseline_frame)
+            + EmNetSession.__encode_state(state, baseline)
+        )
+
+        self.__sent_states[frame] = state
+        self.__last_sent_state_frame = frame
+        self.__stats["states_sent"] += 1
+
+    def __receive_state(self, packet: bytes):
+        """
+        Decodes a synchronization state sent by player 0.
+        """
+        _, frame, baseline_frame = STATE_HEADER.unpack_from(packet)
+
+        if frame <= self.__last_received_state_frame:
+            return
+
+        baseline = None
+
+        if baseline_frame >= 0:
+            baseline = self.__received_states.get(baseline_frame)
+
+            # The baseline was dropped: wait for a state this peer can decode
+            if baseline is None:
+                return
+
+        self.__received_states[frame] = EmNetSession.__decode_state(
+            packet[STATE_HEADER.size :], baseline
+        )
+        self.__last_received_state_frame = frame
+        self.__stats["states_received"] += 1
+
+    def __check_received_states(self, simulate: Callable[[float], None]):
+        """
+        Compares the received states with the local ones once the local inputs of
+        their frames are all confirmed, and adopts them on divergence.
+        """
+        current_frame = self.__engine_ref.get_frame_number()
+
+        for frame in sorted(self.__received_states):
+            if (
+                frame <= self.__last_checked_state_frame
+                or frame > self.__remote_confirmed_frame + 1
+                or frame >= current_frame
+            ):
+                continue
+
+            self.__last_checked_state_frame = frame
+            local_state = self.__local_states.get(frame)
+
+            if local_state is None:
+                continue
+
+            self.__stats["states_checked"] += 1
+            state = self.__received_states[frame]
+
+            if local_state[0] != state:
+                self.__stats["desyncs"] += 1
+                self.__snapshots[frame] = (state, local_state[1])
+                self.__rollback(frame, simulate)
+
+    def __prune(self):
+        """
+        Forgets the inputs, snapshots and states that can no longer be needed.
+        """
+        # Frames up to this one were simulated with confirmed inputs only, and will
+        # never be simulated again unless a received state diverges
+        settled_frame = min(
+            self.__remote_confirmed_frame, self.__engine_ref.get_frame_number() - 1
+        )
+
+        for frame in [frame for frame in self.__snapshots if frame <= settled_frame]:
+            del self.__snapshots[frame]
+
+        # Player 1 simulates again from a diverging state's frame, so the inputs are
+        # kept back to the oldest local state not checked yet
+        kept_inputs_frame = settled_frame
+
+        if self.__local_player == 1:
+            kept_inputs_frame = min(
+                [kept_inputs_frame]
+                + [
+                    frame
+                    for frame in self.__local_states
+                    if frame > self.__last_checked_state_frame
+                ]
+            )
+
+        for frame in [
+            frame for frame in self.__remote_inputs if frame < kept_inputs_frame
+        ]:
+            del self.__remote_inputs[frame]
+
+        # Local inputs are also kept until the remote peer received them
+        acknowledged_frame = min(
+            self.__remote_acknowledged_frame, settled_frame, kept_inputs_frame - 1
+        )
+
+        for frame in [
+            frame for frame in self.__local_inputs if frame <= acknowledged_frame
+        ]:
+            del self.__local_inputs[frame]
+
+        for states in (self.__local_states, self.__sent_states, self.__received_states):
+            for frame in sorted(states)[:-KEPT_STATES_COUNT]:
+                del states[frame]
+
+    def __send(self, packet: bytes):
+        """
+        Sends a packet to the remote peer.
+        """
+        try:
+            self.__socket.sendto(packet, self.__remote_address)
+
+        except (BlockingIOError, ConnectionRefusedError):
+            return
+
+        self.__stats["packets_sent"] += 1
+        self.__stats["bytes_sent"] += len(packet)
+
+    @staticmethod
+    def __encode_state(state: bytes, baseline: Optional[bytes]) -> bytes:
+        """
+        Compresses a state, as its difference (XOR) with a baseline if given: the
+        unchanged bytes become zeros, which compress very well.
+        """
+        if baseline is not None:
+            state = EmNetSession.__xor(state, baseline)
+
+        return zlib.compress(state)
+
+    @staticmethod
+    def __decode_state(payload: bytes, baseline: Optional[bytes]) -> bytes:
+        """
+        Decompresses a state encoded by `__encode_state`.
+        """
+        state = zlib.decompress(payload)
+
+        if baseline is not None:
+            state = EmNetSession.__xor(state, baseline)
+
+        return state
+
+    @staticmethod
+    def __xor(first: bytes, second: bytes) -> bytes:
+        """
+        Computes the bytewise XOR of two buffers of the same size.
+        """
+        return (
+            int.from_bytes(first, "little") ^ int.from_bytes(second, "little")
+        ).to_bytes(len(first), "little")
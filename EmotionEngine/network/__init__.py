@@ -0,0 +1 @@
+from .EmNetSession import *
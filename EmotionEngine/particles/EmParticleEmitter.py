@@ -0,0 +1,445 @@
+import pygame
+
+from typing import Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class EmParticleEmitter:
+    """
+    Emits and simulates many small particles, without one entity per particle.
+
+    The particles' positions, velocities, ages, lifetimes and colors are kept in
+    preallocated NumPy arrays, with the live particles packed at the start: every
+    step updates them with a few vectorized operations and fills the slots of the
+    dead particles with the last live ones. Particles are drawn as squares of `size`
+    pixels written directly into the surface's pixels (`pygame.surfarray`), without
+    blending.
+
+    Units are pixels and milliseconds: speeds in px/ms, gravity in px/ms², damping
+    as the fraction of velocity lost per millisecond.
+
+    Requires NumPy.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        position: Tuple[float, float] = (0.0, 0.0),
+        rate: float = 0.0,
+        lifetime: Tuple[float, float] = (500.0, 1000.0),
+        speed: Tuple[float, float] = (0.05, 0.2),
+        direction: float = 0.0,
+        spread: float = 360.0,
+        gravity: Tuple[float, float] = (0.0, 0.0),
+        damping: float = 0.0,
+        start_color: Tuple[int, int, int] = (255, 255, 255),
+        end_color: Optional[Tuple[int, int, int]] = None,
+        size: int = 1,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the emitter and preallocates its arrays.
+
+        Args:
+            capacity (int): The maximum number of live particles. Particles emitted
+                            beyond it are dropped. Default is 10000.
+            position (Tuple[float, float]): The world position particles are emitted
+                                            from. Default is (0, 0).
+            rate (float): The number of particles emitted per second. Default is 0
+                          (only bursts, see `emit`).
+            lifetime (Tuple[float, float]): The range of the particles' lifetime, in
+                                            milliseconds. Default is (500, 1000).
+            speed (Tuple[float, float]): The range of the particles' initial speed,
+                                         in px/ms. Default is (0.05, 0.2).
+            direction (float): The emission direction, in degrees. Default is 0.
+            spread (float): The angle around the direction particles are emitted in,
+                            in degrees. Default is 360 (every direction).
+            gravity (Tuple[float, float]): The acceleration applied to the particles,
+                                           in px/ms². Default is (0, 0).
+            damping (float): The fraction of velocity lost per millisecond, in [0, 1[.
+                             Default is 0.
+            start_color (Tuple[int, int, int]): The color of new particles.
+                                                Default is white.
+            end_color (Optional[Tuple[int, int, int]]): The color particles fade to
+                                                        at the end of their life.
+                                                        Default is None (no fading).
+            size (int): The width and height of a particle, in pixels. Default is 1.
+            seed (Optional[int]): The seed of the emitter's random generator, which
+                                  is separate from the game's. Default is None.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError(
+                "EmParticleEmitter requires NumPy, install it with 'pip install numpy'"
+            )
+
+        assert capacity > 0
+        assert 0 <= damping < 1
+        assert size >= 1
+
+        self.__capacity = capacity
+        self.__position = (float(position[0]), float(position[1]))
+        self.__rate = rate
+        self.__lifetime = lifetime
+        self.__speed = speed
+        self.__direction = direction
+        self.__spread = spread
+        self.__gravity = numpy.array(gravity, dtype=numpy.float32)
+        self.__damping = damping
+        self.__start_color = start_color
+        self.__end_color = end_color
+        self.__size = size
+        self.__random = numpy.random.default_rng(seed)
+
+        # Fraction of a particle left to emit by the rate, carried to the next step
+        self.__pending_emission = 0.0
+        self.__count = 0
+
+        self.__positions = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.__velocities = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.__ages = numpy.zeros(capacity, dtype=numpy.float32)
+        self.__lifetimes = numpy.ones(capacity, dtype=numpy.float32)
+        self.__colors = numpy.zeros((capacity, 3), dtype=numpy.uint8)
+
+    def get_capacity(self) -> int:
+        """
+        Returns the maximum number of live particles.
+
+        Returns:
+            int: The capacity of the emitter.
+        """
+        return self.__capacity
+
+    def get_particles_count(self) -> int:
+        """
+        Returns the number of live particles.
+
+        Returns:
+            int: The number of particles.
+        """
+        return self.__count
+
+    def get_size(self) -> int:
+        """
+        Returns the size of the particles.
+
+        Returns:
+            int: The width and height of a particle, in pixels.
+        """
+        return self.__size
+
+    def get_position(self) -> Tuple[float, float]:
+        """
+        Returns the position particles are emitted from.
+
+        Returns:
+            Tuple[float, float]: The world position of the emitter.
+        """
+        return self.__position
+
+    def set_position(self, x: float, y: float):
+        """
+        Moves the emitter. Live particles are not moved.
+
+        Args:
+            x (float): The world x coordinate.
+            y (float): The world y coordinate.
+        """
+        self.__position = (float(x), float(y))
+
+    def get_rate(self) -> float:
+        """
+        Returns the number of particles emitted per second.
+
+        Returns:
+            float: The emission rate.
+        """
+        return self.__rate
+
+    def set_rate(self, new_rate: float):
+        """
+        Sets the number of particles emitted per second.
+
+        Args:
+            new_rate (float): The emission rate, 0 to stop emitting.
+        """
+        self.__rate = new_rate
+
+    def set_direction(self, direction: float, spread: float = None):
+        """
+        Sets the direction particles are emitted in.
+
+        Args:
+            direction (float): The emission direction, in degrees.
+            spread (float): The angle around the direction, in degrees. Default is
+                            None (unchanged).
+        """
+        self.__direction = direction
+
+        if spread is not None:
+            self.__spread = spread
+
+    def emit(self, count: int, color: Optional[Tuple[int, int, int]] = None) -> int:
+        """
+        Emits a burst of particles from the emitter's position.
+
+        Args:
+            count (int): The number of particles to emit.
+            color (Optional[Tuple[int, int, int]]): The color of the particles.
+                                                    Default is None (start color).
+
+        Returns:
+            int: The number of particles emitted, less than `count` if the emitter
+                 is full.
+        """
+        start = self.__count
+        count = min(count, self.__capacity - start)
+
+        if count <= 0:
+            return 0
+
+        end = start + count
+        random = self.__random
+
+        angles = numpy.radians(
+            random.uniform(
+                self.__direction - self.__spread / 2,
+                self.__direction + self.__spread / 2,
+                count,
+            )
+        )
+        speeds = random.uniform(self.__speed[0], self.__speed[1], count)
+
+        self.__positions[start:end] = self.__position
+        self.__velocities[start:end, 0] = numpy.cos(angles) * speeds
+        self.__velocities[start:end, 1] = numpy.sin(angles) * speeds
+        self.__ages[start:end] = 0
+        self.__lifetimes[start:end] = random.uniform(
+            self.__lifetime[0], self.__lifetime[1], count
+        )
+        self.__colors[start:end] = self.__start_color if color is None else color
+        self.__count = end
+
+        return count
+
+    def clear(self):
+        """
+        Removes every live particle.
+        """
+        self.__count = 0
+        self.__pending_emission = 0.0
+
+    def update(self, dt: float):
+        """
+        Emits the particles of the rate, ages the live particles, removes the dead
+        ones and moves the others.
+
+        Args:
+            dt (float): The time delta since the last frame, in milliseconds.
+        """
+        if self.__rate > 0:
+            self.__pending_emission += self.__rate * dt / 1000
+            emitted = int(self.__pending_emission)
+            self.__pending_emission -= emitted
+            self.emit(emitted)
+
+        count = self.__count
+
+        if count == 0:
+            return
+
+        ages = self.__ages[:count]
+        ages += dt
+
+        alive = ages < self.__lifetimes[:count]
+
+        if not alive.all():
+            count = self.__pack(alive)
+
+        velocities = self.__velocities[:count]
+        velocities += self.__gravity * dt
+
+        if self.__damping > 0:
+            velocities *= (1 - self.__damping) ** dt
+
+        self.__positions[:count] += velocities * dt
+
+    def __pack(self, alive: "numpy.ndarray") -> int:
+        """
+        Moves live particles from the end of the arrays into the slots of the dead
+        ones, so the live particles stay packed at the start. Costs one copy per dead
+        particle rather than per live one; the particles' order is not kept.
+
+        Returns:
+            int: The number of live particles.
+        """
+        count = int(numpy.count_nonzero(alive))
+        dead_indices = numpy.flatnonzero(~alive)
+        holes = dead_indices[dead_indices < count]
+        fillers = numpy.flatnonzero(alive[count:]) + count
+
+        for array in (
+            self.__positions,
+            self.__velocities,
+            self.__ages,
+            self.__lifetimes,
+            self.__colors,
+        ):
+            array[holes] = array[fillers]
+
+        self.__count = count
+
+        return count
+
+    def capture_particles(
+        self, copy: bool = True
+    ) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns the positions and current colors of the live particles, to draw them
+        with `draw_particles`.
+
+        Args:
+            copy (bool): Whether to copy the arrays, so they can be drawn on another
+                         thread while the emitter keeps being updated. Default is
+                         True.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The positions (float32, shape
+                                                 (count, 2)) and colors (uint8,
+                                                 shape (count, 3)).
+        """
+        count = self.__count
+        positions = self.__positions[:count]
+        colors = self.__colors[:count]
+
+        if self.__end_color is not None:
+            progress = self.__ages[:count] / self.__lifetimes[:count]
+            end_color = numpy.array(self.__end_color, dtype=numpy.float32)
+            colors = (colors + (end_color - colors) * progress[:, None]).astype(
+                numpy.uint8
+            )
+
+        elif copy:
+            colors = colors.copy()
+
+        if copy:
+            positions = positions.copy()
+
+        return positions, colors
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: Tuple[float, float] = (0, 0),
+        zoom: float = 1.0,
+    ):
+        """
+        Writes the live particles into the pixels of a surface, inside its clip area.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto, of 24 or 32 bits.
+            offset (Tuple[float, float]): The world position shown at the surface's
+                                          top left corner. Default is (0, 0).
+            zoom (float): The number of surface pixels per world unit. Default is 1.
+        """
+        positions, colors = self.capture_particles(copy=False)
+        EmParticleEmitter.draw_particles(
+            surface, positions, colors, self.__size, offset, zoom
+        )
+
+    @staticmethod
+    def draw_particles(
+        surface: pygame.Surface,
+        positions: "numpy.ndarray",
+        colors: "numpy.ndarray",
+        size: int,
+        offset: Tuple[float, float] = (0, 0),
+        zoom: float = 1.0,
+    ):
+        """
+        Writes particles captured by `capture_particles` into the pixels of a surface,
+        inside its clip area.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto, of 24 or 32 bits.
+            positions (numpy.ndarray): The particles' positions.
+            colors (numpy.ndarray): The particles' colors.
+            size (int): The width and height of a particle, in pixels.
+            offset (Tuple[float, float]): The world position shown at the surface's
+                                          top left corner. Default is (0, 0).
+            zoom (float): The number of surface pixels per world unit. Default is 1.
+        """
+        if len(positions) == 0:
+            return
+
+        clip = surface.get_clip()
+        half_size = size // 2
+
+        xs = numpy.floor((positions[:, 0] - offset[0]) * zoom).astype(numpy.intp)
+        ys = numpy.floor((positions[:, 1] - offset[1]) * zoom).astype(numpy.intp)
+        xs -= half_size
+        ys -= half_size
+
+        # Squares partly out of the clip area are skipped rather than cut
+        visible = (
+            (xs >= clip.left)
+            & (xs + size <= clip.right)
+            & (ys >= clip.top)
+            & (ys + size <= clip.bottom)
+        )
+        if not visible.any():
+            return
+
+        xs = xs[visible]
+        ys = ys[visible]
+
+        if surface.get_bytesize() == 4:
+            # One packed integer per pixel rather than three channels
+            shifts = surface.get_shifts()
+            losses = surface.get_losses()
+            colors = colors.astype(numpy.uint32)
+            colors = (
+                ((colors[:, 0] >> losses[0]) << shifts[0])
+                | ((colors[:, 1] >> losses[1]) << shifts[1])
+                | ((colors[:, 2] >> losses[2]) << shifts[2])
+                | (surface.map_rgb((0, 0, 0)) & 0xFFFFFFFF)
+            )
+            pixels = pygame.surfarray.pixels2d(surface)
+
+        else:
+            pixels = pygame.surfarray.pixels3d(surface)
+
+        colors = colors[visible]
+
+        try:
+            for dx in range(size):
+                for dy in range(size):
+                    pixels[xs + dx, ys + dy] = colors
+
+        finally:
+            # Unlocks the surface
+            del pixels
+
+    def get_memory_size(self) -> int:
+        """
+        Returns the memory used by the particles' arrays.
+
+        Returns:
+            int: The size, in bytes.
+        """
+        return sum(
+            array.nbytes
+            for array in (
+                self.__positions,
+                self.__velocities,
+                self.__ages,
+                self.__lifetimes,
+                self.__colors,
+            )
+        )
@@ -0,0 +1,126 @@
+import pygame
+
+from typing import List, Tuple, TYPE_CHECKING
+
+from EmotionEngine.particles.EmParticleEmitter import EmParticleEmitter
+
+if TYPE_CHECKING:
+    import numpy
+
+    from EmotionEngine.camera.EmCamera import EmCamera
+
+
+class EmParticlesManager:
+    """
+    A manager class for the particle emitters.
+
+    Emitters are updated once per frame while the game is not paused, after the
+    simulation, and drawn through the camera above the entities. Particles are
+    visual only: they are not part of world snapshots and are not simulated again
+    when a networked game rolls back.
+    """
+
+    def __init__(self) -> None:
+        self.__emitters: List[EmParticleEmitter] = []
+
+    def create_emitter(self, **emitter_parameters) -> EmParticleEmitter:
+        """
+        Creates an emitter and starts updating and drawing it.
+
+        Args:
+            **emitter_parameters: The parameters of the emitter (see
+                                  `EmParticleEmitter`).
+
+        Returns:
+            EmParticleEmitter: The new emitter.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        emitter = EmParticleEmitter(**emitter_parameters)
+        self.__emitters.append(emitter)
+
+        return emitter
+
+    def remove_emitter(self, emitter: EmParticleEmitter):
+        """
+        Removes an emitter and its particles, if it is managed.
+
+        Args:
+            emitter (EmParticleEmitter): The emitter to remove.
+        """
+        if emitter in self.__emitters:
+            self.__emitters.remove(emitter)
+
+    def get_emitters(self) -> List[EmParticleEmitter]:
+        """
+        Returns the managed emitters, in drawing order.
+
+        Returns:
+            List[EmParticleEmitter]: The emitters.
+        """
+        return self.__emitters
+
+    def get_particles_count(self) -> int:
+        """
+        Returns the number of live particles of every emitter.
+
+        Returns:
+            int: The number of particles.
+        """
+        return sum(emitter.get_particles_count() for emitter in self.__emitters)
+
+    def update(self, dt: float):
+        """
+        Updates every emitter. Called by the engine once per frame.
+
+        Args:
+            dt (float): The time delta since the last frame, in milliseconds.
+        """
+        for emitter in self.__emitters:
+            emitter.update(dt)
+
+    def capture_draw_batches(
+        self, copy: bool = True
+    ) -> List[Tuple["numpy.ndarray", "numpy.ndarray", int]]:
+        """
+        Gathers the particles of every emitter, so they can be drawn later (and on
+        another thread) with `run_draw_batches`.
+
+        Args:
+            copy (bool): Whether to copy the particles' arrays, so the emitters can be
+                         updated while they are drawn. Default is True.
+
+        Returns:
+            List[Tuple[numpy.ndarray, numpy.ndarray, int]]: The particles' positions,
+                colors and size of each emitter having particles, in drawing order.
+        """
+        return [
+            (*emitter.capture_particles(copy), emitter.get_size())
+            for emitter in self.__emitters
+            if emitter.get_particles_count()
+        ]
+
+    @staticmethod
+    def run_draw_batches(
+        surface: pygame.Surface,
+        camera: "EmCamera",
+        batches: List[Tuple["numpy.ndarray", "numpy.ndarray", int]],
+    ):
+        """
+        Draws the particles gathered by `capture_draw_batches`. Called by the engine
+        after the entities.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto.
+            camera (EmCamera): The camera the particles are seen through.
+            batches (List[Tuple[numpy.ndarray, numpy.ndarray, int]]): The particles'
+                positions, colors and size of each emitter.
+        """
+        offset = camera.get_draw_offset()
+        zoom = camera.get_zoom()
+
+        for positions, colors, size in batches:
+            EmParticleEmitter.draw_particles(
+                surface, positions, colors, size, offset, zoom
+            )
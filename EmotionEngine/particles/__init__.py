@@ -0,0 +1,2 @@
+from .EmParticleEmitter import *
+from .EmParticlesManager import *
@@ -0,0 +1,42 @@
+from typing import Any, Callable, List, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    import numpy
+
+    from EmotionEngine.camera.EmCamera import EmCamera
+    from EmotionEngine.entity.EmEntity import EmEntity
+    from EmotionEngine.tilemap.EmTilemap import EmTilemap
+
+
+@dataclass(frozen=True)
+class EmDrawSnapshot:
+    """
+    Everything the engine needs to draw a frame, captured at the end of its
+    simulation.
+
+    In pipelined mode, the entities are draw copies (see `EmEntity.create_draw_copy`)
+    whose helper sees a copy of the engine's camera, and the particles are copied,
+    so the frame can be drawn while the next one is simulated. Tilemaps are drawn
+    from their own copy of the tiles, updated with the captured tile changes.
+
+    Attributes:
+        paused (bool): Whether the game was paused.
+        camera (EmCamera): The camera the frame is seen through.
+        entities (Tuple[EmEntity, ...]): The entities to draw, in drawing order.
+        draw_batches (List[Tuple[Callable, List[EmEntity], List[List[Any]]]]): The
+            draw systems with their arguments (see
+            `EmComponentsManager.capture_draw_batches`).
+        tilemaps_batches (List[Tuple[EmTilemap, List[Tuple[str, int, int]]]]): The
+            tilemaps with their tile changes (see
+            `EmTilemapsManager.capture_draw_batches`).
+        particles_batches (List[Tuple[numpy.ndarray, numpy.ndarray, int]]): The
+            particles of each emitter (see `EmParticlesManager.capture_draw_batches`).
+    """
+
+    paused: bool
+    camera: "EmCamera"
+    entities: Tuple["EmEntity", ...]
+    draw_batches: List[Tuple[Callable, List["EmEntity"], List[List[Any]]]]
+    tilemaps_batches: List[Tuple["EmTilemap", List[Tuple[str, int, int]]]]
+    particles_batches: List[Tuple["numpy.ndarray", "numpy.ndarray", int]]
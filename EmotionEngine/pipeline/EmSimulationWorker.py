@@ -0,0 +1,149 @@
+import sys
+import time
+import queue
+import threading
+
+from typing import Any, Callable, Dict
+
+
+class EmSimulationWorker:
+    """
+    Runs the simulation of the next frame on a background thread, while the main
+    thread draws the previous one.
+
+    At most one job runs at a time: `submit` hands a job to the worker thread and
+    `wait` blocks until it is done, returning its result or raising its exception.
+    The time the main thread spends blocked in `wait` is reported by `get_stats`, so
+    the overlap gained over running the jobs in line can be measured.
+
+    With the GIL, the overlap comes from the calls releasing it (pygame blits and
+    display flips, NumPy operations); free-threaded Python builds also run the
+    Python code of both threads in parallel.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the worker and starts its thread.
+        """
+        self.__jobs: queue.Queue = queue.Queue(maxsize=1)
+        self.__results: queue.Queue = queue.Queue(maxsize=1)
+        self.__pending = False
+
+        self.__jobs_count = 0
+        self.__total_job_ms = 0.0
+        self.__total_wait_ms = 0.0
+
+        self.__thread = threading.Thread(
+            target=self.__run_jobs, name="EmSimulationWorker", daemon=True
+        )
+        self.__thread.start()
+
+    @staticmethod
+    def is_free_threaded() -> bool:
+        """
+        Checks whether the interpreter runs Python code of several threads in parallel.
+
+        Returns:
+            bool: True on a free-threaded build with the GIL disabled.
+        """
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+
+        return is_gil_enabled is not None and not is_gil_enabled()
+
+    def is_pending(self) -> bool:
+        """
+        Checks whether a submitted job was not waited for yet.
+
+        Returns:
+            bool: True if `wait` has a job to wait for.
+        """
+        return self.__pending
+
+    def submit(self, job: Callable[[], Any]):
+        """
+        Starts a job on the worker thread.
+
+        Args:
+            job (Callable[[], Any]): The job to run.
+        """
+        assert not self.__pending
+
+        self.__pending = True
+        self.__jobs.put(job)
+
+    def wait(self) -> Any:
+        """
+        Waits for the submitted job to finish.
+
+        Returns:
+            Any: The job's result, or None if no job was submitted.
+
+        Raises:
+            Exception: The exception raised by the job, if any.
+        """
+        if not self.__pending:
+            return None
+
+        started_at = time.perf_counter()
+        result, error, job_ms = self.__results.get()
+
+        self.__pending = False
+        self.__jobs_count += 1
+        self.__total_job_ms += job_ms
+        self.__total_wait_ms += (time.perf_counter() - started_at) * 1000
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns statistics about the jobs.
+
+        Returns:
+            Dict[str, float]: The number of jobs, the average duration of a job and
+                              the average time the main thread waited for one, in
+                              milliseconds.
+        """
+        jobs_count = max(self.__jobs_count, 1)
+
+        return {
+            "jobs": self.__jobs_count,
+            "average_job_ms": self.__total_job_ms / jobs_count,
+            "average_wait_ms": self.__total_wait_ms / jobs_count,
+        }
+
+    def close(self):
+        """
+        Waits for the submitted job, if any, and stops the worker thread.
+        """
+        try:
+            self.wait()
+
+        finally:
+            self.__jobs.put(None)
+            self.__thread.join()
+
+    def __run_jobs(self):
+        """
+        Runs the submitted jobs until `close` is called. Runs on the worker thread.
+        """
+        while True:
+            job = self.__jobs.get()
+
+            if job is None:
+                return
+
+            started_at = time.perf_counter()
+
+            # Errors are raised again on the main thread, by wait
+            try:
+                result, error = job(), None
+
+            except Exception as job_error:  # pylint: disable=broad-exception-caught
+                result, error = None, job_error
+
+            self.__results.put(
+                (result, error, (time.perf_counter() - started_at) * 1000)
+            )
@@ -0,0 +1,2 @@
+from .EmDrawSnapshot import *
+from .EmSimulationWorker import *
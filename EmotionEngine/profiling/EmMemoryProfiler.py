@@ -0,0 +1,284 @@
+import gc
+import os
+import tracemalloc
+
+from collections import Counter, deque
+from typing import Deque, Dict, List, TYPE_CHECKING
+
+from EmotionEngine.types.EmVector2 import EmVector2
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.profiling.EmMemorySnapshot import EmMemorySnapshot
+
+if TYPE_CHECKING:
+    from EmotionEngine.EmEngine import EmEngine
+    from EmotionEngine.entity.EmEntitiesManager import EmEntitiesManager
+    from EmotionEngine.sound.EmSoundsManager import EmSoundsManager
+    from EmotionEngine.image.EmImagesManager import EmImagesManager
+
+PROFILING_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+ENGINE_DIRECTORY = os.path.dirname(PROFILING_DIRECTORY)
+
+
+class EmMemoryProfiler:
+    """
+    A profiler that tracks the engine's memory usage, and can be switched on and off
+    while the game is running.
+
+    When enabled, it traces Python allocations with tracemalloc, counts how many
+    instances of the tracked classes (EmVector2 and AABB by default) are created
+    every frame, and measures the transient memory peak of each frame. Snapshots
+    attributing memory to engine subsystems, entity classes and loaded assets are
+    taken periodically and can be compared with each other.
+    """
+
+    def __init__(
+        self,
+        engine_ref: "EmEngine",
+        entities_manager: "EmEntitiesManager",
+        sounds_manager: "EmSoundsManager",
+        images_manager: "EmImagesManager",
+        snapshot_interval: int = 600,
+        max_snapshots: int = 16,
+    ) -> None:
+        """
+        Initializes the profiler, disabled.
+
+        Args:
+            engine_ref (EmEngine): The engine being profiled.
+            entities_manager (EmEntitiesManager): The manager of the entities to count.
+            sounds_manager (EmSoundsManager): The manager of the sounds to measure.
+            images_manager (EmImagesManager): The manager of the images to measure.
+            snapshot_interval (int): Number of frames between periodic snapshots.
+            max_snapshots (int): Number of periodic snapshots to keep.
+        """
+        self.__engine_ref = engine_ref
+        self.__entities_manager = entities_manager
+        self.__sounds_manager = sounds_manager
+        self.__images_manager = images_manager
+
+        self.__enabled = False
+        self.__snapshot_interval = snapshot_interval
+        self.__snapshots: Deque[EmMemorySnapshot] = deque(maxlen=max_snapshots)
+
+        self.__frame = 0
+        self.__tracked_classes: List[type] = [EmVector2, AABB]
+        self.__original_inits: Dict[type, any] = {}
+
+        self.__frame_creations: Counter = Counter()
+        self.__last_frame_creations: Dict[str, int] = {}
+        self.__last_frame_transient_bytes = 0
+
+    def is_enabled(self) -> bool:
+        """
+        Checks whether the profiler is currently enabled.
+
+        Returns:
+            bool: True if memory is being profiled, False otherwise.
+        """
+        return self.__enabled
+
+    def set_enabled(self, new_enabled: bool):
+        """
+        Enables or disables the profiler. When disabled, it has no runtime cost.
+
+        Args:
+            new_enabled (bool): The new enabled state of the profiler.
+        """
+        if new_enabled == self.__enabled:
+            return
+
+        self.__enabled = new_enabled
+
+        if new_enabled:
+            tracemalloc.start()
+
+            for tracked_class in self.__tracked_classes:
+                self.__install_creation_counter(tracked_class)
+
+            self.__engine_ref.get_logger("profiling").info("Memory profiler enabled")
+
+        else:
+            for tracked_class in list(self.__original_inits):
+                tracked_class.__init__ = self.__original_inits.pop(tracked_class)
+
+            tracemalloc.stop()
+            self.__frame_creations.clear()
+
+            self.__engine_ref.get_logger("profiling").info("Memory profiler disabled")
+
+    def track_class(self, tracked_class: type):
+        """
+        Adds a class whose instances are counted per frame and in snapshots.
+
+        Args:
+            tracked_class (type): The class to track.
+        """
+        if tracked_class in self.__tracked_classes:
+            return
+
+        self.__tracked_classes.append(tracked_class)
+
+        if self.__enabled:
+            self.__install_creation_counter(tracked_class)
+
+    def get_last_frame_creations(self) -> Dict[str, int]:
+        """
+        Returns how many instances of each tracked class were created last frame.
+
+        Returns:
+            Dict[str, int]: Created instances by class name.
+        """
+        return self.__last_frame_creations
+
+    def get_last_frame_transient_bytes(self) -> int:
+        """
+        Returns the memory allocated and released again during the last frame.
+
+        Returns:
+            int: The difference between the frame's traced peak and the traced
+                 memory at the end of the frame, in bytes.
+        """
+        return self.__last_frame_transient_bytes
+
+    def get_snapshots(self) -> List[EmMemorySnapshot]:
+        """
+        Returns the periodic snapshots kept by the profiler, oldest first.
+
+        Returns:
+            List[EmMemorySnapshot]: The kept snapshots.
+        """
+        return list(self.__snapshots)
+
+    def on_frame_end(self):
+        """
+        Updates the per-frame statistics. Called by the engine at the end of every frame.
+        """
+        if not self.__enabled:
+            return
+
+        self.__frame += 1
+
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        self.__last_frame_transient_bytes = peak_bytes - current_bytes
+        self.__last_frame_creations = dict(self.__frame_creations)
+        self.__frame_creations.clear()
+
+        if self.__frame % self.__snapshot_interval == 0:
+            self.__take_periodic_snapshot()
+
+    def take_snapshot(self) -> EmMemorySnapshot:
+        """
+        Takes a snapshot of the engine's memory.
+
+        Walking the heap and the traced allocations is costly, so this should not be
+        called every frame.
+
+        Returns:
+            EmMemorySnapshot: The snapshot, with empty traced statistics if the
+                              profiler is disabled.
+        """
+        entities = self.__entities_manager.get_all_instanciated_entities()
+        loaded_sounds = self.__sounds_manager.get_loaded_sounds()
+
+        snapshot = EmMemorySnapshot(
+            frame=self.__frame,
+            traced_bytes=0,
+            entities_counts=dict(Counter(type(entity).__name__ for entity in entities)),
+            objects_counts=self.__count_tracked_objects(),
+            assets_bytes={
+                f"sound:{sound_path}": sound.get_memory_size()
+                for sound_path, sound in loaded_sounds.items()
+            },
+        )
+
+        images_usage = self.__images_manager.get_memory_usage()
+        snapshot.assets_bytes["images"] = images_usage["images"]
+        snapshot.assets_bytes["images:variants"] = images_usage["variants"]
+        snapshot.assets_bytes["images:atlases"] = images_usage["atlases"]
+
+        if self.__enabled:
+            snapshot.traced_bytes = tracemalloc.get_traced_memory()[0]
+
+            # Leave out the profiler's own bookkeeping
+            traces = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, os.path.join(PROFILING_DIRECTORY, "*")),
+                ]
+            )
+
+            for stat in traces.statistics("filename"):
+                subsystem = self.__get_subsystem(stat.traceback[0].filename)
+                snapshot.subsystems_bytes[subsystem] = (
+                    snapshot.subsystems_bytes.get(subsystem, 0) + stat.size
+                )
+
+        return snapshot
+
+    def __take_periodic_snapshot(self):
+        """
+        Takes a snapshot, keeps it and logs its growth since the previous one.
+        """
+        snapshot = self.take_snapshot()
+
+        if self.__snapshots:
+            growth = snapshot.diff(self.__snapshots[-1])
+            self.__engine_ref.get_logger("profiling").info(
+                "Memory: %.1f KiB traced (%+.1f KiB over %d frames), "
+                "%.1f KiB transient and %d tracked objects created last frame",
+                snapshot.traced_bytes / 1024,
+                growth.traced_bytes / 1024,
+                growth.frame,
+                self.__last_frame_transient_bytes / 1024,
+                sum(self.__last_frame_creations.values()),
+            )
+
+        self.__snapshots.append(snapshot)
+
+    def __install_creation_counter(self, tracked_class: type):
+        """
+        Wraps a class constructor to count its instances created every frame.
+        """
+        original_init = tracked_class.__init__
+        class_name = tracked_class.__name__
+        frame_creations = self.__frame_creations
+
+        def counting_init(instance, *args, **kwargs):
+            frame_creations[class_name] += 1
+            original_init(instance, *args, **kwargs)
+
+        self.__original_inits[tracked_class] = original_init
+        tracked_class.__init__ = counting_init
+
+    def __count_tracked_objects(self) -> Dict[str, int]:
+        """
+        Counts the live instances of the tracked classes (and their subclasses).
+        """
+        tracked_classes = tuple(self.__tracked_classes)
+        counts = Counter()
+
+        for obj in gc.get_objects():
+            if isinstance(obj, tracked_classes):
+                counts[type(obj).__name__] += 1
+
+        return dict(counts)
+
+    def __get_subsystem(self, filename: str) -> str:
+        """
+        Attributes an allocation site to an engine subsystem or an entities module.
+        """
+        filename = os.path.abspath(filename)
+        entities_directory = os.path.abspath(self.__engine_ref.get_entities_directory())
+
+        if filename.startswith(entities_directory + os.sep):
+            module_name = os.path.splitext(os.path.basename(filename))[0]
+            return f"entities.{module_name}"
+
+        if filename.startswith(ENGINE_DIRECTORY + os.sep):
+            relative_path = os.path.relpath(filename, ENGINE_DIRECTORY)
+            parts = relative_path.split(os.sep)
+            return parts[0] if len(parts) > 1 else "engine"
+
+        return "other"
@@ -0,0 +1,60 @@
+from typing import Dict
+from dataclasses import dataclass, field
+
+
+def _diff_counts(new: Dict[str, int], old: Dict[str, int]) -> Dict[str, int]:
+    """
+    Computes the per-key difference between two counters, dropping unchanged keys.
+    """
+    keys = set(new) | set(old)
+    diff = {key: new.get(key, 0) - old.get(key, 0) for key in keys}
+
+    return {key: value for key, value in diff.items() if value != 0}
+
+
+@dataclass
+class EmMemorySnapshot:
+    """
+    A point-in-time view of the engine's memory, taken by `EmMemoryProfiler`.
+
+    Attributes:
+        frame (int): The frame at which the snapshot was taken.
+        traced_bytes (int): Python memory currently traced by tracemalloc.
+        subsystems_bytes (Dict[str, int]): Traced bytes by allocation site, either
+                                           an engine subsystem (e.g. "sound"), a
+                                           game entities module (e.g. "entities.Ball")
+                                           or "other".
+        entities_counts (Dict[str, int]): Instantiated entities by class name.
+        objects_counts (Dict[str, int]): Live instances of the tracked classes.
+        assets_bytes (Dict[str, int]): Decoded size of loaded assets by asset name.
+    """
+
+    frame: int
+    traced_bytes: int
+    subsystems_bytes: Dict[str, int] = field(default_factory=dict)
+    entities_counts: Dict[str, int] = field(default_factory=dict)
+    objects_counts: Dict[str, int] = field(default_factory=dict)
+    assets_bytes: Dict[str, int] = field(default_factory=dict)
+
+    def diff(self, older: "EmMemorySnapshot") -> "EmMemorySnapshot":
+        """
+        Computes the growth between an older snapshot and this one.
+
+        Args:
+            older (EmMemorySnapshot): The snapshot to compare against.
+
+        Returns:
+            EmMemorySnapshot: A snapshot holding the differences, where `frame` is
+                              the number of frames between both snapshots and only
+                              changed entries are kept.
+        """
+        return EmMemorySnapshot(
+            frame=self.frame - older.frame,
+            traced_bytes=self.traced_bytes - older.traced_bytes,
+            subsystems_bytes=_diff_counts(
+                self.subsystems_bytes, older.subsystems_bytes
+            ),
+            entities_counts=_diff_counts(self.entities_counts, older.entities_counts),
+            objects_counts=_diff_counts(self.objects_counts, older.objects_counts),
+            assets_bytes=_diff_counts(self.assets_bytes, older.assets_bytes),
+        )
@@ -0,0 +1,2 @@
+from .EmMemorySnapshot import *
+from .EmMemoryProfiler import *
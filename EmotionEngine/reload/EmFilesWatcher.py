@@ -0,0 +1,84 @@
+import os
+
+from typing import Dict, List, Tuple
+
+
+class EmFilesWatcher:
+    """
+    A class that detects file changes by polling modification times.
+
+    Watched files are reported once each time their modification time changes,
+    and watched directories also report new files with the given extension.
+    """
+
+    def __init__(self) -> None:
+        self.__files_mtimes: Dict[str, int] = {}
+        self.__directories: List[Tuple[str, str]] = []
+
+    def watch_file(self, file_path: str):
+        """
+        Starts watching a file. Its current state is not reported as a change.
+
+        Args:
+            file_path (str): The path of the file to watch.
+        """
+        self.__files_mtimes[file_path] = self.__get_mtime(file_path)
+
+    def watch_directory(self, directory: str, extension: str):
+        """
+        Starts watching the files of a directory with a given extension, including
+        the ones created later.
+
+        Args:
+            directory (str): The directory to watch.
+            extension (str): The extension of the files to watch (e.g. ".py").
+        """
+        self.__directories.append((directory, extension))
+
+        for file_path in self.__list_directory(directory, extension):
+            self.watch_file(file_path)
+
+    def poll(self) -> List[str]:
+        """
+        Checks the watched files for changes.
+
+        Returns:
+            List[str]: The paths of the files modified or created since the last poll.
+        """
+        changed_files: List[str] = []
+
+        for directory, extension in self.__directories:
+            for file_path in self.__list_directory(directory, extension):
+                if file_path not in self.__files_mtimes:
+                    self.__files_mtimes[file_path] = None
+
+        for file_path, known_mtime in self.__files_mtimes.items():
+            mtime = self.__get_mtime(file_path)
+
+            if mtime is not None and mtime != known_mtime:
+                self.__files_mtimes[file_path] = mtime
+                changed_files.append(file_path)
+
+        return changed_files
+
+    @staticmethod
+    def __get_mtime(file_path: str) -> int:
+        """
+        Returns a file's modification time, or None if it does not exist.
+        """
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def __list_directory(directory: str, extension: str) -> List[str]:
+        """
+        Lists the files of a directory with a given extension.
+        """
+        return [
+            os.path.join(directory, file_name)
+            for file_name in sorted(os.listdir(directory))
+            if os.path.splitext(file_name)[1] == extension
+            and os.path.isfile(os.path.join(directory, file_name))
+        ]
@@ -0,0 +1 @@
+from .EmFilesWatcher import *
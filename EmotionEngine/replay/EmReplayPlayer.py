@@ -0,0 +1,88 @@
+import pygame
+
+from typing import List, Optional, Tuple
+
+from EmotionEngine.replay.EmReplayRecorder import (
+    REPLAY_MAGIC,
+    REPLAY_VERSION,
+    REPLAY_HEADER,
+    REPLAY_FRAME,
+    REPLAY_EVENT,
+    REPLAY_EVENT_TYPES,
+)
+
+
+class EmReplayPlayer:
+    """
+    A class that reads back a replay file written by `EmReplayRecorder`.
+
+    The whole file is loaded in memory, then frames are decoded one at a time and
+    handed to the engine in place of the live clock and window events.
+    """
+
+    def __init__(self, replay_path: str) -> None:
+        """
+        Loads a replay file and reads its header.
+
+        Args:
+            replay_path (str): The path of the replay file to load.
+
+        Raises:
+            ValueError: If the file is not a replay file of a supported version.
+        """
+        with open(replay_path, "rb") as replay_file:
+            self.__replay_data = replay_file.read()
+
+        magic, version, self.__seed = REPLAY_HEADER.unpack_from(self.__replay_data)
+
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"'{replay_path}' is not a supported replay file")
+
+        self.__offset = REPLAY_HEADER.size
+        self.__frames_count = 0
+
+    def get_seed(self) -> int:
+        """
+        Returns the random seed the recorded session was started with.
+
+        Returns:
+            int: The recorded random seed.
+        """
+        return self.__seed
+
+    def get_frames_count(self) -> int:
+        """
+        Returns the number of frames played so far.
+
+        Returns:
+            int: The number of played frames.
+        """
+        return self.__frames_count
+
+    def next_frame(self) -> Optional[Tuple[float, List[pygame.event.Event]]]:
+        """
+        Decodes the next recorded frame.
+
+        Returns:
+            Optional[Tuple[float, List[pygame.event.Event]]]: The frame's delta time in
+            milliseconds and its events, or None once the replay is over.
+        """
+        if self.__offset >= len(self.__replay_data):
+            return None
+
+        dt, events_count = REPLAY_FRAME.unpack_from(self.__replay_data, self.__offset)
+        self.__offset += REPLAY_FRAME.size
+
+        events: List[pygame.event.Event] = []
+
+        for _ in range(events_count):
+            event_code, key = REPLAY_EVENT.unpack_from(
+                self.__replay_data, self.__offset
+            )
+            self.__offset += REPLAY_EVENT.size
+
+            events.append(pygame.event.Event(REPLAY_EVENT_TYPES[event_code], key=key))
+
+        self.__frames_count += 1
+
+        return dt, events
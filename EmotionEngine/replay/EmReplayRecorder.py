@@ -0,0 +1,80 @@
+import struct
+import pygame
+
+from typing import List
+
+# Replay file layout (little-endian):
+#   header : magic (4s), version (B), random seed (Q)
+#   frame  : dt in milliseconds (d), events count (H), then events count x event
+#   event  : event code (B), key (I)
+REPLAY_MAGIC = b"EMRP"
+REPLAY_VERSION = 2
+
+REPLAY_HEADER = struct.Struct("<4sBQ")
+# dt is stored as a double, so fractional or variable steps are replayed exactly
+REPLAY_FRAME = struct.Struct("<dH")
+REPLAY_EVENT = struct.Struct("<BI")
+
+# Recorded pygame event types, by their code in the replay file
+REPLAY_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
+
+class EmReplayRecorder:
+    """
+    A class that records a game session's inputs to a compact binary replay file.
+
+    For every frame, the frame's delta time and the input events (quit and key
+    events) are appended to the file. Together with the random seed written in the
+    header, this is enough to replay the session deterministically.
+    """
+
+    def __init__(self, replay_path: str, seed: int) -> None:
+        """
+        Creates the replay file and writes its header.
+
+        Args:
+            replay_path (str): The path of the replay file to create.
+            seed (int): The random seed the recorded session was started with.
+        """
+        self.__replay_file = open(replay_path, "wb")
+        self.__frames_count = 0
+
+        self.__replay_file.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed))
+
+    def get_frames_count(self) -> int:
+        """
+        Returns the number of frames recorded so far.
+
+        Returns:
+            int: The number of recorded frames.
+        """
+        return self.__frames_count
+
+    def record_frame(self, dt: float, events: List[pygame.event.Event]):
+        """
+        Appends a frame to the replay file.
+
+        Args:
+            dt (float): The frame's delta time, in milliseconds.
+            events (List[pygame.event.Event]): The frame's events. Only quit and key
+                                               events are recorded.
+        """
+        recorded_events = [
+            event for event in events if event.type in REPLAY_EVENT_TYPES
+        ]
+
+        frame_data = bytearray(REPLAY_FRAME.pack(dt, len(recorded_events)))
+
+        for event in recorded_events:
+            frame_data += REPLAY_EVENT.pack(
+                REPLAY_EVENT_TYPES.index(event.type), getattr(event, "key", 0)
+            )
+
+        self.__replay_file.write(frame_data)
+        self.__frames_count += 1
+
+    def close(self):
+        """
+        Flushes and closes the replay file.
+        """
+        self.__replay_file.close()
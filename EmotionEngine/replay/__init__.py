@@ -0,0 +1,2 @@
+from .EmReplayRecorder import *
+from .EmReplayPlayer import *
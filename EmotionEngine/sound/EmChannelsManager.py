@@ -0,0 +1,205 @@
+import weakref
+import pygame
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from EmotionEngine.utils.EmGameClock import EmGameClock
+
+if TYPE_CHECKING:
+    from EmotionEngine.sound.EmSound import EmSound
+
+
+class EmChannelsManager:
+    """
+    A manager class that owns the mixer channels and decides which voice plays where.
+
+    Channels are reserved in named groups (e.g. "sfx", "music"), so busy groups never
+    starve the others. Within a group, each sound is limited to a number of concurrent
+    instances and to a minimum delay between two triggers, and when no channel is free
+    a new voice steals the lowest-priority (then oldest) one, if its own priority is
+    high enough. This keeps the mixer load bounded however busy the game gets.
+
+    A pool of unreserved channels is kept after the groups, for the sounds played
+    without this manager (e.g. `pygame.mixer.Sound.play`). The sounds of a group
+    without reserved channels also play there, with only their minimum delay between
+    two triggers applied.
+    """
+
+    def __init__(self, free_channels_count: int = 8) -> None:
+        """
+        Initializes the manager, without any group yet.
+
+        Args:
+            free_channels_count (int): The number of channels left to pygame for the
+                                       sounds played without this manager.
+                                       Default is 8.
+        """
+        self.__free_channels_count = free_channels_count
+        self.__channels: List[pygame.mixer.Channel] = []
+        self.__groups: Dict[str, List[int]] = {}
+
+        # Voice playing on each channel index: (sound, started at)
+        self.__voices: Dict[int, Tuple["EmSound", float]] = {}
+
+        # Last time each sound was triggered, forgotten with the sound
+        self.__last_triggers: "weakref.WeakKeyDictionary[EmSound, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self.__stats = {"played": 0, "stolen": 0, "rate_limited": 0, "dropped": 0}
+
+        self.__muted = False
+
+    def reserve_group(self, group_name: str, channels_count: int):
+        """
+        Reserves a group of mixer channels for the sounds of a given group.
+
+        Reserved channels are never picked automatically by pygame, so they are only
+        used through this manager. The unreserved channels pool keeps its size.
+
+        Args:
+            group_name (str): The name of the group.
+            channels_count (int): The number of channels to add to the group.
+        """
+        first_index = len(self.__channels)
+        total_count = first_index + channels_count
+
+        # pygame reserves the first channels: the groups come first, then the pool
+        pygame.mixer.set_num_channels(total_count + self.__free_channels_count)
+        pygame.mixer.set_reserved(total_count)
+
+        channels_indices = self.__groups.setdefault(group_name, [])
+
+        for index in range(first_index, total_count):
+            self.__channels.append(pygame.mixer.Channel(index))
+            channels_indices.append(index)
+
+    def set_muted(self, new_muted: bool):
+        """
+        Mutes or unmutes the play requests, e.g. while frames are simulated again.
+
+        Args:
+            new_muted (bool): If True, play requests are ignored.
+        """
+        self.__muted = new_muted
+
+    def is_muted(self) -> bool:
+        """
+        Checks whether the play requests are ignored.
+
+        Returns:
+            bool: True if the play requests are muted.
+        """
+        return self.__muted
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns counters of what happened to the play requests so far.
+
+        Returns:
+            Dict[str, int]: The number of voices played, stolen, rate limited and
+                            dropped (no channel could be freed).
+        """
+        return dict(self.__stats)
+
+    def play(self, sound: "EmSound") -> Optional[pygame.mixer.Channel]:
+        """
+        Plays a sound on a channel of its group, following its voice limits.
+
+        Args:
+            sound (EmSound): The sound to play.
+
+        Returns:
+            Optional[pygame.mixer.Channel]: The channel the sound plays on, or None if
+                                            the play request was rejected.
+        """
+        if self.__muted:
+            return None
+
+        now = EmGameClock.get_milli_time()
+        last_trigger = self.__last_triggers.get(sound)
+
+        if (
+            last_trigger is not None
+            and now - last_trigger < sound.get_min_interval_ms()
+        ):
+            self.__stats["rate_limited"] += 1
+            return None
+
+        channels_indices = self.__groups.get(sound.get_group())
+
+        if channels_indices is None:
+            channel = pygame.mixer.find_channel()
+
+            if channel is None:
+                self.__stats["dropped"] += 1
+                return None
+
+        else:
+            channel_index = self.__find_channel(sound, channels_indices)
+
+            if channel_index is None:
+                self.__stats["dropped"] += 1
+                return None
+
+            if channel_index in self.__voices and self.__is_busy(channel_index):
+                self.__stats["stolen"] += 1
+
+            channel = self.__channels[channel_index]
+            self.__voices[channel_index] = (sound, now)
+
+        channel.play(sound.get_sound_object())
+
+        self.__last_triggers[sound] = now
+        self.__stats["played"] += 1
+
+        return channel
+
+    def __is_busy(self, channel_index: int) -> bool:
+        """
+        Checks whether a channel is still playing the voice it was given.
+        """
+        return self.__channels[channel_index].get_busy()
+
+    def __find_channel(
+        self, sound: "EmSound", channels_indices: List[int]
+    ) -> Optional[int]:
+        """
+        Picks the channel of its group a sound should play on, or None if the voice
+        must be dropped.
+        """
+        free_index: Optional[int] = None
+        instances: List[Tuple[float, int]] = []
+        candidates: List[Tuple[int, float, int]] = []
+
+        for index in channels_indices:
+            if not self.__is_busy(index):
+                if free_index is None:
+                    free_index = index
+                continue
+
+            voice_sound, started_at = self.__voices.get(index, (None, 0.0))
+
+            if voice_sound is None:
+                continue
+
+            if voice_sound is sound:
+                instances.append((started_at, index))
+
+            candidates.append((voice_sound.get_priority(), started_at, index))
+
+        # Too many instances of this sound: restart its oldest one
+        if len(instances) >= sound.get_max_instances():
+            return min(instances)[1]
+
+        if free_index is not None:
+            return free_index
+
+        # Steal the lowest priority voice (the oldest first) not above this one
+        if candidates:
+            priority, _, index = min(candidates)
+
+            if priority <= sound.get_priority():
+                return index
+
+        return None
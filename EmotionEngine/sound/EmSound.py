@@ -1,5 +1,10 @@
 import pygame
 
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from EmotionEngine.sound.EmChannelsManager import EmChannelsManager
+
 
 class EmSound:
     """
@@ -7,25 +12,113 @@ class EmSound:
     mixer functionality.
 
     This class wraps the Pygame sound object to provide simple playback controls.
+    When attached to a channels manager, playback goes through it so the sound's
+    group, priority and voice limits are applied.
     """
 
-    def __init__(self, sound_object: pygame.mixer.Sound) -> None:
+    def __init__(
+        self,
+        sound_object: pygame.mixer.Sound,
+        channels_manager: "EmChannelsManager" = None,
+        group: str = "sfx",
+        priority: int = 0,
+        max_instances: int = 4,
+        min_interval_ms: float = 0,
+    ) -> None:
         """
         Initializes the EmSound with a Pygame sound object.
 
         Args:
             sound_object (pygame.mixer.Sound): The Pygame sound object to manage.
+            channels_manager (EmChannelsManager): The manager allocating the mixer
+                                                  channels. Default is None (any free
+                                                  channel is used).
+            group (str): The channels group the sound plays in. Default is "sfx".
+            priority (int): The sound's priority when stealing voices. Default is 0.
+            max_instances (int): The maximum number of concurrent instances of the
+                                 sound. Default is 4.
+            min_interval_ms (float): The minimum delay between two triggers of the
+                                     sound, in milliseconds. Default is 0.
         """
         self.__sound_object = sound_object
+        self.__channels_manager = channels_manager
+        self.__group = group
+        self.__priority = priority
+        self.__max_instances = max_instances
+        self.__min_interval_ms = min_interval_ms
+
+    def get_sound_object(self) -> pygame.mixer.Sound:
+        """
+        Returns the Pygame sound object managed by this EmSound instance.
+
+        Returns:
+            pygame.mixer.Sound: The wrapped sound object.
+        """
+        return self.__sound_object
+
+    def get_group(self) -> str:
+        """
+        Returns the name of the channels group the sound plays in.
 
-    def play(self):
+        Returns:
+            str: The sound's channels group.
+        """
+        return self.__group
+
+    def get_priority(self) -> int:
+        """
+        Returns the sound's priority. Higher priority voices steal lower ones.
+
+        Returns:
+            int: The sound's priority.
+        """
+        return self.__priority
+
+    def get_max_instances(self) -> int:
+        """
+        Returns the maximum number of concurrent instances of the sound.
+
+        Returns:
+            int: The maximum number of instances.
+        """
+        return self.__max_instances
+
+    def get_min_interval_ms(self) -> float:
+        """
+        Returns the minimum delay between two triggers of the sound.
+
+        Returns:
+            float: The minimum delay, in milliseconds.
+        """
+        return self.__min_interval_ms
+
+    def play(self) -> Optional[pygame.mixer.Channel]:
         """
         Plays the sound associated with this EmSound instance.
+
+        Returns:
+            Optional[pygame.mixer.Channel]: The channel the sound plays on, or None if
+                                            no channel was available.
         """
-        self.__sound_object.play()
+        if self.__channels_manager is not None:
+            return self.__channels_manager.play(self)
+
+        return self.__sound_object.play()
 
     def stop(self):
         """
         Stops the playback of the sound associated with this EmSound instance.
         """
         self.__sound_object.stop()
+
+    def get_memory_size(self) -> int:
+        """
+        Returns the size of the decoded sound samples held by the mixer.
+
+        Returns:
+            int: The size of the sound samples, in bytes.
+        """
+        frequency, size, channels = pygame.mixer.get_init()
+        samples_count = int(self.__sound_object.get_length() * frequency)
+
+        return samples_count * channels * abs(size) // 8
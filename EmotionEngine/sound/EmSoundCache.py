@@ -0,0 +1,121 @@
+import os
+import hashlib
+import pygame
+
+
+class EmSoundCache:
+    """
+    A disk cache of decoded sounds, stored as raw PCM in the mixer's native format.
+
+    The first load of a sound decodes it with pygame and writes its samples to the
+    cache directory. Later loads, including from other processes, read the cached
+    samples and hand them to the mixer directly, skipping the decoding step. Only
+    the decoding time is saved: the mixer keeps its own copy of the samples.
+    Cache entries are keyed on the source file's path, size and modification time
+    and on the mixer format, so edited assets or a different mixer setup are
+    decoded again.
+    """
+
+    def __init__(self, cache_directory: str) -> None:
+        """
+        Initializes the cache. The cache directory is created on the first write.
+
+        Args:
+            cache_directory (str): The directory where decoded sounds are stored.
+        """
+        self.__cache_directory = cache_directory
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_hits(self) -> int:
+        """
+        Returns the number of sounds loaded from the cache.
+
+        Returns:
+            int: The number of cache hits.
+        """
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Returns the number of sounds that had to be decoded.
+
+        Returns:
+            int: The number of cache misses.
+        """
+        return self.__misses
+
+    def load(self, sound_path: str) -> pygame.mixer.Sound:
+        """
+        Loads a sound, from the cache if possible.
+
+        Args:
+            sound_path (str): The path of the sound file to load.
+
+        Returns:
+            pygame.mixer.Sound: The loaded sound.
+        """
+        cache_path = self.__get_cache_path(sound_path)
+
+        if os.path.isfile(cache_path):
+            self.__hits += 1
+
+            with open(cache_path, "rb") as cache_file:
+                return pygame.mixer.Sound(buffer=cache_file.read())
+
+        self.__misses += 1
+
+        sound_object = pygame.mixer.Sound(sound_path)
+
+        # The sound is decoded already: a read-only or full cache directory only
+        # costs decoding it again next time
+        try:
+            self.__store(cache_path, sound_object.get_raw())
+
+        except OSError:
+            pass
+
+        return sound_object
+
+    def __get_cache_path(self, sound_path: str) -> str:
+        """
+        Computes the cache file path of a sound for the current mixer format.
+        """
+        sound_stat = os.stat(sound_path)
+        key = "|".join(
+            (
+                os.path.abspath(sound_path),
+                str(sound_stat.st_size),
+                str(sound_stat.st_mtime_ns),
+                str(pygame.mixer.get_init()),
+            )
+        )
+        digest = hashlib.sha1(key.encode("UTF-8")).hexdigest()
+        sound_name = os.path.splitext(os.path.basename(sound_path))[0]
+
+        return os.path.join(self.__cache_directory, f"{sound_name}.{digest}.pcm")
+
+    def __store(self, cache_path: str, samples: bytes):
+        """
+        Writes decoded samples to the cache, atomically so concurrent processes never
+        read a partial file.
+
+        Raises:
+            OSError: If the cache directory cannot be written.
+        """
+        os.makedirs(self.__cache_directory, exist_ok=True)
+
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporary_path, "wb") as cache_file:
+                cache_file.write(samples)
+
+            os.replace(temporary_path, cache_path)
+
+        except OSError:
+            # Do not leave a partial file behind, e.g. when the disk is full
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+            raise
@@ -1,8 +1,10 @@
 import os
 import pygame
 
-from typing import TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 from EmotionEngine.sound.EmSound import EmSound
+from EmotionEngine.sound.EmChannelsManager import EmChannelsManager
+from EmotionEngine.sound.EmSoundCache import EmSoundCache
 
 if TYPE_CHECKING:
     from EmotionEngine.EmEngine import EmEngine
@@ -13,13 +15,48 @@ class EmSoundsManager:
     A manager class responsible for loading and handling sound objects within the engine.
 
     This class provides methods to load sound files from a specified directory and
-    manage their playback through the Pygame mixer.
+    manage their playback through the Pygame mixer. Playback is routed through a
+    channels manager, which starts with a single "sfx" group of 8 channels.
+    Decoded sounds are kept in a disk cache under the engine's cache directory.
     """
 
     def __init__(self, engine_ref: "EmEngine") -> None:
         self.__engine_ref = engine_ref
+        self.__loaded_sounds: Dict[str, EmSound] = {}
 
-    def load_sound(self, sound_path: str) -> EmSound:
+        self.__channels_manager = EmChannelsManager()
+        self.__channels_manager.reserve_group("sfx", 8)
+
+        self.__sound_cache = EmSoundCache(
+            os.path.join(engine_ref.get_cache_directory(), "sounds")
+        )
+
+    def retrieve_channels_manager(self) -> EmChannelsManager:
+        """
+        Retrieves the channels manager, used to reserve channel groups.
+
+        Returns:
+            EmChannelsManager: The channels manager instance.
+        """
+        return self.__channels_manager
+
+    def retrieve_sound_cache(self) -> EmSoundCache:
+        """
+        Retrieves the decoded sounds cache.
+
+        Returns:
+            EmSoundCache: The sound cache instance.
+        """
+        return self.__sound_cache
+
+    def load_sound(
+        self,
+        sound_path: str,
+        group: str = "sfx",
+        priority: int = 0,
+        max_instances: int = 4,
+        min_interval_ms: float = 0,
+    ) -> EmSound:
         """
         Loads a sound file from the game's sounds directory and returns an
         EmSound instance that wraps the Pygame sound object.
@@ -27,12 +64,38 @@ class EmSoundsManager:
         Args:
             sound_path (str): The relative path to the sound file to load,
             relative to the game's sounds directory.
+            group (str): The channels group the sound plays in. Default is "sfx".
+            priority (int): The sound's priority when stealing voices. Default is 0.
+            max_instances (int): The maximum number of concurrent instances of the
+                                 sound. Default is 4.
+            min_interval_ms (float): The minimum delay between two triggers of the
+                                     sound, in milliseconds. Default is 0.
 
         Returns:
             EmSound: An instance of EmSound representing the loaded sound.
         """
         game_sounds_directory = self.__engine_ref.get_sounds_directory()
-        sound_object = pygame.mixer.Sound(
+        sound_object = self.__sound_cache.load(
             os.path.join(game_sounds_directory, sound_path)
         )
-        return EmSound(sound_object=sound_object)
+        sound = EmSound(
+            sound_object=sound_object,
+            channels_manager=self.__channels_manager,
+            group=group,
+            priority=priority,
+            max_instances=max_instances,
+            min_interval_ms=min_interval_ms,
+        )
+        self.__loaded_sounds[sound_path] = sound
+
+        return sound
+
+    def get_loaded_sounds(self) -> Dict[str, EmSound]:
+        """
+        Retrieves the sounds loaded so far, by their path relative to the game's
+        sounds directory.
+
+        Returns:
+            Dict[str, EmSound]: The most recently loaded sound for each path.
+        """
+        return self.__loaded_sounds
@@ -1,2 +1,4 @@
 from .EmSound import *
+from .EmChannelsManager import *
+from .EmSoundCache import *
 from .EmSoundsManager import *
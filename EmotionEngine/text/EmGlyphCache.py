@@ -0,0 +1,111 @@
+import pygame
+
+from typing import Dict, List, Tuple
+
+
+class EmGlyphCache:
+    """
+    Draws text from glyph surfaces rendered once per character, for text changing
+    every frame (counters, timings) without rendering a new surface each time.
+
+    Glyphs are rendered on their first use, so any character can be drawn. Kerning
+    is not applied: the cache is meant for small labels and numbers.
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        color: Tuple[int, int, int] = (255, 255, 255),
+        antialias: bool = True,
+        background: Tuple[int, int, int] = None,
+    ) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            font (pygame.font.Font): The font to render the glyphs with.
+            color (Tuple[int, int, int]): The color of the glyphs. Default is white.
+            antialias (bool): Whether the glyphs are antialiased. Default is True.
+            background (Tuple[int, int, int]): The background color of the glyphs, to
+                                               draw them as opaque surfaces, faster to
+                                               blit. Default is None (transparent).
+        """
+        self.__font = font
+        self.__color = color
+        self.__antialias = antialias
+        self.__background = background
+        self.__glyphs: Dict[str, pygame.Surface] = {}
+
+    def get_line_height(self) -> int:
+        """
+        Returns the height of a line of text.
+
+        Returns:
+            int: The font's line height, in pixels.
+        """
+        return self.__font.get_linesize()
+
+    def get_glyphs_count(self) -> int:
+        """
+        Returns the number of rendered glyphs.
+
+        Returns:
+            int: The number of cached glyph surfaces.
+        """
+        return len(self.__glyphs)
+
+    def get_text_width(self, text: str) -> int:
+        """
+        Returns the width of a text drawn by the cache.
+
+        Args:
+            text (str): The text to measure.
+
+        Returns:
+            int: The width, in pixels.
+        """
+        return sum(self.__get_glyph(character).get_width() for character in text)
+
+    def draw_text(
+        self, surface: pygame.Surface, text: str, position: Tuple[int, int]
+    ) -> int:
+        """
+        Draws a line of text, in a single batched blit.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            text (str): The text to draw.
+            position (Tuple[int, int]): The top left corner of the text.
+
+        Returns:
+            int: The width of the drawn text, in pixels.
+        """
+        x, y = position
+        glyphs_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+        for character in text:
+            glyph = self.__get_glyph(character)
+            glyphs_blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+
+        surface.blits(glyphs_blits, doreturn=False)
+
+        return x - position[0]
+
+    def __get_glyph(self, character: str) -> pygame.Surface:
+        """
+        Returns the surface of a character, rendering it on its first use.
+        """
+        glyph = self.__glyphs.get(character)
+
+        if glyph is None:
+            glyph = self.__font.render(
+                character, self.__antialias, self.__color, self.__background
+            )
+
+            if self.__background is not None:
+                glyph = glyph.convert()
+
+            self.__glyphs[character] = glyph
+
+        return glyph
@@ -1 +1,2 @@
 from .EmFontsManager import *
+from .EmGlyphCache import *
@@ -0,0 +1,541 @@
+import math
+import zlib
+import array
+import base64
+import pygame
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from EmotionEngine.collisions.AABB import AABB
+
+
+class EmTilemap:
+    """
+    A grid of tiles drawn from a tileset, made of one or more layers.
+
+    Layers are stored as compact arrays of 16-bit tile indices (row-major, 0 for an
+    empty cell, n for the n-th tile of the tileset, counted from 1). The map is
+    split into square chunks of `chunk_size` cells, each pre-rendered with all its
+    layers into a cached surface: drawing the map costs one blit per visible chunk,
+    and changing a tile only renders its chunk again, on the next draw.
+
+    Chunks are rendered from a copy of the layers, updated with the tile changes
+    captured by `capture_changes`, so a map can be drawn on one thread while its
+    tiles are changed on another.
+
+    Solid tiles are flattened into a collision grid (one byte per cell), so point
+    and box queries only look at the few cells they overlap.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tiles_surfaces: List[pygame.Surface],
+        tile_size: int,
+        columns: int,
+        rows: int,
+        layers: Dict[str, array.array],
+        solid_tiles: Iterable[int] = (),
+        position: Tuple[float, float] = (0, 0),
+        chunk_size: int = 16,
+    ) -> None:
+        """
+        Initializes the tilemap.
+
+        Args:
+            name (str): The name of the tilemap.
+            tiles_surfaces (List[pygame.Surface]): The tiles of the tileset, tile 1
+                                                   being the first surface.
+            tile_size (int): The width and height of a tile, in pixels.
+            columns (int): The number of columns of the map.
+            rows (int): The number of rows of the map.
+            layers (Dict[str, array.array]): The tile indices of each layer ("H"
+                                             arrays of columns * rows items), by
+                                             name, from bottom to top.
+            solid_tiles (Iterable[int]): The indices of the tiles blocking movement.
+                                         Default is no tile.
+            position (Tuple[float, float]): The world position of the map's top left
+                                            corner. Default is (0, 0).
+            chunk_size (int): The width and height of a chunk, in cells. Default is 16.
+        """
+        for layer_name, tiles in layers.items():
+            if len(tiles) != columns * rows:
+                raise ValueError(
+                    f"Tilemap '{name}' layer '{layer_name}' has {len(tiles)} tiles, "
+                    f"{columns * rows} expected"
+                )
+
+        self.__name = name
+        self.__tiles_surfaces = tiles_surfaces
+        self.__tile_size = tile_size
+        self.__columns = columns
+        self.__rows = rows
+        self.__layers = layers
+        self.__solid_tiles: Set[int] = set(solid_tiles)
+        self.__position = position
+        self.__chunk_size = chunk_size
+
+        self.__chunks_columns = -(-columns // chunk_size)
+        self.__chunks_rows = -(-rows // chunk_size)
+
+        # Tile changes since the last capture, as (layer name, index, tile)
+        self.__changed_tiles: List[Tuple[str, int, int]] = []
+
+        # The layers as drawn, the rendered chunks by (chunk column, chunk row), and
+        # the ones to render again
+        self.__drawn_layers = {
+            layer_name: tiles[:] for layer_name, tiles in layers.items()
+        }
+        self.__chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.__dirty_chunks: Set[Tuple[int, int]] = set()
+        self.__scaled_chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.__scaled_zoom = 1.0
+
+        self.__solid_grid = bytearray(columns * rows)
+
+        for index in range(columns * rows):
+            self.__update_solid_cell(index)
+
+    @staticmethod
+    def encode_tiles(tiles: Iterable[int]) -> str:
+        """
+        Encodes tile indices in the compact form read from level files.
+
+        Args:
+            tiles (Iterable[int]): The tile indices of a layer, row by row.
+
+        Returns:
+            str: The indices as little-endian 16-bit integers, compressed with zlib
+                 and encoded in base64.
+        """
+        tiles_array = array.array("H", tiles)
+
+        if tiles_array.itemsize != 2:
+            raise ValueError("Tiles arrays require 16-bit unsigned integers")
+
+        return base64.b64encode(
+            zlib.compress(EmTilemap.__to_little_endian(tiles_array))
+        ).decode("ascii")
+
+    @staticmethod
+    def decode_tiles(encoded_tiles: str) -> array.array:
+        """
+        Decodes tile indices encoded by `encode_tiles`.
+
+        Args:
+            encoded_tiles (str): The encoded tile indices.
+
+        Returns:
+            array.array: The tile indices ("H" array).
+        """
+        return EmTilemap.read_tiles(zlib.decompress(base64.b64decode(encoded_tiles)))
+
+    @staticmethod
+    def read_tiles(tiles_bytes: bytes) -> array.array:
+        """
+        Reads raw tile indices, stored as little-endian 16-bit integers.
+
+        Args:
+            tiles_bytes (bytes): The raw tile indices.
+
+        Returns:
+            array.array: The tile indices ("H" array).
+        """
+        tiles_array = array.array("H")
+        tiles_array.frombytes(tiles_bytes)
+
+        return EmTilemap.__from_little_endian(tiles_array)
+
+    @staticmethod
+    def __to_little_endian(tiles_array: array.array) -> bytes:
+        """
+        Returns the bytes of a tiles array in little-endian order.
+        """
+        if array.array("H", [1]).tobytes()[0] == 1:
+            return tiles_array.tobytes()
+
+        swapped = array.array("H", tiles_array)
+        swapped.byteswap()
+        return swapped.tobytes()
+
+    @staticmethod
+    def __from_little_endian(tiles_array: array.array) -> array.array:
+        """
+        Converts a tiles array read in little-endian order to the native order.
+        """
+        if array.array("H", [1]).tobytes()[0] != 1:
+            tiles_array.byteswap()
+
+        return tiles_array
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the tilemap.
+
+        Returns:
+            str: The tilemap's name.
+        """
+        return self.__name
+
+    def get_tile_size(self) -> int:
+        """
+        Returns the width and height of a tile.
+
+        Returns:
+            int: The tile size, in pixels.
+        """
+        return self.__tile_size
+
+    def get_size(self) -> Tuple[int, int]:
+        """
+        Returns the size of the map, in cells.
+
+        Returns:
+            Tuple[int, int]: The number of columns and rows.
+        """
+        return self.__columns, self.__rows
+
+    def get_bounds(self) -> AABB:
+        """
+        Returns the area covered by the map, in world coordinates.
+
+        Returns:
+            AABB: The bounds of the map.
+        """
+        x, y = self.__position
+
+        return AABB(
+            x,
+            y,
+            x + self.__columns * self.__tile_size,
+            y + self.__rows * self.__tile_size,
+        )
+
+    def get_layers_names(self) -> List[str]:
+        """
+        Returns the names of the layers, from bottom to top.
+
+        Returns:
+            List[str]: The layers' names.
+        """
+        return list(self.__layers)
+
+    def get_tile(self, layer_name: str, column: int, row: int) -> int:
+        """
+        Returns the tile of a cell.
+
+        Args:
+            layer_name (str): The name of the layer.
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            int: The tile index (0 for an empty cell).
+        """
+        return self.__layers[layer_name][row * self.__columns + column]
+
+    def set_tile(self, layer_name: str, column: int, row: int, tile: int):
+        """
+        Changes the tile of a cell. Its chunk is rendered again on the next draw
+        (once the change is captured, see `capture_changes`).
+
+        Args:
+            layer_name (str): The name of the layer.
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+            tile (int): The new tile index (0 to empty the cell).
+        """
+        index = row * self.__columns + column
+        tiles = self.__layers[layer_name]
+
+        if tiles[index] == tile:
+            return
+
+        tiles[index] = tile
+
+        self.__update_solid_cell(index)
+        self.__changed_tiles.append((layer_name, index, tile))
+
+    def capture_changes(self) -> List[Tuple[str, int, int]]:
+        """
+        Returns the tile changes made since the last capture, to pass to `draw`.
+        Must be called by the thread changing the tiles.
+
+        Returns:
+            List[Tuple[str, int, int]]: The changes, as (layer name, cell index,
+                                        tile) in the order they were made.
+        """
+        changed_tiles = self.__changed_tiles
+        self.__changed_tiles = []
+
+        return changed_tiles
+
+    def world_to_cell(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Converts a world position to the cell containing it.
+
+        Args:
+            x (float): The world x coordinate.
+            y (float): The world y coordinate.
+
+        Returns:
+            Tuple[int, int]: The column and row of the cell (possibly outside the map).
+        """
+        return (
+            int((x - self.__position[0]) // self.__tile_size),
+            int((y - self.__position[1]) // self.__tile_size),
+        )
+
+    def is_solid_cell(self, column: int, row: int) -> bool:
+        """
+        Checks whether a cell holds a solid tile. Cells outside the map are not.
+
+        Args:
+            column (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            bool: True if the cell is solid.
+        """
+        if not (0 <= column < self.__columns and 0 <= row < self.__rows):
+            return False
+
+        return self.__solid_grid[row * self.__columns + column] == 1
+
+    def is_solid_at(self, x: float, y: float) -> bool:
+        """
+        Checks whether a world position is inside a solid tile.
+
+        Args:
+            x (float): The world x coordinate.
+            y (float): The world y coordinate.
+
+        Returns:
+            bool: True if the position is inside a solid tile.
+        """
+        return self.is_solid_cell(*self.world_to_cell(x, y))
+
+    def get_solid_boxes(self, box: AABB) -> List[AABB]:
+        """
+        Returns the boxes of the solid tiles overlapped by a box, e.g. to be tested
+        with `AABB.sweep_many`.
+
+        Args:
+            box (AABB): The box to test, in world coordinates.
+
+        Returns:
+            List[AABB]: The world boxes of the overlapped solid tiles.
+        """
+        tile_size = self.__tile_size
+        origin_x, origin_y = self.__position
+        first_column, first_row = self.world_to_cell(box.left, box.bottom)
+
+        # Cells only touched by the right and top edges are not overlapped
+        last_column = math.ceil((box.right - origin_x) / tile_size) - 1
+        last_row = math.ceil((box.top - origin_y) / tile_size) - 1
+
+        solid_boxes: List[AABB] = []
+
+        for row in range(max(first_row, 0), min(last_row, self.__rows - 1) + 1):
+            row_offset = row * self.__columns
+
+            for column in range(
+                max(first_column, 0), min(last_column, self.__columns - 1) + 1
+            ):
+                if self.__solid_grid[row_offset + column]:
+                    x = origin_x + column * tile_size
+                    y = origin_y + row * tile_size
+                    solid_boxes.append(AABB(x, y, x + tile_size, y + tile_size))
+
+        return solid_boxes
+
+    def collides_with_box(self, box: AABB) -> bool:
+        """
+        Checks whether a box overlaps a solid tile.
+
+        Args:
+            box (AABB): The box to test, in world coordinates.
+
+        Returns:
+            bool: True if the box overlaps at least one solid tile.
+        """
+        return len(self.get_solid_boxes(box)) > 0
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: Tuple[float, float] = (0, 0),
+        zoom: float = 1.0,
+        changes: Optional[List[Tuple[str, int, int]]] = None,
+    ):
+        """
+        Draws the chunks visible in the clip area of a surface, rendering the new and
+        changed ones.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto.
+            offset (Tuple[float, float]): The world position shown at the surface's
+                                          top left corner. Default is (0, 0).
+            zoom (float): The number of surface pixels per world unit. Default is 1.
+            changes (Optional[List[Tuple[str, int, int]]]): The tile changes returned
+                by `capture_changes` since the last draw. Default is None (they are
+                captured now, when drawing on the thread changing the tiles).
+        """
+        if changes is None:
+            changes = self.capture_changes()
+
+        if changes:
+            self.__apply_changes(changes)
+
+        chunk_pixels = self.__chunk_size * self.__tile_size
+        scaled_chunk_pixels = chunk_pixels * zoom
+        origin_x = (self.__position[0] - offset[0]) * zoom
+        origin_y = (self.__position[1] - offset[1]) * zoom
+        clip = surface.get_clip()
+
+        first_column = max(int((clip.left - origin_x) // scaled_chunk_pixels), 0)
+        first_row = max(int((clip.top - origin_y) // scaled_chunk_pixels), 0)
+        last_column = min(
+            int((clip.right - origin_x) // scaled_chunk_pixels),
+            self.__chunks_columns - 1,
+        )
+        last_row = min(
+            int((clip.bottom - origin_y) // scaled_chunk_pixels), self.__chunks_rows - 1
+        )
+
+        # Scaled chunks are only kept for the last zoom drawn
+        if zoom != self.__scaled_zoom:
+            self.__scaled_chunks.clear()
+            self.__scaled_zoom = zoom
+
+        blits = []
+
+        for chunk_row in range(first_row, last_row + 1):
+            for chunk_column in range(first_column, last_column + 1):
+                chunk_key = (chunk_column, chunk_row)
+                chunk = self.__chunks.get(chunk_key)
+
+                if chunk is None or chunk_key in self.__dirty_chunks:
+                    chunk = self.__render_chunk(chunk_column, chunk_row)
+
+                if zoom != 1:
+                    chunk = self.__get_scaled_chunk(chunk_key, chunk, zoom)
+
+                blits.append(
+                    (
+                        chunk,
+                        (
+                            origin_x + chunk_column * scaled_chunk_pixels,
+                            origin_y + chunk_row * scaled_chunk_pixels,
+                        ),
+                    )
+                )
+
+        surface.blits(blits, doreturn=False)
+
+    def get_memory_size(self) -> int:
+        """
+        Returns the size of the rendered (and scaled) chunks and of the tiles arrays.
+
+        Returns:
+            int: The size, in bytes.
+        """
+        chunks_bytes = sum(
+            chunk.get_pitch() * chunk.get_height()
+            for chunks in (self.__chunks, self.__scaled_chunks)
+            for chunk in chunks.values()
+        )
+        tiles_bytes = sum(
+            len(tiles) * tiles.itemsize
+            for layers in (self.__layers, self.__drawn_layers)
+            for tiles in layers.values()
+        )
+
+        return chunks_bytes + tiles_bytes + len(self.__solid_grid)
+
+    def __update_solid_cell(self, index: int):
+        """
+        Updates the collision grid for a cell, solid if any layer has a solid tile.
+        """
+        solid_tiles = self.__solid_tiles
+
+        self.__solid_grid[index] = any(
+            tiles[index] in solid_tiles for tiles in self.__layers.values()
+        )
+
+    def __apply_changes(self, changes: List[Tuple[str, int, int]]):
+        """
+        Writes captured tile changes into the drawn layers, and marks their chunks to
+        be rendered again.
+        """
+        columns = self.__columns
+        chunk_size = self.__chunk_size
+        drawn_layers = self.__drawn_layers
+
+        for layer_name, index, tile in changes:
+            drawn_layers[layer_name][index] = tile
+            row, column = divmod(index, columns)
+            self.__dirty_chunks.add((column // chunk_size, row // chunk_size))
+
+    def __render_chunk(self, chunk_column: int, chunk_row: int) -> pygame.Surface:
+        """
+        Renders every drawn layer of a chunk into its cached surface.
+        """
+        chunk_key = (chunk_column, chunk_row)
+        chunk_size = self.__chunk_size
+        tile_size = self.__tile_size
+
+        chunk = self.__chunks.get(chunk_key)
+
+        if chunk is None:
+            chunk = pygame.Surface(
+                (chunk_size * tile_size, chunk_size * tile_size), pygame.SRCALPHA
+            )
+            self.__chunks[chunk_key] = chunk
+
+        chunk.fill((0, 0, 0, 0))
+
+        first_column = chunk_column * chunk_size
+        first_row = chunk_row * chunk_size
+        last_column = min(first_column + chunk_size, self.__columns)
+        last_row = min(first_row + chunk_size, self.__rows)
+
+        blits = []
+
+        for tiles in self.__drawn_layers.values():
+            for row in range(first_row, last_row):
+                row_offset = row * self.__columns
+                y = (row - first_row) * tile_size
+
+                for column in range(first_column, last_column):
+                    tile = tiles[row_offset + column]
+
+                    if tile != 0:
+                        blits.append(
+                            (
+                                self.__tiles_surfaces[tile - 1],
+                                ((column - first_column) * tile_size, y),
+                            )
+                        )
+
+        chunk.blits(blits, doreturn=False)
+        self.__dirty_chunks.discard(chunk_key)
+        self.__scaled_chunks.pop(chunk_key, None)
+
+        return chunk
+
+    def __get_scaled_chunk(
+        self, chunk_key: Tuple[int, int], chunk: pygame.Surface, zoom: float
+    ) -> pygame.Surface:
+        """
+        Returns a rendered chunk scaled by the zoom, scaling it on first use.
+        """
+        scaled_chunk = self.__scaled_chunks.get(chunk_key)
+
+        if scaled_chunk is None:
+            # Rounded up so neighbouring chunks leave no gap between them
+            scaled_size = math.ceil(chunk.get_width() * zoom)
+            scaled_chunk = pygame.transform.scale(chunk, (scaled_size, scaled_size))
+            self.__scaled_chunks[chunk_key] = scaled_chunk
+
+        return scaled_chunk
@@ -0,0 +1,217 @@
+import os
+import array
+import pygame
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.tilemap.EmTilemap import EmTilemap
+
+if TYPE_CHECKING:
+    from EmotionEngine.EmEngine import EmEngine
+    from EmotionEngine.image.EmImagesManager import EmImagesManager
+
+
+class EmTilemapsManager:
+    """
+    A manager class for the tilemaps declared by the levels.
+
+    A level file declares its tilemaps in a `tilemaps` section:
+
+        tilemaps:
+            - name: Ground
+              tileset: tiles.png      # image of the images directory, split in tiles
+              tile_size: 32
+              columns: 200
+              rows: 50
+              solid_tiles: [1, 2]
+              layers:
+                - name: background
+                  data: eJzt...       # EmTilemap.encode_tiles output
+                - name: walls
+                  data_file: ground_walls.tiles   # raw tiles, in the levels directory
+
+    The tilemaps are drawn before the entities, in declaration order.
+    """
+
+    def __init__(
+        self, engine_ref: "EmEngine", images_manager: "EmImagesManager"
+    ) -> None:
+        self.__engine_ref = engine_ref
+        self.__images_manager = images_manager
+        self.__tilemaps: Dict[str, EmTilemap] = {}
+
+    def load_tilemap(self, tilemap_data: dict) -> EmTilemap:
+        """
+        Creates a tilemap from its level declaration, replacing any tilemap with the
+        same name.
+
+        Args:
+            tilemap_data (dict): The tilemap declaration read from a level file.
+
+        Returns:
+            EmTilemap: The loaded tilemap.
+        """
+        tile_size = int(tilemap_data["tile_size"])
+        columns = int(tilemap_data["columns"])
+        rows = int(tilemap_data["rows"])
+
+        layers: Dict[str, array.array] = {}
+
+        for layer_data in tilemap_data["layers"]:
+            layers[layer_data["name"]] = self.__read_layer_tiles(layer_data)
+
+        tilemap = EmTilemap(
+            name=tilemap_data["name"],
+            tiles_surfaces=self.__split_tileset(tilemap_data["tileset"], tile_size),
+            tile_size=tile_size,
+            columns=columns,
+            rows=rows,
+            layers=layers,
+            solid_tiles=tilemap_data.get("solid_tiles", ()),
+            position=tuple(tilemap_data.get("position", (0, 0))),
+            chunk_size=int(tilemap_data.get("chunk_size", 16)),
+        )
+
+        self.__tilemaps[tilemap.get_name()] = tilemap
+
+        return tilemap
+
+    def remove_tilemap(self, tilemap_name: str):
+        """
+        Removes a tilemap, if it exists.
+
+        Args:
+            tilemap_name (str): The name of the tilemap.
+        """
+        self.__tilemaps.pop(tilemap_name, None)
+
+    def get_tilemap(self, tilemap_name: str) -> Optional[EmTilemap]:
+        """
+        Returns a tilemap by name.
+
+        Args:
+            tilemap_name (str): The name of the tilemap.
+
+        Returns:
+            Optional[EmTilemap]: The tilemap, or None if there is none with this name.
+        """
+        return self.__tilemaps.get(tilemap_name)
+
+    def get_tilemaps(self) -> List[EmTilemap]:
+        """
+        Returns every tilemap, in drawing order.
+
+        Returns:
+            List[EmTilemap]: The tilemaps.
+        """
+        return list(self.__tilemaps.values())
+
+    def is_solid_at(self, x: float, y: float) -> bool:
+        """
+        Checks whether a world position is inside a solid tile of any tilemap.
+
+        Args:
+            x (float): The world x coordinate.
+            y (float): The world y coordinate.
+
+        Returns:
+            bool: True if the position is inside a solid tile.
+        """
+        return any(tilemap.is_solid_at(x, y) for tilemap in self.__tilemaps.values())
+
+    def get_solid_boxes(self, box: AABB) -> List[AABB]:
+        """
+        Returns the boxes of the solid tiles overlapped by a box, in every tilemap.
+
+        Args:
+            box (AABB): The box to test, in world coordinates.
+
+        Returns:
+            List[AABB]: The world boxes of the overlapped solid tiles.
+        """
+        solid_boxes: List[AABB] = []
+
+        for tilemap in self.__tilemaps.values():
+            solid_boxes.extend(tilemap.get_solid_boxes(box))
+
+        return solid_boxes
+
+    def capture_draw_batches(
+        self,
+    ) -> List[Tuple[EmTilemap, List[Tuple[str, int, int]]]]:
+        """
+        Captures the tile changes of every tilemap, so the tilemaps can be drawn later
+        (and on another thread) with `run_draw_batches`.
+
+        Returns:
+            List[Tuple[EmTilemap, List[Tuple[str, int, int]]]]: The tilemaps, in
+                drawing order, with their tile changes (see
+                `EmTilemap.capture_changes`).
+        """
+        return [
+            (tilemap, tilemap.capture_changes()) for tilemap in self.__tilemaps.values()
+        ]
+
+    @staticmethod
+    def run_draw_batches(
+        surface: pygame.Surface,
+        batches: List[Tuple[EmTilemap, List[Tuple[str, int, int]]]],
+        offset: Tuple[float, float] = (0, 0),
+        zoom: float = 1.0,
+    ):
+        """
+        Draws the tilemaps captured by `capture_draw_batches`. Called by the engine
+        before drawing the entities, through the camera.
+
+        Args:
+            surface (pygame.Surface): The surface to draw onto.
+            batches (List[Tuple[EmTilemap, List[Tuple[str, int, int]]]]): The
+                tilemaps with their tile changes.
+            offset (Tuple[float, float]): The world position shown at the surface's
+                                          top left corner. Default is (0, 0).
+            zoom (float): The number of surface pixels per world unit. Default is 1.
+        """
+        for tilemap, changes in batches:
+            tilemap.draw(surface, offset, zoom, changes)
+
+    def get_memory_size(self) -> int:
+        """
+        Returns the memory used by the tilemaps' chunks and tiles.
+
+        Returns:
+            int: The size, in bytes.
+        """
+        return sum(tilemap.get_memory_size() for tilemap in self.__tilemaps.values())
+
+    def __read_layer_tiles(self, layer_data: dict) -> array.array:
+        """
+        Reads the tiles of a layer, inline ("data") or from a file ("data_file").
+        """
+        if "data_file" in layer_data:
+            data_path = os.path.join(
+                self.__engine_ref.get_levels_directory(), layer_data["data_file"]
+            )
+
+            with open(data_path, "rb") as data_file:
+                return EmTilemap.read_tiles(data_file.read())
+
+        return EmTilemap.decode_tiles(layer_data["data"])
+
+    def __split_tileset(
+        self, tileset_path: str, tile_size: int
+    ) -> List[pygame.Surface]:
+        """
+        Splits a tileset image into tiles, row by row.
+        """
+        tileset = self.__images_manager.load_image(tileset_path)
+        columns = tileset.get_width() // tile_size
+        rows = tileset.get_height() // tile_size
+
+        return [
+            tileset.subsurface(
+                (column * tile_size, row * tile_size, tile_size, tile_size)
+            )
+            for row in range(rows)
+            for column in range(columns)
+        ]
@@ -0,0 +1,2 @@
+from .EmTilemap import *
+from .EmTilemapsManager import *
@@ -1,6 +1,6 @@
 import math
 
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -25,6 +25,13 @@ class EmVector2:
         """
         return (self.x, self.y)
 
+    def __eq__(self, other):
+        """Vectors are equal when their components are, whatever their class."""
+        if not isinstance(other, EmVector2):
+            return NotImplemented
+
+        return self.x == other.x and self.y == other.y
+
     def __sub__(self, other):
         """Vector subtraction."""
         return EmVector2(self.x - other.x, self.y - other.y)
@@ -65,3 +72,70 @@ class EmVector2:
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+class EmTrackedVector2(EmVector2):
+    """
+    An EmVector2 that records writes to its components through a `dirty` flag.
+
+    Owners can hand out this vector for in-place mutation (e.g. `pos.x += 1`) and
+    still know when it changed, which lets them cache values derived from it. A
+    listener can also be told when the vector becomes dirty after being cleared.
+    """
+
+    # A vector is dirty until it is first cleared
+    dirty = True
+    listener = None
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+
+        if not self.dirty:
+            object.__setattr__(self, "dirty", True)
+
+            if self.listener is not None:
+                self.listener()
+
+    def set_xy(self, x: float, y: float):
+        """
+        Writes both components at once, marking the vector dirty a single time.
+
+        Args:
+            x (float): The new x component.
+            y (float): The new y component.
+        """
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+        if not self.dirty:
+            object.__setattr__(self, "dirty", True)
+
+            if self.listener is not None:
+                self.listener()
+
+    def mark_dirty(self):
+        """
+        Marks the vector as dirty, as a write would, e.g. after its components were
+        written straight into its `__dict__`.
+        """
+        if not self.dirty:
+            object.__setattr__(self, "dirty", True)
+
+            if self.listener is not None:
+                self.listener()
+
+    def set_listener(self, new_listener: Optional[Callable[[], None]]):
+        """
+        Sets the function called, without arguments, when a write makes the clean
+        vector dirty. It is not called again until the vector is cleared.
+
+        Args:
+            new_listener (Optional[Callable[[], None]]): The function, or None.
+        """
+        object.__setattr__(self, "listener", new_listener)
+
+    def clear_dirty(self):
+        """
+        Marks the vector as clean until one of its components is written again.
+        """
+        object.__setattr__(self, "dirty", False)
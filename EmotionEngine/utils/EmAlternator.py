@@ -1,4 +1,4 @@
-import time
+from EmotionEngine.utils.EmGameClock import EmGameClock
 
 
 class EmAlternator:
@@ -8,8 +8,15 @@ class EmAlternator:
     This class allows you to start an alternation effect that changes the visibility state
     between `True` and `False` for a specified number of times, with a configurable delay
     between each toggle.
+
+    Attributes:
+        STATE_FORMAT (str): The `struct` format of the tuple returned by `get_state`,
+                            used to declare the alternator in an entity's
+                            SNAPSHOT_FIELDS.
     """
 
+    STATE_FORMAT = "?i?d"
+
     def __init__(self, delay_ms: float, count: int = 3) -> None:
         self.__running = False
         self.__delay_ms = delay_ms
@@ -20,12 +27,12 @@ class EmAlternator:
 
     def get_current_milli_time(self):
         """
-        Gets the current time in milliseconds.
+        Gets the current game time in milliseconds.
 
         Returns:
-            float: The current time in milliseconds since the epoch.
+            float: The game time in milliseconds, as advanced by the engine's main loop.
         """
-        return time.time() * 1000
+        return EmGameClock.get_milli_time()
 
     def start(self):
         """
@@ -66,3 +73,23 @@ class EmAlternator:
             self.__started_at = self.get_current_milli_time()
             self.__count += 1
             self.__visible = not self.__visible
+
+    def get_state(self) -> tuple:
+        """
+        Returns the alternator's running state, e.g. to save it in a world snapshot.
+
+        Returns:
+            tuple: The running flag, the toggles count, the visibility and the time
+                   of the last toggle.
+        """
+        return self.__running, self.__count, self.__visible, self.__started_at or 0.0
+
+    def set_state(self, state: tuple):
+        """
+        Restores a running state returned by `get_state`.
+
+        Args:
+            state (tuple): The running flag, the toggles count, the visibility and
+                           the time of the last toggle.
+        """
+        self.__running, self.__count, self.__visible, self.__started_at = state
@@ -0,0 +1,47 @@
+class EmGameClock:
+    """
+    The engine's game time, advanced by the main loop with each frame's delta time.
+
+    Unlike the wall clock, game time only depends on the sequence of frame deltas,
+    which keeps timers deterministic when a session is replayed faster or slower
+    than it was recorded.
+    """
+
+    __milli_time: float = 0.0
+
+    @classmethod
+    def get_milli_time(cls) -> float:
+        """
+        Gets the current game time in milliseconds.
+
+        Returns:
+            float: The game time elapsed since the engine started, in milliseconds.
+        """
+        return cls.__milli_time
+
+    @classmethod
+    def advance(cls, dt: float):
+        """
+        Advances the game time. Called once per frame by the engine.
+
+        Args:
+            dt (float): The time delta of the frame, in milliseconds.
+        """
+        cls.__milli_time += dt
+
+    @classmethod
+    def set_milli_time(cls, milli_time: float):
+        """
+        Sets the game time, e.g. when restoring a world snapshot.
+
+        Args:
+            milli_time (float): The new game time, in milliseconds.
+        """
+        cls.__milli_time = milli_time
+
+    @classmethod
+    def reset(cls):
+        """
+        Resets the game time to zero.
+        """
+        cls.__milli_time = 0.0
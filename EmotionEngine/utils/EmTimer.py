@@ -1,4 +1,4 @@
-import time
+from EmotionEngine.utils.EmGameClock import EmGameClock
 
 
 class EmTimer:
@@ -7,8 +7,14 @@ class EmTimer:
 
     This timer can be started, updated, and will invoke a provided callback function
     when the specified delay in milliseconds has elapsed.
+
+    Attributes:
+        STATE_FORMAT (str): The `struct` format of the tuple returned by `get_state`,
+                            used to declare the timer in an entity's SNAPSHOT_FIELDS.
     """
 
+    STATE_FORMAT = "??d"
+
     def __init__(self, delay_ms: float, callback_on_finished: any) -> None:
         """
         Initializes the timer with a specified delay and a callback function.
@@ -26,12 +32,12 @@ class EmTimer:
 
     def get_current_milli_time(self):
         """
-        Gets the current time in milliseconds.
+        Gets the current game time in milliseconds.
 
         Returns:
-            float: The current time in milliseconds since the epoch.
+            float: The game time in milliseconds, as advanced by the engine's main loop.
         """
-        return time.time() * 1000
+        return EmGameClock.get_milli_time()
 
     def start(self):
         """
@@ -58,3 +64,21 @@ class EmTimer:
             if diff >= self.__delay_ms:
                 self.__finished = True
                 self.__callback_on_finished()
+
+    def get_state(self) -> tuple:
+        """
+        Returns the timer's running state, e.g. to save it in a world snapshot.
+
+        Returns:
+            tuple: The started and finished flags, and the start time.
+        """
+        return self.__started, self.__finished, self.__started_at or 0.0
+
+    def set_state(self, state: tuple):
+        """
+        Restores a running state returned by `get_state`.
+
+        Args:
+            state (tuple): The started and finished flags, and the start time.
+        """
+        self.__started, self.__finished, self.__started_at = state
@@ -1,3 +1,4 @@
 from .drawing import *
 from .EmAlternator import *
 from .EmTimer import *
+from .EmGameClock import *
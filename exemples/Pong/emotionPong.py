@@ -1,10 +1,21 @@
 import os
+import pygame
+import argparse
 
 from EmotionEngine.EmEngine import EmEngine
 
 if __name__ == "__main__":
     current_directory = os.path.dirname(os.path.realpath(__file__))
 
+    parser = argparse.ArgumentParser(description="Emotion Pong")
+    parser.add_argument(
+        "--netplay",
+        nargs=3,
+        metavar=("PLAYER", "LOCAL_PORT", "REMOTE_HOST:PORT"),
+        help="play against a remote player (e.g. 0 5000 127.0.0.1:5001)",
+    )
+    arguments = parser.parse_args()
+
     engineInstance = EmEngine(
         working_directory=current_directory,
         window_width=1100,
@@ -15,4 +26,15 @@ if __name__ == "__main__":
     engineInstance.initialize()
     engineInstance.load_level("level0.emlvl")
 
+    if arguments.netplay is not None:
+        player, local_port, remote_address = arguments.netplay
+        remote_host, remote_port = remote_address.rsplit(":", 1)
+
+        engineInstance.start_netplay(
+            local_player=int(player),
+            local_port=int(local_port),
+            remote_address=(remote_host, int(remote_port)),
+            input_keys=[pygame.K_UP, pygame.K_DOWN],
+        )
+
     engineInstance.main_loop()
@@ -2,7 +2,7 @@ import pygame
 import random
 import math
 
-from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.collisions.AABB import AABB, AABBSweepHit
 from EmotionEngine.entity.EmEntity import EmEntity
 from EmotionEngine.types.EmVector2 import EmVector2
 from EmotionEngine.sound.EmSound import EmSound
@@ -16,6 +16,8 @@ class Ball(EmEntity):
     movement and collision detection with paddles and walls.
     """
 
+    SNAPSHOT_FIELDS = (("angle_degrees", "d"), ("speed", "d"))
+
     def __init__(self, creation_data: dict) -> None:
         super().__init__(creation_data)
 
@@ -47,8 +49,12 @@ class Ball(EmEntity):
 
         sounds_manager = helper.retrieve_sounds_manager()
 
-        self.bounce_paddle_sound = sounds_manager.load_sound("se_bounce_paddle.wav")
-        self.bounce_wall_sound = sounds_manager.load_sound("se_bounce_wall.wav")
+        self.bounce_paddle_sound = sounds_manager.load_sound(
+            "se_bounce_paddle.wav", max_instances=2, min_interval_ms=100
+        )
+        self.bounce_wall_sound = sounds_manager.load_sound(
+            "se_bounce_wall.wav", max_instances=2, min_interval_ms=100
+        )
         self.throw_sound = sounds_manager.load_sound("se_throw.wav")
 
         entities_manager = helper.retrieve_entities_manager()
@@ -76,15 +82,65 @@ class Ball(EmEntity):
         Args:
             dt (float): The time elapsed since the last frame, used for movement calculations.
         """
-        self.process_ball_collisions()
+        self.process_wall_collisions()
+        self.process_paddle_overlaps()
 
-        angle_rads = math.radians(self.angle_degrees)
-        velocity_vector = (
-            EmVector2(math.cos(angle_rads), math.sin(angle_rads)) * self.speed
+        velocity_vector = self.get_velocity()
+
+        # Sweep the ball along its whole displacement so it cannot tunnel
+        # through the paddles at high speed.
+        hit = self.get_positioned_bounding_box().sweep_many(
+            velocity_vector,
+            [
+                self.left_paddle.get_positioned_bounding_box(),
+                self.right_paddle.get_positioned_bounding_box(),
+            ],
         )
 
+        if hit is not None:
+            self.set_pos(self.retrieve_pos() + velocity_vector * hit.time)
+            self.bounce_on_paddle(hit)
+            return
+
         self.set_pos(self.retrieve_pos() + velocity_vector)
 
+    def get_velocity(self) -> EmVector2:
+        """
+        Computes the ball's displacement for a tick from its angle and speed.
+
+        Returns:
+            EmVector2: The ball's velocity vector.
+        """
+        angle_rads = math.radians(self.angle_degrees)
+
+        return EmVector2(math.cos(angle_rads), math.sin(angle_rads)) * self.speed
+
+    def process_paddle_overlaps(self):
+        """
+        Pushes the ball out of the paddles it overlaps, e.g. when a paddle moved into
+        it, and bounces it if it was moving towards the paddle. Overlapping boxes are
+        ignored by the swept query, so the ball would otherwise pass through.
+        """
+        for paddle in (self.left_paddle, self.right_paddle):
+            push = self.get_positioned_bounding_box().penetration(
+                paddle.get_positioned_bounding_box()
+            )
+
+            if push is None:
+                continue
+
+            self.set_pos(self.retrieve_pos() + push)
+
+            velocity_vector = self.get_velocity()
+
+            if velocity_vector.x * push.x + velocity_vector.y * push.y < 0:
+                if push.x:
+                    normal = EmVector2(math.copysign(1, push.x), 0)
+                else:
+                    normal = EmVector2(0, math.copysign(1, push.y))
+
+                self.bounce_on_paddle(AABBSweepHit(time=0.0, normal=normal))
+
     def reset_speed(self):
         """
         Resets the ball's speed to its default speed.
@@ -98,23 +154,26 @@ class Ball(EmEntity):
         if self.speed < self.max_speed:
             self.speed *= 1.1
 
-    def process_ball_collisions(self):
+    def bounce_on_paddle(self, hit: AABBSweepHit):
         """
-        Checks for collisions with paddles and walls, adjusting the ball's
-        direction and speed accordingly.
+        Reflects the ball off a paddle and speeds it up.
+
+        Args:
+            hit (AABBSweepHit): The contact returned by the swept collision query.
         """
-        if self.collide_with(self.left_paddle):
+        if hit.normal.x != 0:
             self.angle_degrees = 180 - self.angle_degrees
-            self.retrieve_pos().x += self.size // 2
-            self.increment_speed()
-            self.bounce_paddle_sound.play()
+        else:
+            self.angle_degrees = -self.angle_degrees
 
-        if self.collide_with(self.right_paddle):
-            self.angle_degrees = 180 - self.angle_degrees
-            self.retrieve_pos().x -= self.size // 2
-            self.increment_speed()
-            self.bounce_paddle_sound.play()
+        self.increment_speed()
+        self.bounce_paddle_sound.play()
 
+    def process_wall_collisions(self):
+        """
+        Checks for collisions with the top and bottom walls, adjusting the ball's
+        direction accordingly.
+        """
         if (
             self.retrieve_pos().y - self.size <= 0
             or self.retrieve_pos().y + self.size
@@ -41,6 +41,16 @@ class GameController(EmEntity):
     points are scored.
     """
 
+    SNAPSHOT_FIELDS = (
+        ("left_player_score", "i"),
+        ("right_player_score", "i"),
+        ("ai_player_rd_seed", "d"),
+        ("point_marked", "?"),
+        ("start_timer", EmTimer.STATE_FORMAT),
+        ("left_score_alternator", EmAlternator.STATE_FORMAT),
+        ("right_score_alternator", EmAlternator.STATE_FORMAT),
+    )
+
     def __init__(self, creation_data: dict) -> None:
         super().__init__(creation_data)
 
@@ -111,7 +121,13 @@ class GameController(EmEntity):
 
         if self.point_marked is False:
             self.process_ball_collisions()
-            self.process_ai_paddle(dt)
+
+            # In a networked game, the right paddle is played by the second player
+            if (
+                self.retrieve_helper().retrieve_inputs_manager().get_players_count()
+                == 1
+            ):
+                self.process_ai_paddle(dt)
 
     def on_draw(self, surface: pygame.surface.Surface):
         """
@@ -170,7 +186,8 @@ class GameController(EmEntity):
 
     def process_user_inputs(self, dt: float):
         """
-        Processes user inputs for controlling the left paddle.
+        Processes user inputs for controlling the left paddle, and the right paddle
+        in a networked game.
 
         Args:
             dt (float): The time elapsed since the last frame, used for paddle
@@ -180,20 +197,50 @@ class GameController(EmEntity):
             return
 
         helper = self.retrieve_helper()
+        inputs_manager = helper.retrieve_inputs_manager()
 
-        keyboard_manager = helper.retrieve_keyboard_manager()
-        window_height = helper.get_window_height()
+        if inputs_manager.get_players_count() == 1:
+            keyboard_manager = helper.retrieve_keyboard_manager()
 
-        new_y = self.left_paddle.retrieve_pos().y
+            self.move_paddle(
+                self.left_paddle,
+                keyboard_manager.is_key_pressed(pygame.K_UP),
+                keyboard_manager.is_key_pressed(pygame.K_DOWN),
+                dt,
+            )
+            return
+
+        for player_index, paddle in enumerate((self.left_paddle, self.right_paddle)):
+            self.move_paddle(
+                paddle,
+                inputs_manager.is_player_key_pressed(player_index, pygame.K_UP),
+                inputs_manager.is_player_key_pressed(player_index, pygame.K_DOWN),
+                dt,
+            )
+
+    def move_paddle(self, paddle: EmEntity, up: bool, down: bool, dt: float):
+        """
+        Moves a paddle up or down, keeping it inside the window.
 
-        if keyboard_manager.is_key_pressed(pygame.K_UP):
+        Args:
+            paddle (EmEntity): The paddle to move.
+            up (bool): Whether the up key is pressed.
+            down (bool): Whether the down key is pressed.
+            dt (float): The time elapsed since the last frame, used for paddle
+            movement calculations.
+        """
+        window_height = self.retrieve_helper().get_window_height()
+
+        new_y = paddle.retrieve_pos().y
+
+        if up:
             new_y -= 0.5 * dt
 
-        elif keyboard_manager.is_key_pressed(pygame.K_DOWN):
+        elif down:
             new_y += 0.5 * dt
 
-        new_y = clamp(new_y, 0, window_height - self.left_paddle.h)
-        self.left_paddle.retrieve_pos().y = new_y
+        new_y = clamp(new_y, 0, window_height - paddle.h)
+        paddle.retrieve_pos().y = new_y
 
     def process_ball_collisions(self):
         """
@@ -8,4 +8,5 @@ setup(
     author_email="kevin.stoetzel@gmail.com",
     packages=find_packages(),
     install_requires=["pygame", "PyYAML"],
+    extras_require={"numpy": ["numpy"], "gif": ["Pillow"]},
 )
@@ -0,0 +1,6 @@
+import os
+
+# Importing EmotionEngine initializes pygame: run without a window nor audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
@@ -0,0 +1,46 @@
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.types.EmVector2 import EmVector2
+
+
+def test_sweep_ignores_overlapping_boxes_moving_apart():
+    box = AABB(0, 0, 10, 10)
+    other = AABB(5, 0, 15, 10)
+
+    assert box.sweep(EmVector2(-1, 0), other) is None
+
+
+def test_sweep_ignores_overlapping_static_boxes():
+    box = AABB(0, 0, 10, 10)
+    other = AABB(5, 5, 15, 15)
+
+    assert box.sweep(EmVector2(0, 0), other) is None
+    assert box.sweep(EmVector2(1, 0), other) is None
+
+
+def test_sweep_hits_touching_boxes_moving_closer_at_time_zero():
+    hit = AABB(0, 0, 10, 10).sweep(EmVector2(1, 0), AABB(10, 0, 20, 10))
+
+    assert hit is not None
+    assert hit.time == 0
+    assert hit.normal.to_tuple() == (-1, 0)
+
+
+def test_sweep_many_skips_overlaps_hiding_later_hits():
+    box = AABB(0, 0, 10, 10)
+    overlapping = AABB(5, 0, 15, 10)
+    ahead = AABB(0, 20, 10, 30)
+
+    hit = box.sweep_many(EmVector2(0, 20), [overlapping, ahead])
+
+    assert hit is not None
+    assert hit.index == 1
+    assert hit.time == 0.5
+    assert hit.normal.to_tuple() == (0, -1)
+
+
+def test_penetration_pushes_along_the_least_overlap():
+    box = AABB(0, 0, 10, 10)
+
+    assert box.penetration(AABB(8, 2, 20, 8)).to_tuple() == (-2, 0)
+    assert box.penetration(AABB(0, -10, 10, 1)).to_tuple() == (0, 1)
+    assert box.penetration(AABB(10, 0, 20, 10)) is None
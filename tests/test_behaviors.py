@@ -0,0 +1,35 @@
+from EmotionEngine.behaviors.EmBehaviorsScheduler import EmBehaviorsScheduler
+from EmotionEngine.entity.EmEntity import EmEntity
+
+
+class CountingEntity(EmEntity):
+    def __init__(self) -> None:
+        super().__init__({})
+        self.frames = 0
+
+        self.set_entity_id(0)
+        self.set_entity_name("counter")
+
+    async def count_frames(self):
+        while True:
+            await self.next_frame()
+            self.frames += 1
+
+
+def test_next_frame_awaited_from_on_tick_resumes_on_the_next_frame():
+    entity = CountingEntity()
+    behaviors_scheduler = EmBehaviorsScheduler()
+
+    # Started from on_tick: between begin_frame and run_frame
+    behaviors_scheduler.begin_frame()
+    behaviors_scheduler.start(entity, entity.count_frames())
+    behaviors_scheduler.run_frame(16)
+
+    assert entity.frames == 0
+
+    behaviors_scheduler.begin_frame()
+    behaviors_scheduler.run_frame(16)
+    behaviors_scheduler.begin_frame()
+    behaviors_scheduler.run_frame(16)
+
+    assert entity.frames == 2
@@ -0,0 +1,40 @@
+import gc
+
+import pygame
+
+from EmotionEngine.sound.EmChannelsManager import EmChannelsManager
+from EmotionEngine.sound.EmSound import EmSound
+
+
+def create_sound_object() -> pygame.mixer.Sound:
+    pygame.mixer.init()
+
+    return pygame.mixer.Sound(buffer=bytes(44100))
+
+
+def test_sound_of_a_group_without_channels_plays_in_the_pool():
+    channels_manager = EmChannelsManager()
+    channels_manager.reserve_group("sfx", 2)
+
+    sound = EmSound(create_sound_object(), channels_manager, group="ui")
+
+    assert channels_manager.play(sound) is not None
+    assert channels_manager.get_stats()["played"] == 1
+
+
+def test_new_sound_is_not_throttled_by_a_collected_one():
+    channels_manager = EmChannelsManager()
+    channels_manager.reserve_group("sfx", 2)
+    sound_object = create_sound_object()
+
+    for _ in range(4):
+        # Each sound may reuse the memory, and the id, of the collected previous one
+        sound = EmSound(sound_object, channels_manager, min_interval_ms=10000)
+
+        assert channels_manager.play(sound) is not None
+        assert channels_manager.play(sound) is None
+
+        del sound
+        gc.collect()
+
+    assert channels_manager.get_stats()["rate_limited"] == 4
@@ -0,0 +1,67 @@
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.collisions.EmCollisionsManager import EmCollisionsManager
+from EmotionEngine.entity.EmEntity import EmEntity
+from EmotionEngine.types.EmVector2 import EmVector2
+
+
+class LoggingEntity(EmEntity):
+    def __init__(self, entity_id: int, layer: int, mask: int) -> None:
+        super().__init__({})
+        self.events = []
+
+        self.set_entity_id(entity_id)
+        self.set_entity_name(f"e{entity_id}")
+        self.set_collision_layer(layer)
+        self.set_collision_mask(mask)
+
+    def get_bounding_box(self) -> AABB:
+        return AABB(0, 0, 10, 10)
+
+    def on_collision_enter(self, other: EmEntity):
+        self.events.append(("enter", other.get_entity_name()))
+
+    def on_collision_stay(self, other: EmEntity):
+        self.events.append(("stay", other.get_entity_name()))
+
+    def on_collision_exit(self, other: EmEntity):
+        self.events.append(("exit", other.get_entity_name()))
+
+
+def test_callbacks_go_to_the_entities_reacting_to_the_other_layer():
+    player = LoggingEntity(0, layer=1, mask=2)
+    pickup = LoggingEntity(1, layer=2, mask=0)
+    collisions_manager = EmCollisionsManager()
+
+    collisions_manager.process_collisions([player, pickup])
+    collisions_manager.process_collisions([player, pickup])
+    pickup.set_pos(EmVector2(100, 0))
+    collisions_manager.process_collisions([player, pickup])
+
+    assert player.events == [("enter", "e1"), ("stay", "e1"), ("exit", "e1")]
+    assert not pickup.events
+
+
+def test_removed_entities_do_not_exit_their_contacts():
+    player = LoggingEntity(0, layer=1, mask=2)
+    pickup = LoggingEntity(1, layer=2, mask=1)
+    collisions_manager = EmCollisionsManager()
+
+    collisions_manager.process_collisions([player, pickup])
+    collisions_manager.remove_entity(pickup)
+    collisions_manager.process_collisions([player])
+
+    assert player.events == [("enter", "e1")]
+    assert pickup.events == [("enter", "e0")]
+    assert collisions_manager.get_contacts_count() == 0
+
+
+def test_reset_contacts_keeps_overlapping_pairs_without_callbacks():
+    player = LoggingEntity(0, layer=1, mask=2)
+    pickup = LoggingEntity(1, layer=2, mask=1)
+    collisions_manager = EmCollisionsManager()
+
+    collisions_manager.reset_contacts([player, pickup])
+    collisions_manager.process_collisions([player, pickup])
+
+    assert player.events == [("stay", "e1")]
+    assert pickup.events == [("stay", "e0")]
@@ -0,0 +1,32 @@
+import pygame
+
+from PIL import Image
+
+from EmotionEngine.capture.EmFrameCapture import EmFrameCapture
+
+
+def test_gif_frames_durations_are_playable_centiseconds(tmp_path):
+    pygame.display.init()
+    pygame.display.set_mode((32, 32))
+
+    output_path = str(tmp_path / "capture.gif")
+    capture = EmFrameCapture(output_path, (32, 32), capture_format="gif", queue_size=60)
+    surface = pygame.Surface((32, 32))
+
+    for frame in range(60):
+        surface.fill((frame * 4, 0, 0))
+        capture.capture_frame(surface)
+
+    capture.close()
+
+    with Image.open(output_path) as gif:
+        durations = []
+
+        for frame_index in range(gif.n_frames):
+            gif.seek(frame_index)
+            durations.append(gif.info["duration"])
+
+    # One frame out of two at 60 FPS, lasting 30 or 40 ms: one second in total
+    assert len(durations) == 30
+    assert set(durations) == {30, 40}
+    assert sum(durations) == 1000
@@ -0,0 +1,54 @@
+from EmotionEngine.collisions.AABB import AABB
+from EmotionEngine.components.EmKinematicsSystem import EmKinematicsSystem
+from EmotionEngine.types.EmVector2 import EmTrackedVector2
+
+
+class MovingEntity:
+    def __init__(self, entity_id: int) -> None:
+        self.entity_id = entity_id
+        self.pos = EmTrackedVector2(50, 50)
+        self.frozen = False
+
+    def get_entity_id(self) -> int:
+        return self.entity_id
+
+    def retrieve_pos(self) -> EmTrackedVector2:
+        return self.pos
+
+    def is_frozen(self) -> bool:
+        return self.frozen
+
+    def get_bounding_box(self) -> AABB:
+        return AABB(-5, -5, 5, 5)
+
+
+def test_integrate_only_writes_the_moved_positions():
+    kinematics = EmKinematicsSystem()
+    moving, resting, frozen = [MovingEntity(entity_id) for entity_id in range(3)]
+    frozen.frozen = True
+
+    kinematics.add_entity(moving, velocity=(1, 0))
+    kinematics.add_entity(resting)
+    kinematics.add_entity(frozen, velocity=(1, 0))
+
+    moved = []
+
+    for entity in (moving, resting, frozen):
+        entity.pos.clear_dirty()
+        entity.pos.set_listener(lambda entity=entity: moved.append(entity))
+
+    # A write made outside the system is read back before integrating
+    moving.pos.y = 20
+    kinematics.integrate(10)
+
+    assert moving.pos.to_tuple() == (60, 20)
+    assert resting.pos.to_tuple() == (50, 50)
+    assert frozen.pos.to_tuple() == (50, 50)
+    assert moved == [moving]
+
+    moving.pos.clear_dirty()
+    kinematics.integrate(10)
+
+    assert moving.pos.to_tuple() == (70, 20)
+    assert moved == [moving, moving]
+    assert not resting.pos.dirty
@@ -0,0 +1,37 @@
+import io
+
+from EmotionEngine.log.EmLogsManager import EmLogsManager
+
+
+def create_logs_manager(stream: io.StringIO) -> EmLogsManager:
+    # The writer thread never wakes up: records are written by flush
+    return EmLogsManager(rate_limit=2, flush_interval_ms=3_600_000, stream=stream)
+
+
+def test_messages_are_formatted_when_logged():
+    stream = io.StringIO()
+    logs_manager = create_logs_manager(stream)
+    values = [1]
+
+    logs_manager.get_logger("test").info("values %s", values)
+    values.append(2)
+    logs_manager.close()
+
+    assert "values [1]" in stream.getvalue()
+
+
+def test_flush_reports_the_suppressed_messages():
+    stream = io.StringIO()
+    logs_manager = create_logs_manager(stream)
+    logger = logs_manager.get_logger("test")
+
+    for index in range(5):
+        logger.info("message %d", index)
+
+    logs_manager.flush()
+    logs_manager.close()
+
+    lines = stream.getvalue().splitlines()
+
+    assert len(lines) == 3
+    assert lines[-1].endswith("3 messages like 'message %d' suppressed")
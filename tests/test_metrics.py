@@ -0,0 +1,36 @@
+import socket
+
+from EmotionEngine.metrics.EmHistogram import EmHistogram
+from EmotionEngine.metrics.EmMetricsExporter import EmMetricsExporter
+
+
+def collect(counters: dict, frame_ms: float) -> dict:
+    histogram = EmHistogram()
+    histogram.observe(frame_ms)
+
+    return {
+        "time": 0.0,
+        "counters": counters,
+        "gauges": {},
+        "histograms": {"frame_ms": histogram.collect()},
+    }
+
+
+def test_failed_export_is_covered_by_the_next_one():
+    collector = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    collector.bind(("127.0.0.1", 0))
+    collector.settimeout(2)
+
+    exporter = EmMetricsExporter(f"udp://127.0.0.1:{collector.getsockname()[1]}")
+
+    # A line too long for a datagram makes the first send fail
+    exporter.submit(collect({"x" * 70000: 0, "frames": 1}, frame_ms=50))
+    exporter.submit(collect({"frames": 3}, frame_ms=10))
+    exporter.close()
+
+    lines = collector.recv(65536).decode().splitlines()
+    collector.close()
+
+    assert exporter.get_stats() == {"exported": 1, "dropped": 0, "errors": 1}
+    assert "emotion.frames:3|c" in lines
+    assert "emotion.frame_ms.max:50|g" in lines
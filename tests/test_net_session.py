@@ -0,0 +1,103 @@
+import socket
+import struct
+
+from EmotionEngine.network.EmNetSession import EmNetSession
+
+FRAMES_COUNT = 240
+
+
+class CountingEngine:
+    """
+    A deterministic simulation folding both players' inputs into a single value.
+    """
+
+    def __init__(self, inputs_manager: "ScriptedInputs") -> None:
+        self.inputs_manager = inputs_manager
+        self.frame = 0
+        self.value = 0
+
+    def get_frame_number(self) -> int:
+        return self.frame
+
+    def take_snapshot(self, position_step: float = None) -> bytes:
+        return struct.pack("<iq", self.frame, self.value)
+
+    def restore_snapshot(self, snapshot: bytes):
+        self.frame, self.value = struct.unpack("<iq", snapshot)
+
+    def simulate(self, dt: float):
+        first_input, second_input = self.inputs_manager.player_inputs
+        self.value = (self.value * 31 + first_input * 7 + second_input) % 1000003
+        self.frame += 1
+
+
+class ScriptedInputs:
+    def __init__(self, player: int) -> None:
+        self.player = player
+        self.engine: CountingEngine = None
+        self.player_inputs = [0, 0]
+
+    def capture_local_input(self) -> int:
+        frame = self.engine.frame
+
+        # Inputs change often enough to be mispredicted, then stay released
+        return (frame // (5 + self.player) + self.player) % 4 if frame < 160 else 0
+
+    def set_player_input(self, player: int, player_input: int):
+        self.player_inputs[player] = player_input
+
+
+class SilentChannels:
+    def set_muted(self, new_muted: bool):
+        pass
+
+
+def find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_desynced_peer_adopts_the_synchronized_state():
+    ports = (find_free_port(), find_free_port())
+    engines = []
+    sessions = []
+
+    for player in (0, 1):
+        inputs = ScriptedInputs(player)
+        engine = CountingEngine(inputs)
+        inputs.engine = engine
+
+        engines.append(engine)
+        sessions.append(
+            EmNetSession(
+                engine,
+                inputs,
+                SilentChannels(),
+                player,
+                ports[player],
+                ("127.0.0.1", ports[1 - player]),
+                input_delay=1,
+            )
+        )
+
+    desynced = False
+
+    try:
+        for _ in range(FRAMES_COUNT * 4):
+            for engine, session in zip(engines, sessions):
+                if engine.frame < FRAMES_COUNT:
+                    session.advance_frame(engine.simulate)
+
+            # Player 1 diverges once, as a non-deterministic simulation would
+            if not desynced and engines[1].frame == 70:
+                engines[1].value += 1
+                desynced = True
+
+    finally:
+        for session in sessions:
+            session.close()
+
+    assert sessions[1].get_stats()["desyncs"] >= 1
+    assert engines[0].frame == engines[1].frame == FRAMES_COUNT
+    assert engines[0].value == engines[1].value
@@ -0,0 +1,21 @@
+import pygame
+
+from EmotionEngine.hud.EmPerformanceHud import EmPerformanceHud
+
+
+def test_erase_restores_the_pixels_under_the_overlay():
+    pygame.display.init()
+    surface = pygame.display.set_mode((320, 240))
+    surface.fill((10, 20, 30))
+    surface.fill((200, 100, 50), (0, 0, 40, 40))
+    before = pygame.image.tostring(surface, "RGB")
+
+    hud = EmPerformanceHud()
+    hud.set_visible(True)
+    hud.draw(surface, [])
+
+    assert pygame.image.tostring(surface, "RGB") != before
+
+    hud.erase(surface)
+
+    assert pygame.image.tostring(surface, "RGB") == before
@@ -0,0 +1,35 @@
+import pygame
+
+from EmotionEngine.replay.EmReplayPlayer import EmReplayPlayer
+from EmotionEngine.replay.EmReplayRecorder import EmReplayRecorder
+
+
+def test_replay_round_trips_fractional_and_long_frames(tmp_path):
+    replay_path = str(tmp_path / "session.emrp")
+    frames = [
+        (1000 / 60, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)]),
+        (16.5, []),
+        (70000.25, [pygame.event.Event(pygame.KEYUP, key=pygame.K_UP)]),
+    ]
+
+    recorder = EmReplayRecorder(replay_path, seed=42)
+
+    for dt, events in frames:
+        recorder.record_frame(dt, events)
+
+    recorder.close()
+
+    player = EmReplayPlayer(replay_path)
+    played_frames = []
+
+    frame = player.next_frame()
+
+    while frame is not None:
+        dt, events = frame
+        played_frames.append((dt, [(event.type, event.key) for event in events]))
+        frame = player.next_frame()
+
+    assert player.get_seed() == 42
+    assert played_frames == [
+        (dt, [(event.type, event.key) for event in events]) for dt, events in frames
+    ]
@@ -0,0 +1,36 @@
+import pytest
+
+from EmotionEngine.entity.EmEntitiesManager import EmEntitiesManager
+from EmotionEngine.entity.EmEntity import EmEntity
+from EmotionEngine.types.EmVector2 import EmVector2
+
+
+class ScoredEntity(EmEntity):
+    SNAPSHOT_FIELDS = (("score", "i"),)
+
+    def __init__(self, entity_id: int) -> None:
+        super().__init__({})
+        self.score = 0
+
+        self.set_entity_id(entity_id)
+        self.set_entity_name(f"e{entity_id}")
+
+
+def test_restore_snapshot_leaves_the_world_untouched_if_an_entity_is_missing():
+    first = ScoredEntity(0)
+    second = ScoredEntity(1)
+    entities_manager = EmEntitiesManager()
+    entities_manager.append(first)
+    entities_manager.append(second)
+
+    snapshot = entities_manager.take_snapshot()
+
+    first.score = 3
+    first.set_pos(EmVector2(10, 20))
+    entities_manager.remove(second)
+
+    with pytest.raises(ValueError):
+        entities_manager.restore_snapshot(snapshot)
+
+    assert first.score == 3
+    assert first.retrieve_pos().to_tuple() == (10, 20)
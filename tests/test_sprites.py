@@ -0,0 +1,46 @@
+import pygame
+
+from EmotionEngine.components.EmComponents import EmSprite
+from EmotionEngine.components.systems import sprite_system
+from EmotionEngine.entity.EmEntity import EmEntity
+from EmotionEngine.image.EmTextureAtlas import EmTextureAtlas
+from EmotionEngine.types.EmVector2 import EmVector2
+
+RED = (255, 0, 0, 255)
+BLACK = (0, 0, 0, 255)
+
+
+def create_image() -> pygame.Surface:
+    image = pygame.Surface((4, 4))
+    image.fill(RED)
+
+    return image
+
+
+def test_sprite_system_draws_through_the_camera():
+    surface = pygame.Surface((64, 64))
+    entity = EmEntity({})
+    entity.set_pos(EmVector2(30, 20))
+
+    sprite_system(surface, [entity], [EmSprite(create_image())], (20, 10), 2.0)
+
+    # World (30, 20) is drawn at ((30 - 20) * 2, (20 - 10) * 2), 8 pixels wide
+    assert surface.get_at((20, 20)) == RED
+    assert surface.get_at((27, 27)) == RED
+    assert surface.get_at((28, 28)) == BLACK
+    assert surface.get_at((19, 19)) == BLACK
+
+
+def test_atlas_draws_sprites_through_the_camera():
+    atlas = EmTextureAtlas.pack({"box": create_image()})
+
+    for zoom in (1.0, 2.0):
+        surface = pygame.Surface((64, 64))
+        atlas.draw_sprites(surface, [("box", (30, 20))], (20, 10), zoom)
+
+        size = round(4 * zoom)
+        left, top = (30 - 20) * zoom, (20 - 10) * zoom
+
+        assert surface.get_at((int(left), int(top))) == RED
+        assert surface.get_at((int(left) + size - 1, int(top) + size - 1)) == RED
+        assert surface.get_at((int(left) + size, int(top) + size)) == BLACK
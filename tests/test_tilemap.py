@@ -0,0 +1,35 @@
+import array
+
+import pygame
+
+from EmotionEngine.tilemap.EmTilemap import EmTilemap
+
+
+def create_tilemap() -> EmTilemap:
+    tile = pygame.Surface((4, 4))
+    tile.fill((0, 255, 0))
+
+    return EmTilemap(
+        name="World",
+        tiles_surfaces=[tile],
+        tile_size=4,
+        columns=2,
+        rows=2,
+        layers={"ground": array.array("H", [0, 0, 0, 0])},
+    )
+
+
+def test_draw_only_shows_the_captured_tile_changes():
+    tilemap = create_tilemap()
+    surface = pygame.Surface((8, 8))
+    tilemap.draw(surface, changes=[])
+
+    tilemap.set_tile("ground", 1, 1, 1)
+    tilemap.draw(surface, changes=[])
+
+    assert surface.get_at((5, 5)) == (0, 0, 0, 255)
+
+    tilemap.draw(surface, changes=tilemap.capture_changes())
+
+    assert surface.get_at((5, 5)) == (0, 255, 0, 255)
+    assert tilemap.capture_changes() == []
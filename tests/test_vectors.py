@@ -0,0 +1,24 @@
+from EmotionEngine.types.EmVector2 import EmTrackedVector2, EmVector2
+
+
+def test_tracked_vector_notifies_once_per_clear():
+    notifications = []
+    vector = EmTrackedVector2(0, 0)
+    vector.set_listener(lambda: notifications.append(vector.to_tuple()))
+
+    vector.x = 1
+    vector.clear_dirty()
+    vector.x = 2
+    vector.y = 3
+    vector.clear_dirty()
+    vector.set_xy(4, 5)
+
+    assert notifications == [(2, 0), (4, 5)]
+    assert vector.dirty
+
+
+def test_tracked_vector_equals_vector_of_same_components():
+    assert EmTrackedVector2(1, 2) == EmVector2(1, 2)
+    assert EmVector2(1, 2) == EmTrackedVector2(1, 2)
+    assert EmTrackedVector2(1, 2) != EmVector2(2, 1)
+    assert EmVector2(1, 2) != (1, 2)